@@ -0,0 +1,132 @@
+"""
+Prueba de carga contra un servidor de SIGAP en ejecución.
+
+Cada usuario virtual repite peticiones elegidas de un escenario ponderado
+hasta que termina el tiempo; el orden sale de una semilla, así que dos
+corridas con los mismos datos piden las mismas URL. Al final se reportan
+p50/p99 y peticiones por segundo por tipo de petición. El escenario lo arma
+el comando `prueba_carga`; este módulo solo usa httpx. Las peticiones con
+`cuerpo` se envían por POST con el JSON que regresa `cuerpo(azar)`.
+"""
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Peticion:
+    """Un tipo de petición del escenario: peso relativo y rutas posibles."""
+    nombre: str
+    peso: int
+    rutas: list
+    encabezados: dict = field(default_factory=dict)
+    cuerpo: object = None
+
+
+@dataclass
+class Medicion:
+    tiempos: list = field(default_factory=list)
+    errores: int = 0
+
+    def percentil(self, p):
+        if not self.tiempos:
+            return 0.0
+        ordenados = sorted(self.tiempos)
+        return ordenados[max(math.ceil(p / 100 * len(ordenados)) - 1, 0)]
+
+
+@dataclass
+class ResultadoCarga:
+    mediciones: dict = field(default_factory=dict)
+    segundos: float = 0.0
+
+    def filas(self):
+        """(nombre, peticiones, errores, p50 ms, p99 ms, peticiones/s), con una fila TOTAL al final."""
+        total = Medicion()
+        filas = []
+        for nombre, medicion in sorted(self.mediciones.items()):
+            total.tiempos += medicion.tiempos
+            total.errores += medicion.errores
+            filas.append(self._fila(nombre, medicion))
+        filas.append(self._fila('TOTAL', total))
+        return filas
+
+    def _fila(self, nombre, medicion):
+        return (
+            nombre,
+            len(medicion.tiempos),
+            medicion.errores,
+            medicion.percentil(50) * 1000,
+            medicion.percentil(99) * 1000,
+            len(medicion.tiempos) / self.segundos if self.segundos else 0.0,
+        )
+
+
+async def iniciar_sesion(cliente, usuario, contrasena):
+    """Inicia sesión en el admin; las cookies quedan en el cliente."""
+    respuesta = await cliente.get('/admin/login/')
+    respuesta = await cliente.post(
+        '/admin/login/?next=/admin/',
+        data={
+            'username': usuario,
+            'password': contrasena,
+            'csrfmiddlewaretoken': cliente.cookies.get('csrftoken', ''),
+            'next': '/admin/',
+        },
+        headers={'Referer': str(respuesta.url)},
+    )
+    if respuesta.status_code != 302:
+        raise ValueError("No se pudo iniciar sesión en el admin (usuario o contraseña incorrectos).")
+
+
+async def _usuario_virtual(cliente, escenario, pesos, semilla, fin, resultado):
+    azar = random.Random(semilla)
+    while time.perf_counter() < fin:
+        peticion = azar.choices(escenario, pesos)[0]
+        ruta = azar.choice(peticion.rutas)
+        medicion = resultado.mediciones.setdefault(peticion.nombre, Medicion())
+        inicio = time.perf_counter()
+        try:
+            if peticion.cuerpo:
+                respuesta = await cliente.post(ruta, json=peticion.cuerpo(azar), headers=peticion.encabezados)
+            else:
+                respuesta = await cliente.get(ruta, headers=peticion.encabezados)
+            if respuesta.status_code >= 400:
+                medicion.errores += 1
+        except Exception:
+            medicion.errores += 1
+        medicion.tiempos.append(time.perf_counter() - inicio)
+
+
+async def ejecutar_carga(url_base, escenario, usuarios=20, duracion=30.0, semilla=1,
+                         credenciales=None, tiempo_limite=30.0):
+    """
+    Corre el escenario con `usuarios` concurrentes durante `duracion`
+    segundos. `credenciales` es (usuario, contraseña) del admin, si el
+    escenario incluye páginas del admin. Regresa ResultadoCarga.
+    """
+    import httpx
+
+    resultado = ResultadoCarga()
+    pesos = [peticion.peso for peticion in escenario]
+    async with httpx.AsyncClient(
+        base_url=url_base,
+        timeout=tiempo_limite,
+        limits=httpx.Limits(max_connections=usuarios, max_keepalive_connections=usuarios),
+    ) as cliente:
+        try:
+            await cliente.get('/salud/')
+            if credenciales:
+                await iniciar_sesion(cliente, *credenciales)
+        except httpx.HTTPError as e:
+            raise ValueError(f"No se pudo conectar con {url_base}: {type(e).__name__} {e}")
+        inicio = time.perf_counter()
+        fin = inicio + duracion
+        await asyncio.gather(*(
+            _usuario_virtual(cliente, escenario, pesos, semilla + numero, fin, resultado)
+            for numero in range(usuarios)
+        ))
+        resultado.segundos = time.perf_counter() - inicio
+    return resultado
@@ -0,0 +1,61 @@
+"""
+Campos de texto que se guardan siempre en MAYÚSCULAS.
+
+La conversión ocurre en `pre_save` y en `get_prep_value`, así que aplica
+igual en save(), bulk_create(), bulk_update() y QuerySet.update(), y también
+en las búsquedas exactas (`filter(dictamen='pendiente')`).
+"""
+from django.db import models
+from django.db.models.functions import Upper
+
+
+class MayusculasMixin:
+    def pre_save(self, model_instance, add):
+        valor = super().pre_save(model_instance, add)
+        if isinstance(valor, str) and valor != valor.upper():
+            valor = valor.upper()
+            setattr(model_instance, self.attname, valor)
+        return valor
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, str):
+            return value.upper()
+        return value
+
+
+class MayusculasCharField(MayusculasMixin, models.CharField):
+    pass
+
+
+class MayusculasTextField(MayusculasMixin, models.TextField):
+    pass
+
+
+class MayusculasEmailField(MayusculasMixin, models.EmailField):
+    pass
+
+
+def mayusculas_por_lotes(modelo, campos, lote=5000):
+    """
+    Convierte a mayúsculas los `campos` de las filas existentes, recorriendo
+    la tabla por llave primaria en lotes cortos. Pensado para migraciones de
+    datos; solo reescribe las filas que cambian.
+    """
+    pendientes = models.Q()
+    for campo in campos:
+        pendientes |= ~models.Q(**{campo: Upper(campo)})
+
+    pk = modelo._meta.pk.name
+    ultimo = None
+    while True:
+        filas = modelo._default_manager.order_by(pk)
+        if ultimo is not None:
+            filas = filas.filter(**{f'{pk}__gt': ultimo})
+        llaves = list(filas.values_list(pk, flat=True)[:lote])
+        if not llaves:
+            break
+        modelo._default_manager.filter(**{f'{pk}__in': llaves}).filter(pendientes).update(
+            **{campo: Upper(campo) for campo in campos}
+        )
+        ultimo = llaves[-1]
@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # ==============================
 # BASE
 # ==============================
@@ -9,11 +11,19 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # ==============================
 # SECURITY
 # ==============================
-SECRET_KEY = 'django-insecure-sigap-secret-key'
+DEBUG = os.getenv('DJANGO_DEBUG', 'True') == 'True'
+
+# La llave de desarrollo solo se acepta con DEBUG; en producción debe venir del entorno
+SECRET_KEY = os.getenv('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    if not DEBUG:
+        raise ImproperlyConfigured("DJANGO_SECRET_KEY es obligatoria cuando DJANGO_DEBUG=False.")
+    SECRET_KEY = 'django-insecure-sigap-secret-key'
 
-DEBUG = True
+ALLOWED_HOSTS = os.getenv('DJANGO_ALLOWED_HOSTS', '*').split(',')
 
-ALLOWED_HOSTS = ['*']
+# Orígenes aceptados por CSRF detrás de un proxy HTTPS, separados por comas
+CSRF_TRUSTED_ORIGINS = [origen for origen in os.getenv('DJANGO_CSRF_TRUSTED_ORIGINS', '').split(',') if origen]
 
 # ==============================
 # APPLICATIONS
@@ -26,12 +36,17 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Apps SIGAP
     'people',
     'projects',
     'evaluation',
     'registration',
+    'notifications',
+    'reports',
+    'monitoring',
+    'archive',
 ]
 
 # ==============================
@@ -39,6 +54,10 @@ INSTALLED_APPS = [
 # ==============================
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Archivos estáticos desde el mismo proceso (comprimidos y con caché larga)
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Perfilado SQL de una muestra de peticiones; inactivo si PERFILADO_SQL_MUESTRA es 0
+    'monitoring.middleware.PerfiladoSQLMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -69,6 +88,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'SIGAP.wsgi.application'
+ASGI_APPLICATION = 'SIGAP.asgi.application'
 
 # ==============================
 # DATABASE (PostgreSQL - Docker)
@@ -81,9 +101,28 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
         'PORT': os.getenv('DB_PORT'),
+        # Verifica la conexión reutilizada (o tomada del pool) antes de usarla
+        'CONN_HEALTH_CHECKS': True,
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
     }
 }
 
+# Pool de conexiones de psycopg (uno por proceso del servidor). Con DB_POOL_MAX
+# mayor que 0 sustituye a CONN_MAX_AGE, que debe quedar en 0; es el modo
+# recomendado con ASGI, donde las conexiones persistentes no se reutilizan.
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', '0'))
+if DB_POOL_MAX:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN', '2')),
+            'max_size': DB_POOL_MAX,
+            # Segundos que una petición espera una conexión libre antes de fallar
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+        },
+    }
+
 # ==============================
 # PASSWORD VALIDATION
 # ==============================
@@ -119,6 +158,58 @@ STATIC_URL = 'static/'
 
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# En producción (DEBUG=False) los nombres llevan hash y se sirven comprimidos;
+# requiere `collectstatic`, que corre al construir la imagen
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'SIGAP.storage.EstaticosComprimidos'
+        ),
+    },
+}
+
+# ==============================
+# DICTÁMENES (PDF generados por projects.dictamenes)
+# ==============================
+DICTAMENES_ROOT = Path(os.getenv('DICTAMENES_ROOT', BASE_DIR / 'dictamenes'))
+
+# URL pública de DICTAMENES_ROOT; si se define, se guarda en protocolo_dictamen_url
+DICTAMENES_URL = os.getenv('DICTAMENES_URL', '')
+
+# Procesos para generar los PDF (vacío: uno por CPU)
+DICTAMENES_PROCESOS = int(os.getenv('DICTAMENES_PROCESOS', '0')) or None
+
+# ==============================
+# VERIFICACIÓN DE ENLACES (projects.enlaces)
+# ==============================
+# Horas que un resultado sigue vigente antes de volver a revisar la URL
+ENLACES_TTL_HORAS = int(os.getenv('ENLACES_TTL_HORAS', '24'))
+# URL que revisa la acción del admin por petición (el resto: manage.py verificar_enlaces)
+ENLACES_MAXIMO_ADMIN = int(os.getenv('ENLACES_MAXIMO_ADMIN', '100'))
+
+# ==============================
+# AUTOCOMPLETADO DE PERSONAS (people.autocompletado)
+# ==============================
+# Segundos que se guarda cada página de resultados (0 desactiva la caché)
+AUTOCOMPLETADO_CACHE_SEGUNDOS = int(os.getenv('AUTOCOMPLETADO_CACHE_SEGUNDOS', '60'))
+
+# ==============================
+# PORTAL DE REGISTRO (registration.registro)
+# ==============================
+# Calendario en que se registran los proyectos nuevos (vacío: registro cerrado)
+REGISTRO_CALENDARIO = os.getenv('REGISTRO_CALENDARIO', '').upper()
+REGISTRO_MAXIMO_PARTICIPANTES = int(os.getenv('REGISTRO_MAXIMO_PARTICIPANTES', '5'))
+# Envíos nuevos permitidos por representante verificado en la ventana (segundos)
+REGISTRO_LIMITE = int(os.getenv('REGISTRO_LIMITE', '5'))
+REGISTRO_VENTANA_SEGUNDOS = int(os.getenv('REGISTRO_VENTANA_SEGUNDOS', '600'))
+# Códigos o correos que no coinciden con el padrón, por IP, en la misma ventana
+REGISTRO_FALLIDOS_LIMITE = int(os.getenv('REGISTRO_FALLIDOS_LIMITE', '30'))
+# Vigencia del catálogo en caché y frecuencia máxima del recálculo de estadísticas
+REGISTRO_CATALOGO_SEGUNDOS = int(os.getenv('REGISTRO_CATALOGO_SEGUNDOS', '300'))
+REGISTRO_RECALCULO_SEGUNDOS = int(os.getenv('REGISTRO_RECALCULO_SEGUNDOS', '30'))
+
 # ==============================
 # DEFAULT PK
 # ==============================
@@ -130,8 +221,27 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 EMAIL_BACKEND = os.getenv('EMAIL_BACKEND')
 EMAIL_HOST = os.getenv('EMAIL_HOST')
-EMAIL_PORT = int(os.getenv('EMAIL_PORT'))
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
 EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS') == 'True'
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL')
+
+# Bandeja de salida (notifications): tamaño de lote, reintentos y espera base en segundos
+CORREO_LOTE = int(os.getenv('CORREO_LOTE', '100'))
+CORREO_MAX_INTENTOS = int(os.getenv('CORREO_MAX_INTENTOS', '5'))
+CORREO_ESPERA_BASE = int(os.getenv('CORREO_ESPERA_BASE', '60'))
+# Segundos que un proceso tiene reservado un lote antes de que otro pueda tomarlo;
+# debe alcanzar para enviar CORREO_LOTE correos
+CORREO_RESERVA = int(os.getenv('CORREO_RESERVA', '600'))
+
+# API de solo lectura (projects.views): tokens aceptados en "Authorization: Bearer <token>",
+# separados por comas
+API_TOKENS = [token.strip() for token in os.getenv('API_TOKENS', '').split(',') if token.strip()]
+
+# Perfilado SQL (monitoring.middleware): fracción de peticiones perfiladas (0 = apagado,
+# 1 = todas), umbral de consulta lenta, repeticiones que cuentan como N+1 y registros conservados
+PERFILADO_SQL_MUESTRA = float(os.getenv('PERFILADO_SQL_MUESTRA', '0'))
+PERFILADO_SQL_LENTA_MS = int(os.getenv('PERFILADO_SQL_LENTA_MS', '200'))
+PERFILADO_SQL_REPETIDAS = int(os.getenv('PERFILADO_SQL_REPETIDAS', '5'))
+PERFILADO_SQL_MAXIMO = int(os.getenv('PERFILADO_SQL_MAXIMO', '1000'))
@@ -0,0 +1,10 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class EstaticosComprimidos(CompressedManifestStaticFilesStorage):
+    """
+    Estáticos con hash y comprimidos para WhiteNoise. jazzmin pide con
+    {% static %} la carpeta 'vendor/bootswatch', que no está en el manifiesto;
+    sin manifest_strict esas rutas se sirven con su nombre original.
+    """
+    manifest_strict = False
@@ -15,8 +15,15 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
+
+from .views import salud
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # API de solo lectura para los sistemas institucionales
+    path('api/', include('projects.urls')),
+    # Portal de registro de proyectos para los alumnos
+    path('registro/', include('registration.urls')),
+    path('salud/', salud, name='salud'),
 ]
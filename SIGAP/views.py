@@ -0,0 +1,19 @@
+"""
+Verificación de salud para el balanceador y el healthcheck del contenedor.
+"""
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+
+@never_cache
+@require_GET
+def salud(request):
+    """200 si el proceso responde y PostgreSQL acepta consultas; 503 si no."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except DatabaseError as e:
+        return JsonResponse({'estado': 'error', 'base_de_datos': str(e)}, status=503)
+    return JsonResponse({'estado': 'ok'})
@@ -0,0 +1,69 @@
+from django.contrib import admin
+
+from projects.busqueda import buscar_proyectos
+from .models import (
+    CalendarioArchivado, EvaluacionArchivada, ParticipacionArchivada, ProrrogaArchivada,
+    ProyectoArchivado,
+)
+
+
+class SoloLecturaMixin:
+    """El archivo solo se modifica con `archivar_calendario` / `restaurar_calendario`."""
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+# --- Inlines del proyecto archivado ---
+
+class ParticipacionArchivadaInline(SoloLecturaMixin, admin.TabularInline):
+    model = ParticipacionArchivada
+    fields = ('alumno', 'es_representante')
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('alumno')
+
+
+class ProrrogaArchivadaInline(SoloLecturaMixin, admin.TabularInline):
+    model = ProrrogaArchivada
+    fields = ('justificacion', 'calendario_presentacion')
+    readonly_fields = fields
+
+
+class EvaluacionArchivadaInline(SoloLecturaMixin, admin.TabularInline):
+    model = EvaluacionArchivada
+    fields = ('fecha_evaluacion', 'evaluador', 'tipo_revision', 'resolutivo', 'observaciones')
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('evaluador')
+
+
+@admin.register(ProyectoArchivado)
+class ProyectoArchivadoAdmin(SoloLecturaMixin, admin.ModelAdmin):
+    """
+    Consulta de los proyectos de calendarios archivados, con la misma
+    búsqueda que el admin de proyectos.
+    """
+    list_display = ('folio', 'titulo', 'asesor', 'evaluador', 'modalidad', 'calendario_registro', 'dictamen')
+    list_select_related = ('asesor', 'evaluador')
+    list_filter = ('calendario_registro', 'modalidad', 'dictamen', 'ultimo_resolutivo')
+    search_fields = ('folio', 'titulo')
+    exclude = ('documento_busqueda',)
+    inlines = [ParticipacionArchivadaInline, ProrrogaArchivadaInline, EvaluacionArchivadaInline]
+
+    def get_search_results(self, request, queryset, search_term):
+        return buscar_proyectos(queryset, search_term), False
+
+
+@admin.register(CalendarioArchivado)
+class CalendarioArchivadoAdmin(SoloLecturaMixin, admin.ModelAdmin):
+    list_display = ('calendario', 'estado', 'proyectos', 'fecha_archivo', 'actualizado')
+    list_filter = ('estado',)
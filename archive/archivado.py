@@ -0,0 +1,155 @@
+"""
+Archivo y restauración de calendarios cerrados.
+
+Las filas de Proyecto, Participacion, Prorroga y Evaluaciones de un
+calendario se mueven a las tablas de archive.models por lotes de proyectos.
+Cada lote es una transacción corta: bloquea solo sus proyectos, copia las
+filas con INSERT ... SELECT (sin pasar por Python, conservando ids y
+fechas) y las borra del origen con DELETE directos, sin señales por fila.
+Si el proceso se interrumpe, lo ya movido queda completo y basta con
+volver a ejecutarlo.
+
+Las estadísticas de reports se calculan una vez antes de archivar y se
+conservan tal cual mientras el calendario está archivado.
+"""
+import time
+
+from django.db import OperationalError, connection, transaction
+from django.db.models import F
+from django.db.models.functions import Now
+
+from evaluation.models import Evaluaciones
+from projects.models import Participacion, Prorroga, Proyecto
+from projects.signals import proyectos_modificados
+from reports.resumen import recalcular_calendarios
+from .models import (
+    CalendarioArchivado, EvaluacionArchivada, ParticipacionArchivada, ProrrogaArchivada,
+    ProyectoArchivado,
+)
+
+LOTE = 200
+# Un lote no espera más que esto por un bloqueo; se reintenta después
+TIEMPO_BLOQUEO = '5s'
+REINTENTOS = 5
+
+# (tabla activa, tabla de archivo, campo con el folio); primero los padres
+TABLAS = [
+    (Proyecto, ProyectoArchivado, 'folio'),
+    (Participacion, ParticipacionArchivada, 'proyecto'),
+    (Prorroga, ProrrogaArchivada, 'proyecto'),
+    (Evaluaciones, EvaluacionArchivada, 'proyecto'),
+]
+
+
+# ====================================================================
+# Movimiento de un lote
+# ====================================================================
+
+def _copiar(origen, destino, columnas, campo, folios):
+    nombre = connection.ops.quote_name
+    lista = ', '.join(nombre(columna) for columna in columnas)
+    columna_folio = nombre(origen._meta.get_field(campo).column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {nombre(destino._meta.db_table)} ({lista}) "
+            f"SELECT {lista} FROM {nombre(origen._meta.db_table)} WHERE {columna_folio} = ANY(%s)",
+            [folios],
+        )
+
+
+def _mover(folios, al_archivo):
+    """Copia los proyectos `folios` y sus relaciones al otro lado y los borra del origen."""
+    for activa, archivo, campo in TABLAS:
+        # Las columnas de la tabla activa: el archivo las tiene todas
+        columnas = [f.column for f in activa._meta.concrete_fields]
+        origen, destino = (activa, archivo) if al_archivo else (archivo, activa)
+        _copiar(origen, destino, columnas, campo, folios)
+    for activa, archivo, campo in reversed(TABLAS):
+        origen = activa if al_archivo else archivo
+        origen.objects.filter(**{f'{campo}__in': folios})._raw_delete(origen.objects.db)
+
+
+def _lotes(modelo, calendario, lote, al_archivo, al_avanzar):
+    """Mueve los proyectos de `calendario` en `modelo` por lotes; regresa cuántos movió."""
+    movidos = 0
+    intentos = 0
+    while True:
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(f"SET LOCAL lock_timeout = '{TIEMPO_BLOQUEO}'")
+                folios = list(
+                    modelo.objects.filter(calendario_registro=calendario)
+                    .order_by('folio').select_for_update()
+                    .values_list('folio', flat=True)[:lote]
+                )
+                if not folios:
+                    return movidos
+                _mover(folios, al_archivo)
+                cambio = len(folios) if al_archivo else -len(folios)
+                CalendarioArchivado.objects.filter(pk=calendario).update(
+                    proyectos=F('proyectos') + cambio, actualizado=Now(),
+                )
+                if not al_archivo:
+                    proyectos_modificados(Proyecto.objects.filter(pk__in=folios))
+        except OperationalError:
+            # Otro proceso tiene bloqueado algún proyecto del lote
+            intentos += 1
+            if intentos > REINTENTOS:
+                raise
+            time.sleep(intentos)
+            continue
+        intentos = 0
+        movidos += len(folios)
+        if al_avanzar:
+            al_avanzar(movidos)
+
+
+# ====================================================================
+# Archivo y restauración
+# ====================================================================
+
+def archivar_calendario(calendario, lote=LOTE, al_avanzar=None):
+    """
+    Mueve el calendario al archivo. `al_avanzar(movidos)` se llama después
+    de cada lote. Regresa el número de proyectos movidos en esta ejecución.
+    """
+    calendario = calendario.upper()
+    registro = CalendarioArchivado.objects.filter(pk=calendario).first()
+    if registro and registro.estado == CalendarioArchivado.RESTAURANDO:
+        raise ValueError(f"El calendario {calendario} se está restaurando; termine la restauración primero.")
+    if registro is None:
+        if not Proyecto.objects.filter(calendario_registro=calendario).exists():
+            raise ValueError(f"No hay proyectos del calendario {calendario}.")
+        # Con el calendario completo: después ya no se recalcula
+        recalcular_calendarios([calendario])
+        registro = CalendarioArchivado.objects.create(calendario=calendario)
+    elif registro.estado != CalendarioArchivado.ARCHIVANDO:
+        registro.estado = CalendarioArchivado.ARCHIVANDO
+        registro.save(update_fields=['estado', 'actualizado'])
+
+    movidos = _lotes(Proyecto, calendario, lote, True, al_avanzar)
+
+    registro.refresh_from_db()
+    registro.estado = CalendarioArchivado.ARCHIVADO
+    registro.save(update_fields=['estado', 'actualizado'])
+    return movidos
+
+
+def restaurar_calendario(calendario, lote=LOTE, al_avanzar=None):
+    """
+    Regresa el calendario a las tablas activas, por lotes, y recalcula sus
+    estadísticas al final. Regresa el número de proyectos restaurados.
+    """
+    calendario = calendario.upper()
+    registro = CalendarioArchivado.objects.filter(pk=calendario).first()
+    if registro is None:
+        raise ValueError(f"El calendario {calendario} no está archivado.")
+    registro.estado = CalendarioArchivado.RESTAURANDO
+    registro.save(update_fields=['estado', 'actualizado'])
+
+    movidos = _lotes(ProyectoArchivado, calendario, lote, False, al_avanzar)
+
+    registro.delete()
+    recalcular_calendarios([calendario])
+    return movidos
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.archivado import LOTE, archivar_calendario
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Mueve un calendario cerrado (proyectos, participaciones, prórrogas y evaluaciones) "
+        "a las tablas de archivo, por lotes. Se puede interrumpir y volver a ejecutar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('calendario', help="Calendario a archivar (p. ej. 2019A).")
+        parser.add_argument('--lote', type=int, default=LOTE, help="Proyectos por transacción.")
+        parser.add_argument('--forzar', action='store_true',
+                            help="Archiva aunque haya proyectos con dictamen PENDIENTE.")
+
+    def handle(self, *args, **options):
+        calendario = options['calendario'].upper()
+        pendientes = Proyecto.objects.filter(calendario_registro=calendario, dictamen='PENDIENTE').count()
+        if pendientes and not options['forzar']:
+            raise CommandError(
+                f"El calendario {calendario} tiene {pendientes} proyectos con dictamen PENDIENTE; "
+                "use --forzar para archivarlo de todos modos."
+            )
+
+        inicio = time.perf_counter()
+        try:
+            movidos = archivar_calendario(
+                calendario, lote=options['lote'],
+                al_avanzar=lambda total: self.stdout.write(f"  {total} proyectos archivados"),
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(
+            f"Calendario {calendario} archivado ({movidos} proyectos) en {time.perf_counter() - inicio:.1f} s."
+        ))
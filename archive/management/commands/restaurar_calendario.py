@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.archivado import LOTE, restaurar_calendario
+
+
+class Command(BaseCommand):
+    help = (
+        "Regresa un calendario archivado a las tablas activas, por lotes, y recalcula sus "
+        "estadísticas. Se puede interrumpir y volver a ejecutar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('calendario', help="Calendario a restaurar (p. ej. 2019A).")
+        parser.add_argument('--lote', type=int, default=LOTE, help="Proyectos por transacción.")
+
+    def handle(self, *args, **options):
+        calendario = options['calendario'].upper()
+        inicio = time.perf_counter()
+        try:
+            movidos = restaurar_calendario(
+                calendario, lote=options['lote'],
+                al_avanzar=lambda total: self.stdout.write(f"  {total} proyectos restaurados"),
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(
+            f"Calendario {calendario} restaurado ({movidos} proyectos) en {time.perf_counter() - inicio:.1f} s."
+        ))
@@ -0,0 +1,116 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:04
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('people', '0003_campos_mayusculas'),
+        ('projects', '0007_verificacion_enlace'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarioArchivado',
+            fields=[
+                ('calendario', models.CharField(max_length=10, primary_key=True, serialize=False, verbose_name='CALENDARIO')),
+                ('estado', models.CharField(choices=[('ARCHIVANDO', 'ARCHIVANDO'), ('ARCHIVADO', 'ARCHIVADO'), ('RESTAURANDO', 'RESTAURANDO')], default='ARCHIVANDO', max_length=15, verbose_name='ESTADO')),
+                ('proyectos', models.PositiveIntegerField(default=0, verbose_name='PROYECTOS ARCHIVADOS')),
+                ('fecha_archivo', models.DateTimeField(auto_now_add=True, verbose_name='FECHA DE ARCHIVO')),
+                ('actualizado', models.DateTimeField(auto_now=True, verbose_name='ÚLTIMO CAMBIO')),
+            ],
+            options={
+                'verbose_name': 'Calendario archivado',
+                'verbose_name_plural': 'Calendarios archivados',
+                'ordering': ['-calendario'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProyectoArchivado',
+            fields=[
+                ('folio', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='FOLIO DE PROYECTO')),
+                ('titulo', models.CharField(max_length=255, verbose_name='TÍTULO DEL PROYECTO')),
+                ('modalidad', models.CharField(choices=[('TRABAJO DE INVESTIGACION', 'TRABAJO DE INVESTIGACION'), ('MATERIALES EDUCATIVOS', 'MATERIALES EDUCATIVOS'), ('PROTOTIPO', 'PROTOTIPO'), ('REPORTE', 'REPORTE'), ('VINCULACION SOCIAL', 'VINCULACION SOCIAL')], max_length=50, verbose_name='MODALIDAD')),
+                ('variante', models.CharField(blank=True, max_length=50, null=True, verbose_name='VARIANTE DE MODALIDAD')),
+                ('nivel_competencia', models.CharField(blank=True, max_length=30, null=True, verbose_name='MÓDULOS REGISTRADOS')),
+                ('dictamen', models.CharField(max_length=50, verbose_name='DICTAMEN FINAL')),
+                ('calendario_registro', models.CharField(max_length=10, verbose_name='CALENDARIO')),
+                ('evidencia_url', models.URLField(blank=True, max_length=500, null=True, verbose_name='URL EVIDENCIA PRINCIPAL')),
+                ('protocolo_dictamen_url', models.URLField(blank=True, max_length=500, null=True, verbose_name='URL PROTOCOLO DICTAMINADO')),
+                ('ultima_revision', models.CharField(blank=True, max_length=10, null=True, verbose_name='ÚLTIMA REVISIÓN')),
+                ('ultimo_resolutivo', models.CharField(blank=True, max_length=20, null=True, verbose_name='ÚLTIMO RESOLUTIVO')),
+                ('fecha_ultima_evaluacion', models.DateTimeField(blank=True, null=True, verbose_name='FECHA DE ÚLTIMA EVALUACIÓN')),
+                ('total_evaluaciones', models.PositiveIntegerField(default=0, verbose_name='NÚMERO DE REVISIONES')),
+                ('documento_busqueda', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('actualizado', models.DateTimeField(verbose_name='ÚLTIMA MODIFICACIÓN')),
+                ('asesor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='proyectos_archivados', to='people.asesor', verbose_name='ASESOR ASIGNADO')),
+                ('evaluador', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='proyectos_archivados', to='people.evaluador', verbose_name='EVALUADOR ASIGNADO')),
+                ('formato1', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='proyecto_archivado', to='projects.formato1', verbose_name='DATOS FORMATO 1')),
+            ],
+            options={
+                'verbose_name': 'Proyecto archivado',
+                'verbose_name_plural': 'Proyectos archivados',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProrrogaArchivada',
+            fields=[
+                ('id_prorroga', models.IntegerField(primary_key=True, serialize=False, verbose_name='ID DE PRÓRROGA')),
+                ('justificacion', models.TextField(verbose_name='JUSTIFICACIÓN DE PRÓRROGA')),
+                ('calendario_presentacion', models.CharField(max_length=10, verbose_name='CALENDARIO PARA PRESENTACIÓN')),
+                ('proyecto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='prorrogas', to='archive.proyectoarchivado')),
+            ],
+            options={
+                'verbose_name': 'Prórroga archivada',
+                'verbose_name_plural': 'Prórrogas archivadas',
+            },
+        ),
+        migrations.CreateModel(
+            name='ParticipacionArchivada',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('es_representante', models.BooleanField(default=False, verbose_name='ES REPRESENTANTE')),
+                ('alumno', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participaciones_archivadas', to='people.alumno')),
+                ('proyecto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participaciones', to='archive.proyectoarchivado')),
+            ],
+            options={
+                'verbose_name': 'Participación archivada',
+                'verbose_name_plural': 'Participaciones archivadas',
+            },
+        ),
+        migrations.CreateModel(
+            name='EvaluacionArchivada',
+            fields=[
+                ('id_evaluacion', models.IntegerField(primary_key=True, serialize=False, verbose_name='ID DE EVALUACIÓN')),
+                ('fecha_evaluacion', models.DateTimeField(verbose_name='FECHA DE EVALUACIÓN')),
+                ('tipo_revision', models.CharField(max_length=10, verbose_name='TIPO DE REVISIÓN')),
+                ('resolutivo', models.CharField(max_length=20, verbose_name='RESOLUTIVO DE LA REVISIÓN')),
+                ('observaciones', models.TextField(verbose_name='OBSERVACIONES DETALLADAS')),
+                ('evaluador', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='evaluaciones_archivadas', to='people.evaluador', verbose_name='EVALUADOR ASIGNADO')),
+                ('proyecto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evaluaciones', to='archive.proyectoarchivado')),
+            ],
+            options={
+                'verbose_name': 'Evaluación archivada',
+                'verbose_name_plural': 'Evaluaciones archivadas',
+                'ordering': ['-fecha_evaluacion', '-id_evaluacion'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='proyectoarchivado',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['documento_busqueda'], name='archivado_busqueda_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='proyectoarchivado',
+            index=models.Index(fields=['calendario_registro', 'folio'], name='archivado_calendario_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluacionarchivada',
+            index=models.Index(fields=['proyecto', '-fecha_evaluacion'], name='archivada_proyecto_fecha_idx'),
+        ),
+    ]
@@ -0,0 +1,136 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from people.models import Alumno, Asesor, Evaluador
+from projects.models import Formato1, Proyecto
+
+# ====================================================================
+# Archivo de calendarios cerrados
+# ====================================================================
+# Copias de Proyecto, Participacion, Prorroga y Evaluaciones con las mismas
+# columnas que las tablas originales: archive.archivado mueve las filas en
+# ambos sentidos con INSERT ... SELECT, sin pasar por Python. Las tablas del
+# día a día solo conservan los calendarios activos.
+
+
+class CalendarioArchivado(models.Model):
+    """Un calendario archivado (o a medio archivar / restaurar)."""
+    ARCHIVANDO = 'ARCHIVANDO'
+    ARCHIVADO = 'ARCHIVADO'
+    RESTAURANDO = 'RESTAURANDO'
+    ESTADO_CHOICES = [
+        (ARCHIVANDO, 'ARCHIVANDO'),
+        (ARCHIVADO, 'ARCHIVADO'),
+        (RESTAURANDO, 'RESTAURANDO'),
+    ]
+
+    calendario = models.CharField(max_length=10, primary_key=True, verbose_name="CALENDARIO")
+    estado = models.CharField(max_length=15, choices=ESTADO_CHOICES, default=ARCHIVANDO, verbose_name="ESTADO")
+    proyectos = models.PositiveIntegerField(default=0, verbose_name="PROYECTOS ARCHIVADOS")
+    fecha_archivo = models.DateTimeField(auto_now_add=True, verbose_name="FECHA DE ARCHIVO")
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="ÚLTIMO CAMBIO")
+
+    class Meta:
+        verbose_name = "Calendario archivado"
+        verbose_name_plural = "Calendarios archivados"
+        ordering = ['-calendario']
+
+    def __str__(self):
+        return f"{self.calendario} ({self.estado})"
+
+
+class ProyectoArchivado(models.Model):
+    """Copia de un Proyecto de un calendario archivado."""
+    folio = models.CharField(max_length=50, primary_key=True, verbose_name="FOLIO DE PROYECTO")
+    titulo = models.CharField(max_length=255, verbose_name="TÍTULO DEL PROYECTO")
+    asesor = models.ForeignKey(
+        Asesor, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='proyectos_archivados', verbose_name="ASESOR ASIGNADO",
+    )
+    evaluador = models.ForeignKey(
+        Evaluador, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='proyectos_archivados', verbose_name="EVALUADOR ASIGNADO",
+    )
+    formato1 = models.OneToOneField(
+        Formato1, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='proyecto_archivado', verbose_name="DATOS FORMATO 1",
+    )
+    modalidad = models.CharField(max_length=50, choices=Proyecto.MODALIDAD_CHOICES, verbose_name="MODALIDAD")
+    variante = models.CharField(max_length=50, null=True, blank=True, verbose_name="VARIANTE DE MODALIDAD")
+    nivel_competencia = models.CharField(max_length=30, null=True, blank=True, verbose_name="MÓDULOS REGISTRADOS")
+    dictamen = models.CharField(max_length=50, verbose_name="DICTAMEN FINAL")
+    calendario_registro = models.CharField(max_length=10, verbose_name="CALENDARIO")
+    evidencia_url = models.URLField(max_length=500, null=True, blank=True, verbose_name="URL EVIDENCIA PRINCIPAL")
+    protocolo_dictamen_url = models.URLField(max_length=500, null=True, blank=True, verbose_name="URL PROTOCOLO DICTAMINADO")
+    ultima_revision = models.CharField(max_length=10, null=True, blank=True, verbose_name="ÚLTIMA REVISIÓN")
+    ultimo_resolutivo = models.CharField(max_length=20, null=True, blank=True, verbose_name="ÚLTIMO RESOLUTIVO")
+    fecha_ultima_evaluacion = models.DateTimeField(null=True, blank=True, verbose_name="FECHA DE ÚLTIMA EVALUACIÓN")
+    total_evaluaciones = models.PositiveIntegerField(default=0, verbose_name="NÚMERO DE REVISIONES")
+    # El mismo documento de Proyecto: se busca con projects.busqueda.buscar_proyectos
+    documento_busqueda = SearchVectorField(null=True)
+    actualizado = models.DateTimeField(verbose_name="ÚLTIMA MODIFICACIÓN")
+
+    class Meta:
+        verbose_name = "Proyecto archivado"
+        verbose_name_plural = "Proyectos archivados"
+        indexes = [
+            GinIndex(fields=['documento_busqueda'], name='archivado_busqueda_gin'),
+            models.Index(fields=['calendario_registro', 'folio'], name='archivado_calendario_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.folio} - {self.titulo}"
+
+
+class ParticipacionArchivada(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    proyecto = models.ForeignKey(ProyectoArchivado, on_delete=models.CASCADE, related_name='participaciones')
+    alumno = models.ForeignKey(Alumno, on_delete=models.CASCADE, related_name='participaciones_archivadas')
+    es_representante = models.BooleanField(default=False, verbose_name="ES REPRESENTANTE")
+
+    class Meta:
+        verbose_name = "Participación archivada"
+        verbose_name_plural = "Participaciones archivadas"
+
+    def __str__(self):
+        rol = "REPRESENTANTE" if self.es_representante else "PARTICIPANTE"
+        return f"{self.proyecto_id} - {self.alumno_id} ({rol})"
+
+
+class ProrrogaArchivada(models.Model):
+    id_prorroga = models.IntegerField(primary_key=True, verbose_name="ID DE PRÓRROGA")
+    proyecto = models.ForeignKey(ProyectoArchivado, on_delete=models.CASCADE, related_name='prorrogas')
+    justificacion = models.TextField(verbose_name="JUSTIFICACIÓN DE PRÓRROGA")
+    calendario_presentacion = models.CharField(max_length=10, verbose_name="CALENDARIO PARA PRESENTACIÓN")
+
+    class Meta:
+        verbose_name = "Prórroga archivada"
+        verbose_name_plural = "Prórrogas archivadas"
+
+    def __str__(self):
+        return f"Prórroga {self.id_prorroga} para {self.proyecto_id}"
+
+
+class EvaluacionArchivada(models.Model):
+    id_evaluacion = models.IntegerField(primary_key=True, verbose_name="ID DE EVALUACIÓN")
+    proyecto = models.ForeignKey(ProyectoArchivado, on_delete=models.CASCADE, related_name='evaluaciones')
+    evaluador = models.ForeignKey(
+        Evaluador, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='evaluaciones_archivadas', verbose_name="EVALUADOR ASIGNADO",
+    )
+    fecha_evaluacion = models.DateTimeField(verbose_name="FECHA DE EVALUACIÓN")
+    tipo_revision = models.CharField(max_length=10, verbose_name="TIPO DE REVISIÓN")
+    resolutivo = models.CharField(max_length=20, verbose_name="RESOLUTIVO DE LA REVISIÓN")
+    observaciones = models.TextField(verbose_name="OBSERVACIONES DETALLADAS")
+
+    class Meta:
+        verbose_name = "Evaluación archivada"
+        verbose_name_plural = "Evaluaciones archivadas"
+        ordering = ['-fecha_evaluacion', '-id_evaluacion']
+        indexes = [
+            models.Index(fields=['proyecto', '-fecha_evaluacion'], name='archivada_proyecto_fecha_idx'),
+        ]
+
+    def __str__(self):
+        return f"EVALUACIÓN {self.id_evaluacion} - {self.proyecto_id} ({self.tipo_revision})"
@@ -0,0 +1,88 @@
+from django.test import SimpleTestCase, TestCase
+
+from evaluation.models import Evaluaciones
+from people.models import Alumno, Evaluador
+from projects.models import Formato1, Participacion, Prorroga, Proyecto
+from .archivado import TABLAS, archivar_calendario, restaurar_calendario
+from .models import CalendarioArchivado, ProyectoArchivado
+
+# Cambian al restaurar: los vuelve a calcular projects.signals.proyectos_modificados
+RECALCULADOS = {'actualizado', 'documento_busqueda'}
+
+
+class ColumnasArchivoTests(SimpleTestCase):
+    """archive.archivado copia las columnas de la tabla activa tal cual."""
+
+    def test_el_archivo_tiene_todas_las_columnas_activas(self):
+        for activa, archivo, _ in TABLAS:
+            with self.subTest(tabla=activa._meta.db_table):
+                columnas = {campo.column for campo in activa._meta.concrete_fields}
+                faltantes = columnas - {campo.column for campo in archivo._meta.concrete_fields}
+                self.assertEqual(faltantes, set(), f"Faltan en {archivo._meta.db_table}")
+
+
+class ArchivoCalendarioTests(TestCase):
+    """Archivar y restaurar un calendario deja las filas como estaban."""
+
+    @classmethod
+    def setUpTestData(cls):
+        evaluador = Evaluador.objects.create(
+            codigo_evaluador='E1', nombre_completo='EVALUADORA', correo_evaluador='e1@sigap.mx',
+            especializacion='PROTOTIPO',
+        )
+        for calendario in ('2025A', '2026A'):
+            for numero in range(1, 4):
+                folio = f'{calendario}-{numero}'
+                alumno = Alumno.objects.create(
+                    codigo_estudiante=f'{calendario[2:4]}{calendario[-1]}{numero:03d}',
+                    nombre_completo=f'ALUMNO {folio}',
+                )
+                proyecto = Proyecto.objects.create(
+                    folio=folio, titulo=f'PROYECTO {folio}', evaluador=evaluador,
+                    formato1=Formato1.objects.create(
+                        folio=folio, introduccion='I', justificacion='J', objetivo='O', resumen='R',
+                    ),
+                    modalidad='PROTOTIPO', calendario_registro=calendario,
+                )
+                Participacion.objects.create(proyecto=proyecto, alumno=alumno, es_representante=True)
+                Prorroga.objects.create(proyecto=proyecto, justificacion='ATRASO', calendario_presentacion='2026B')
+                for resolutivo in ('PENDIENTE', 'APROBADO')[:numero]:
+                    Evaluaciones.objects.create(
+                        proyecto=proyecto, evaluador=evaluador, resolutivo=resolutivo, observaciones='OK',
+                    )
+
+    def _filas(self):
+        filas = {}
+        for activa, _, campo in TABLAS:
+            columnas = [f.attname for f in activa._meta.concrete_fields if f.attname not in RECALCULADOS]
+            filas[activa._meta.model_name] = list(
+                activa.objects.order_by(activa._meta.pk.attname).values(*columnas)
+            )
+        return filas
+
+    def test_archivar_y_restaurar(self):
+        antes = self._filas()
+        activos = Proyecto.objects.filter(calendario_registro='2026A').count()
+
+        self.assertEqual(archivar_calendario('2025a', lote=2), 3)
+
+        registro = CalendarioArchivado.objects.get()
+        self.assertEqual((registro.calendario, registro.estado, registro.proyectos), ('2025A', 'ARCHIVADO', 3))
+        self.assertFalse(Proyecto.objects.filter(calendario_registro='2025A').exists())
+        self.assertEqual(Proyecto.objects.count(), activos)
+        self.assertEqual(ProyectoArchivado.objects.count(), 3)
+        self.assertEqual(
+            ProyectoArchivado.objects.get(pk='2025A-2').evaluaciones.count(), 2,
+        )
+        self.assertEqual(Participacion.objects.filter(proyecto__calendario_registro='2025A').count(), 0)
+
+        self.assertEqual(restaurar_calendario('2025A', lote=2), 3)
+
+        self.assertEqual(self._filas(), antes)
+        self.assertFalse(CalendarioArchivado.objects.exists())
+        self.assertFalse(ProyectoArchivado.objects.exists())
+        restaurado = Proyecto.objects.get(pk='2025A-2')
+        self.assertEqual(
+            (restaurado.total_evaluaciones, restaurado.ultimo_resolutivo), (2, 'APROBADO'),
+        )
+        self.assertIsNotNone(restaurado.documento_busqueda)
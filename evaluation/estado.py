@@ -0,0 +1,26 @@
+"""
+Estado de evaluación desnormalizado en Proyecto.
+
+`Proyecto.ultima_revision`, `ultimo_resolutivo`, `fecha_ultima_evaluacion` y
+`total_evaluaciones` reflejan el historial de Evaluaciones, así que "proyectos
+en FONDO con PENDIENTE" es un filtro indexado y no una subconsulta por fila.
+El mismo UPDATE marca el proyecto como modificado (`Proyecto.actualizado`).
+"""
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
+
+from .models import Evaluaciones
+
+
+def actualizar_estado(proyectos):
+    """Recalcula el estado de los proyectos del queryset con un solo UPDATE."""
+    historial = Evaluaciones.objects.filter(proyecto=OuterRef('pk'))
+    ultima = historial.order_by('-fecha_evaluacion', '-id_evaluacion')
+    total = historial.order_by().values('proyecto').annotate(total=Count('*')).values('total')
+    return proyectos.update(
+        ultima_revision=Subquery(ultima.values('tipo_revision')[:1]),
+        ultimo_resolutivo=Subquery(ultima.values('resolutivo')[:1]),
+        fecha_ultima_evaluacion=Subquery(ultima.values('fecha_evaluacion')[:1]),
+        total_evaluaciones=Coalesce(Subquery(total), 0),
+        actualizado=Now(),
+    )
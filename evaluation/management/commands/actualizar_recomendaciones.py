@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from evaluation.recomendacion import LOTE_EVALUADORES, actualizar_recomendaciones
+
+
+class Command(BaseCommand):
+    help = (
+        "Actualiza los perfiles TF-IDF de los evaluadores con los que se recomiendan evaluadores "
+        "en el admin de proyectos. Por omisión solo los evaluadores cuyo historial cambió."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--completo', action='store_true', help="Recalcula el IDF y todos los perfiles.")
+        parser.add_argument('--lote', type=int, default=LOTE_EVALUADORES, help="Evaluadores por transacción.")
+
+    def handle(self, *args, **options):
+        def al_avanzar(perfiles):
+            self.stdout.write(f"  {perfiles} perfiles actualizados…")
+
+        resultado = actualizar_recomendaciones(
+            completo=options['completo'], lote=options['lote'], al_avanzar=al_avanzar,
+        )
+
+        if resultado.terminos:
+            self.stdout.write(f"IDF recalculado: {resultado.terminos} términos.")
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado.perfiles} perfiles actualizados, {resultado.eliminados} eliminados, "
+            f"en {resultado.segundos:.1f} s."
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0001_initial'),
+        ('people', '0002_busqueda_trigramas'),
+        ('projects', '0003_indices_filtros_admin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='evaluaciones',
+            index=models.Index(fields=['proyecto', '-fecha_evaluacion'], name='evaluacion_proyecto_fecha_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:10
+
+import SIGAP.fields
+from django.db import migrations
+
+from SIGAP.fields import mayusculas_por_lotes
+
+
+def convertir_existentes(apps, schema_editor):
+    # Las llaves primarias ya se capturaban en mayúsculas
+    mayusculas_por_lotes(apps.get_model('evaluation', 'Evaluaciones'), ['tipo_revision', 'resolutivo', 'observaciones'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0002_indice_historial_proyecto'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='evaluaciones',
+            name='observaciones',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='OBSERVACIONES DETALLADAS'),
+        ),
+        migrations.AlterField(
+            model_name='evaluaciones',
+            name='resolutivo',
+            field=SIGAP.fields.MayusculasCharField(choices=[('APROBADO', 'Aprobado'), ('RECHAZADO', 'Rechazado'), ('PENDIENTE', 'Pendiente de Correcciones'), ('NO_APLICA', 'No Aplica')], max_length=20, verbose_name='RESOLUTIVO DE LA REVISIÓN'),
+        ),
+        migrations.AlterField(
+            model_name='evaluaciones',
+            name='tipo_revision',
+            field=SIGAP.fields.MayusculasCharField(choices=[('FORMA', 'Revisión de Forma'), ('FONDO', 'Revisión de Fondo'), ('FINAL', 'Dictamen Final')], default='FORMA', max_length=10, verbose_name='TIPO DE REVISIÓN'),
+        ),
+        migrations.RunPython(convertir_existentes, migrations.RunPython.noop),
+    ]
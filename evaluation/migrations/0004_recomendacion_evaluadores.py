@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0003_campos_mayusculas'),
+        ('people', '0003_campos_mayusculas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerfilEvaluador',
+            fields=[
+                ('evaluador', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='perfil', serialize=False, to='people.evaluador', verbose_name='EVALUADOR')),
+                ('proyectos', models.PositiveIntegerField(default=0, verbose_name='PROYECTOS REVISADOS')),
+                ('evaluaciones', models.PositiveIntegerField(default=0, verbose_name='EVALUACIONES')),
+                ('ultima_evaluacion', models.DateTimeField(blank=True, null=True, verbose_name='ÚLTIMA EVALUACIÓN')),
+                ('actualizado', models.DateTimeField(auto_now=True, verbose_name='ÚLTIMA ACTUALIZACIÓN')),
+            ],
+            options={
+                'verbose_name': 'Perfil de evaluador',
+                'verbose_name_plural': 'Perfiles de evaluadores',
+            },
+        ),
+        migrations.CreateModel(
+            name='TerminoIdf',
+            fields=[
+                ('termino', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='TÉRMINO')),
+                ('documentos', models.PositiveIntegerField(verbose_name='DOCUMENTOS')),
+                ('idf', models.FloatField(verbose_name='IDF')),
+            ],
+            options={
+                'verbose_name': 'Término (IDF)',
+                'verbose_name_plural': 'Términos (IDF)',
+            },
+        ),
+        migrations.CreateModel(
+            name='PesoPerfil',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('termino', models.CharField(max_length=100, verbose_name='TÉRMINO')),
+                ('peso', models.FloatField(verbose_name='PESO')),
+                ('perfil', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pesos', to='evaluation.perfilevaluador')),
+            ],
+            options={
+                'verbose_name': 'Peso de término',
+                'verbose_name_plural': 'Pesos de términos',
+                'indexes': [models.Index(fields=['termino'], include=('perfil', 'peso'), name='peso_perfil_termino_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from SIGAP.fields import MayusculasCharField, MayusculasTextField
 from projects.models import Proyecto  # Importar el proyecto a evaluar
 from people.models import Evaluador   # Importar quién evalúa
 
@@ -35,7 +36,7 @@ class Evaluaciones(models.Model):
         ('FINAL', 'Dictamen Final'),
     ]
     
-    tipo_revision = models.CharField(
+    tipo_revision = MayusculasCharField(
         max_length=10,
         choices=REVISION_CHOICES,
         default='FORMA',
@@ -50,30 +51,101 @@ class Evaluaciones(models.Model):
         ('NO_APLICA', 'No Aplica'),
     ]
 
-    resolutivo = models.CharField(
+    resolutivo = MayusculasCharField(
         max_length=20,
         choices=RESOLUTIVO_CHOICES,
         verbose_name="RESOLUTIVO DE LA REVISIÓN"
     )
 
-    observaciones = models.TextField(verbose_name="OBSERVACIONES DETALLADAS")
+    observaciones = MayusculasTextField(verbose_name="OBSERVACIONES DETALLADAS")
     
     class Meta:
         verbose_name = "Evaluación Histórica"
         verbose_name_plural = "Evaluaciones Históricas"
         ordering = ['-fecha_evaluacion']
+        indexes = [
+            # Historial de un proyecto, del más reciente al más antiguo
+            models.Index(fields=['proyecto', '-fecha_evaluacion'], name='evaluacion_proyecto_fecha_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        # Proyecto con el que se cargó: si la evaluación se mueve, también cambia su estado
+        instancia._proyecto_cargado = instancia.__dict__.get('proyecto_id')
+        return instancia
 
     def save(self, *args, **kwargs):
         """
-        Convierte automáticamente a MAYÚSCULAS todos los CharField y TextField
-        antes de guardar el registro.
+        Guarda la evaluación y, en la misma transacción, actualiza el estado
+        desnormalizado del proyecto (ver evaluation.estado), y el del proyecto
+        anterior si la evaluación cambió de proyecto.
         """
-        for field in self._meta.fields:
-            if isinstance(field, models.CharField) or isinstance(field, models.TextField):
-                valor = getattr(self, field.name)
-                if isinstance(valor, str):
-                    setattr(self, field.name, valor.upper())
-        super().save(*args, **kwargs)
+        proyectos = {self.proyecto_id, getattr(self, '_proyecto_cargado', None)} - {None}
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            from .estado import actualizar_estado
+            actualizar_estado(Proyecto.objects.filter(pk__in=proyectos))
+        self._proyecto_cargado = self.proyecto_id
+
+    def __str__(self):
+        return f"EVALUACIÓN {self.id_evaluacion} - {self.proyecto_id} ({self.tipo_revision})"
+
+
+# ====================================================================
+# Recomendación de evaluadores (la mantiene evaluation.recomendacion)
+# ====================================================================
+
+class TerminoIdf(models.Model):
+    """Frecuencia inversa de un término (lexema de 'sigap_es') en los Formato1."""
+    termino = models.CharField(max_length=100, primary_key=True, verbose_name="TÉRMINO")
+    documentos = models.PositiveIntegerField(verbose_name="DOCUMENTOS")
+    idf = models.FloatField(verbose_name="IDF")
+
+    class Meta:
+        verbose_name = "Término (IDF)"
+        verbose_name_plural = "Términos (IDF)"
+
+    def __str__(self):
+        return f"{self.termino} ({self.idf:.2f})"
+
+
+class PerfilEvaluador(models.Model):
+    """
+    Resumen de lo que ha revisado un evaluador: el centroide TF-IDF de los
+    Formato1 de los proyectos que evaluó (sus términos en PesoPerfil).
+    """
+    evaluador = models.OneToOneField(
+        Evaluador, on_delete=models.CASCADE, primary_key=True, related_name='perfil',
+        verbose_name="EVALUADOR",
+    )
+    proyectos = models.PositiveIntegerField(default=0, verbose_name="PROYECTOS REVISADOS")
+    # Para saber si el historial cambió desde el último cálculo
+    evaluaciones = models.PositiveIntegerField(default=0, verbose_name="EVALUACIONES")
+    ultima_evaluacion = models.DateTimeField(null=True, blank=True, verbose_name="ÚLTIMA EVALUACIÓN")
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="ÚLTIMA ACTUALIZACIÓN")
+
+    class Meta:
+        verbose_name = "Perfil de evaluador"
+        verbose_name_plural = "Perfiles de evaluadores"
+
+    def __str__(self):
+        return f"Perfil de {self.evaluador_id}"
+
+
+class PesoPerfil(models.Model):
+    """Peso de un término en el perfil (vector unitario) de un evaluador."""
+    perfil = models.ForeignKey(PerfilEvaluador, on_delete=models.CASCADE, related_name='pesos')
+    termino = models.CharField(max_length=100, verbose_name="TÉRMINO")
+    peso = models.FloatField(verbose_name="PESO")
+
+    class Meta:
+        verbose_name = "Peso de término"
+        verbose_name_plural = "Pesos de términos"
+        indexes = [
+            # La recomendación recorre el índice por término sin tocar la tabla
+            models.Index(fields=['termino'], include=['perfil', 'peso'], name='peso_perfil_termino_idx'),
+        ]
 
     def __str__(self):
-        return f"EVALUACIÓN {self.id_evaluacion} - {self.proyecto.folio} ({self.tipo_revision})"
+        return f"{self.perfil_id}: {self.termino} {self.peso:.3f}"
@@ -0,0 +1,254 @@
+"""
+Recomendación de evaluadores por afinidad con lo que ya revisaron.
+
+Cada Formato1 ya tiene su texto analizado en `documento_busqueda`
+(lexemas en español, sin acentos; ver projects.busqueda). Con eso:
+
+- TerminoIdf guarda el IDF de cada lexema en todos los Formato1.
+- El perfil de un evaluador es el promedio de los vectores TF-IDF
+  (normalizados) de los Formato1 de los proyectos que evaluó, activos o
+  archivados, recortado a sus TERMINOS_POR_PERFIL términos de más peso y
+  normalizado otra vez. Se guarda disperso en PesoPerfil.
+- Recomendar es un producto matriz-vector dentro de PostgreSQL: los
+  términos del Formato1 del proyecto se cruzan con el índice de PesoPerfil
+  por término y se suman por evaluador; el resultado es el coseno.
+
+Todo el cálculo es SQL por conjuntos, sin traer textos a Python. Los
+perfiles se recalculan solo para los evaluadores cuyo historial cambió
+(`actualizar_recomendaciones`); el IDF y todos los perfiles, con
+`--completo`.
+"""
+import time
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+
+from archive.models import EvaluacionArchivada, ProyectoArchivado
+from people.models import Evaluador
+from projects.models import Formato1, Proyecto
+from .models import Evaluaciones, PerfilEvaluador, PesoPerfil, TerminoIdf
+
+TERMINOS_POR_PERFIL = 500
+# Términos presentes en menos documentos no distinguen a ningún evaluador
+DOCUMENTOS_MINIMOS = 2
+LOTE_EVALUADORES = 50
+RECOMENDACIONES = 5
+
+
+@dataclass
+class Recomendacion:
+    evaluador: Evaluador
+    similitud: float
+    proyectos: int
+
+
+@dataclass
+class ResultadoRecomendaciones:
+    terminos: int = 0
+    perfiles: int = 0
+    eliminados: int = 0
+    segundos: float = 0.0
+
+
+def _tabla(modelo):
+    return connection.ops.quote_name(modelo._meta.db_table)
+
+
+def _historial():
+    """
+    SQL de (evaluador, proyecto, formato1, fecha) de todas las evaluaciones,
+    activas y archivadas. El Formato 1 se liga por la llave foránea o, en
+    registros viejos, por folio.
+    """
+    return f"""
+        SELECT e.evaluador_id, e.proyecto_id, COALESCE(p.formato1_id, p.folio) AS formato1_id,
+               e.fecha_evaluacion
+          FROM {_tabla(Evaluaciones)} e JOIN {_tabla(Proyecto)} p ON p.folio = e.proyecto_id
+         WHERE e.evaluador_id IS NOT NULL
+        UNION ALL
+        SELECT e.evaluador_id, e.proyecto_id, COALESCE(p.formato1_id, p.folio),
+               e.fecha_evaluacion
+          FROM {_tabla(EvaluacionArchivada)} e JOIN {_tabla(ProyectoArchivado)} p ON p.folio = e.proyecto_id
+         WHERE e.evaluador_id IS NOT NULL
+    """
+
+
+def _terminos(alias_formato1):
+    """SQL de (término, peso TF-IDF) de los Formato1 unidos como `alias_formato1`."""
+    return f"""
+        SELECT t.lexeme AS termino,
+               (1 + ln(COALESCE(cardinality(t.positions), 1))) * i.idf AS peso
+          FROM unnest({alias_formato1}.documento_busqueda) t
+          JOIN {_tabla(TerminoIdf)} i ON i.termino = t.lexeme
+    """
+
+
+# ====================================================================
+# Matriz de perfiles
+# ====================================================================
+
+def recalcular_idf():
+    """Recalcula TerminoIdf con todos los Formato1; regresa el número de términos."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {_tabla(TerminoIdf)}")
+        cursor.execute(
+            f"""
+            WITH total AS (SELECT count(*) AS n FROM {_tabla(Formato1)})
+            INSERT INTO {_tabla(TerminoIdf)} (termino, documentos, idf)
+            SELECT t.lexeme, count(*), ln((1 + total.n)::float / (1 + count(*))) + 1
+              FROM {_tabla(Formato1)} f CROSS JOIN unnest(f.documento_busqueda) t CROSS JOIN total
+             WHERE length(t.lexeme) <= 100
+             GROUP BY t.lexeme, total.n
+            HAVING count(*) >= %s
+            """,
+            [DOCUMENTOS_MINIMOS],
+        )
+        return cursor.rowcount
+
+
+def estadisticas_historial():
+    """{evaluador: (evaluaciones, última fecha, proyectos distintos)} del historial completo."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT evaluador_id, count(*), max(fecha_evaluacion), count(DISTINCT proyecto_id)
+              FROM ({_historial()}) h
+             GROUP BY evaluador_id
+            """
+        )
+        return {evaluador: tuple(datos) for evaluador, *datos in cursor.fetchall()}
+
+
+def _guardar_perfiles(codigos, estadisticas):
+    """Reemplaza los perfiles de `codigos` en una sola transacción."""
+    with transaction.atomic():
+        PerfilEvaluador.objects.bulk_create(
+            [
+                PerfilEvaluador(
+                    evaluador_id=codigo,
+                    evaluaciones=estadisticas[codigo][0],
+                    ultima_evaluacion=estadisticas[codigo][1],
+                    proyectos=estadisticas[codigo][2],
+                )
+                for codigo in codigos
+            ],
+            update_conflicts=True,
+            unique_fields=['evaluador'],
+            update_fields=['evaluaciones', 'ultima_evaluacion', 'proyectos', 'actualizado'],
+        )
+        PesoPerfil.objects.filter(perfil__in=codigos)._raw_delete(PesoPerfil.objects.db)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH documentos AS (
+                    SELECT DISTINCT h.evaluador_id, h.formato1_id
+                      FROM ({_historial()}) h
+                     WHERE h.evaluador_id = ANY(%s)
+                ),
+                pesos AS (
+                    SELECT d.evaluador_id, d.formato1_id, t.termino, t.peso
+                      FROM documentos d
+                      JOIN {_tabla(Formato1)} f ON f.folio = d.formato1_id
+                     CROSS JOIN LATERAL ({_terminos('f')}) t
+                ),
+                centroide AS (
+                    -- Cada documento cuenta igual, sea largo o corto
+                    SELECT evaluador_id, termino,
+                           sum(peso / norma) AS peso
+                      FROM (
+                        SELECT *, sqrt(sum(peso * peso) OVER (PARTITION BY evaluador_id, formato1_id)) AS norma
+                          FROM pesos
+                      ) n
+                     GROUP BY evaluador_id, termino
+                ),
+                recortado AS (
+                    SELECT *, row_number() OVER (PARTITION BY evaluador_id ORDER BY peso DESC, termino) AS lugar
+                      FROM centroide
+                )
+                INSERT INTO {_tabla(PesoPerfil)} (perfil_id, termino, peso)
+                SELECT evaluador_id, termino, peso / sqrt(sum(peso * peso) OVER (PARTITION BY evaluador_id))
+                  FROM recortado
+                 WHERE lugar <= %s
+                """,
+                [list(codigos), TERMINOS_POR_PERFIL],
+            )
+
+
+def actualizar_recomendaciones(completo=False, lote=LOTE_EVALUADORES, al_avanzar=None):
+    """
+    Pone al día la matriz de perfiles. Sin `completo` solo recalcula los
+    evaluadores cuyo historial cambió (número de evaluaciones o última
+    fecha) y borra los que ya no tienen evaluaciones; con `completo`, o si
+    aún no hay IDF, recalcula el IDF y todos los perfiles.
+    `al_avanzar(perfiles)` se llama después de cada lote.
+    """
+    inicio = time.perf_counter()
+    resultado = ResultadoRecomendaciones()
+    if completo or not TerminoIdf.objects.exists():
+        resultado.terminos = recalcular_idf()
+        completo = True
+
+    estadisticas = estadisticas_historial()
+    guardados = {
+        codigo: (evaluaciones, ultima)
+        for codigo, evaluaciones, ultima in PerfilEvaluador.objects.values_list(
+            'evaluador', 'evaluaciones', 'ultima_evaluacion',
+        )
+    }
+    pendientes = sorted(
+        codigo for codigo, datos in estadisticas.items()
+        if completo or guardados.get(codigo) != datos[:2]
+    )
+    sin_historial = [codigo for codigo in guardados if codigo not in estadisticas]
+    if sin_historial:
+        resultado.eliminados, _ = PerfilEvaluador.objects.filter(pk__in=sin_historial).delete()
+
+    for i in range(0, len(pendientes), lote):
+        codigos = pendientes[i:i + lote]
+        _guardar_perfiles(codigos, estadisticas)
+        resultado.perfiles += len(codigos)
+        if al_avanzar:
+            al_avanzar(resultado.perfiles)
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
+
+
+# ====================================================================
+# Recomendación
+# ====================================================================
+
+def recomendar_evaluadores(proyecto, maximo=RECOMENDACIONES):
+    """
+    Evaluadores ordenados por el coseno entre el Formato1 del proyecto y su
+    perfil. Regresa una lista de Recomendacion; vacía si el proyecto no
+    tiene Formato 1 o aún no hay perfiles.
+    """
+    formato1_id = proyecto.formato1_id or proyecto.folio
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH consulta AS (
+                SELECT t.termino, t.peso
+                  FROM {_tabla(Formato1)} f CROSS JOIN LATERAL ({_terminos('f')}) t
+                 WHERE f.folio = %s
+            )
+            SELECT w.perfil_id,
+                   sum(w.peso * c.peso) / (SELECT sqrt(sum(peso * peso)) FROM consulta) AS similitud
+              FROM consulta c JOIN {_tabla(PesoPerfil)} w ON w.termino = c.termino
+             GROUP BY w.perfil_id
+             ORDER BY similitud DESC, w.perfil_id
+             LIMIT %s
+            """,
+            [formato1_id, maximo],
+        )
+        filas = cursor.fetchall()
+    if not filas:
+        return []
+
+    perfiles = PerfilEvaluador.objects.select_related('evaluador').in_bulk([codigo for codigo, _ in filas])
+    return [
+        Recomendacion(perfiles[codigo].evaluador, similitud, perfiles[codigo].proyectos)
+        for codigo, similitud in filas
+        if codigo in perfiles
+    ]
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from projects.models import Proyecto
+from .estado import actualizar_estado
+from .models import Evaluaciones
+
+
+# El borrado corre dentro de la transacción del Collector, así que el estado
+# del proyecto se actualiza en la misma transacción. El guardado se cubre en
+# Evaluaciones.save().
+@receiver(post_delete, sender=Evaluaciones)
+def evaluacion_borrada(sender, instance, **kwargs):
+    actualizar_estado(Proyecto.objects.filter(pk=instance.proyecto_id))
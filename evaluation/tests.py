@@ -1,3 +1,89 @@
 from django.test import TestCase
 
-# Create your tests here.
+from people.models import Evaluador
+from projects.models import Formato1, Proyecto
+from .models import Evaluaciones
+from .recomendacion import actualizar_recomendaciones, recomendar_evaluadores
+
+
+class EstadoDesnormalizadoTests(TestCase):
+    """Proyecto.ultima_revision y compañía siguen al historial de Evaluaciones."""
+
+    def setUp(self):
+        self.uno = Proyecto.objects.create(folio='2026A-1', titulo='UNO', modalidad='PROTOTIPO', calendario_registro='2026A')
+        self.dos = Proyecto.objects.create(folio='2026A-2', titulo='DOS', modalidad='PROTOTIPO', calendario_registro='2026A')
+
+    def _estado(self, proyecto):
+        proyecto.refresh_from_db()
+        return proyecto.total_evaluaciones, proyecto.ultimo_resolutivo
+
+    def test_mover_una_evaluacion_recalcula_ambos_proyectos(self):
+        Evaluaciones.objects.create(proyecto=self.uno, resolutivo='APROBADO', observaciones='OK')
+        self.assertEqual(self._estado(self.uno), (1, 'APROBADO'))
+
+        evaluacion = Evaluaciones.objects.get()
+        evaluacion.proyecto = self.dos
+        evaluacion.save()
+
+        self.assertEqual(self._estado(self.uno), (0, None))
+        self.assertEqual(self._estado(self.dos), (1, 'APROBADO'))
+
+    def test_guardar_el_proyecto_no_pisa_el_estado(self):
+        # Instancia cargada antes de la evaluación, como la del formulario del admin
+        cargado = Proyecto.objects.get(pk=self.uno.pk)
+        Evaluaciones.objects.create(proyecto=self.uno, resolutivo='RECHAZADO', observaciones='NO')
+
+        cargado.titulo = 'UNO CORREGIDO'
+        cargado.save()
+
+        self.assertEqual(self._estado(self.uno), (1, 'RECHAZADO'))
+        self.assertEqual(self.uno.titulo, 'UNO CORREGIDO')
+
+
+class RecomendacionEvaluadoresTests(TestCase):
+    """evaluation.recomendacion: perfiles TF-IDF a partir de lo ya evaluado."""
+
+    HUERTO = "Huerto escolar con riego por goteo, sensores de humedad y cultivo de hortalizas {}."
+    APLICACION = "Aplicación móvil para préstamo de libros de la biblioteca con reservas en línea {}."
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.agronoma, cls.programador = Evaluador.objects.bulk_create([
+            Evaluador(codigo_evaluador='E1', nombre_completo='AGRÓNOMA', correo_evaluador='e1@sigap.mx',
+                      especializacion='PROTOTIPO'),
+            Evaluador(codigo_evaluador='E2', nombre_completo='PROGRAMADOR', correo_evaluador='e2@sigap.mx',
+                      especializacion='PROTOTIPO'),
+        ])
+        historial = [
+            (cls.HUERTO.format('en primaria'), cls.agronoma),
+            (cls.HUERTO.format('en secundaria'), cls.agronoma),
+            (cls.APLICACION.format('para alumnos'), cls.programador),
+            (cls.APLICACION.format('para docentes'), cls.programador),
+            (cls.HUERTO.format('y composta'), None),
+        ]
+        for numero, (texto, evaluador) in enumerate(historial, start=1):
+            folio = f'2025B-{numero}'
+            proyecto = Proyecto.objects.create(
+                folio=folio, titulo=f'PROYECTO {numero}', modalidad='PROTOTIPO', calendario_registro='2025B',
+                formato1=Formato1.objects.create(
+                    folio=folio, objetivo=texto, resumen='', introduccion='', justificacion='',
+                ),
+            )
+            if evaluador:
+                Evaluaciones.objects.create(
+                    proyecto=proyecto, evaluador=evaluador, resolutivo='APROBADO', observaciones='OK',
+                )
+
+    def test_recomienda_primero_al_que_evaluo_protocolos_parecidos(self):
+        resultado = actualizar_recomendaciones(completo=True)
+        self.assertEqual(resultado.perfiles, 2)
+
+        recomendaciones = recomendar_evaluadores(Proyecto.objects.get(pk='2025B-5'))
+
+        self.assertEqual(recomendaciones[0].evaluador, self.agronoma)
+        self.assertEqual(recomendaciones[0].proyectos, 2)
+        if len(recomendaciones) > 1:
+            self.assertGreater(recomendaciones[0].similitud, recomendaciones[1].similitud)
+
+    def test_sin_perfiles_no_hay_recomendaciones(self):
+        self.assertEqual(recomendar_evaluadores(Proyecto.objects.get(pk='2025B-5')), [])
@@ -0,0 +1,44 @@
+"""
+Configuración de gunicorn para producción (`gunicorn -c gunicorn.conf.py`).
+
+SERVIDOR_MODO elige la interfaz:
+- 'wsgi' (por omisión): workers gthread. Las vistas de SIGAP (admin, API,
+  exportaciones) son síncronas, así que cada hilo atiende una petición sin
+  pasar por sync_to_async.
+- 'asgi': workers de uvicorn sobre SIGAP.asgi. Django ejecuta las vistas
+  síncronas en un solo hilo por worker, así que conviene subir SERVIDOR_WORKERS.
+  Un StreamingHttpResponse con iterador síncrono se lee completo en memoria
+  antes de enviarse; la exportación CSV del admin usa un iterador asíncrono
+  (projects.exportacion.en_async). Cualquier otra respuesta en streaming
+  necesita lo mismo o SERVIDOR_MODO=wsgi.
+
+Con DB_POOL_MAX cada worker abre su propio pool: el total de conexiones a
+PostgreSQL puede llegar a SERVIDOR_WORKERS × DB_POOL_MAX.
+"""
+import multiprocessing
+import os
+
+MODO = os.getenv('SERVIDOR_MODO', 'wsgi')
+
+bind = os.getenv('SERVIDOR_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('SERVIDOR_WORKERS', '0')) or multiprocessing.cpu_count() * 2 + 1
+
+if MODO == 'asgi':
+    wsgi_app = 'SIGAP.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'SIGAP.wsgi:application'
+    worker_class = 'gthread'
+    threads = int(os.getenv('SERVIDOR_HILOS', '4'))
+
+# Reinicia cada worker tras N peticiones (con variación) para acotar fugas de memoria
+max_requests = int(os.getenv('SERVIDOR_MAX_PETICIONES', '2000'))
+max_requests_jitter = max_requests // 10
+
+# Exportaciones grandes en streaming pueden tardar; el proxy debe tener un límite similar
+timeout = int(os.getenv('SERVIDOR_TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
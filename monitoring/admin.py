@@ -0,0 +1,55 @@
+from django.contrib import admin
+from django.utils.html import format_html_join
+
+from .models import PerfilPeticion
+
+
+@admin.register(PerfilPeticion)
+class PerfilPeticionAdmin(admin.ModelAdmin):
+    """
+    Búfer del perfilado SQL (monitoring.middleware). Lo puede consultar
+    cualquier usuario staff; solo el middleware crea registros.
+    """
+    list_display = (
+        'fecha', 'metodo', 'ruta', 'estado', 'consultas', 'tiempo_bd_ms', 'tiempo_total_ms', 'posible_n_mas_1',
+    )
+    list_filter = ('posible_n_mas_1', 'metodo', 'estado')
+    search_fields = ('ruta',)
+    fields = (
+        'fecha', 'metodo', 'ruta', 'estado', 'consultas', 'tiempo_bd_ms', 'tiempo_total_ms',
+        'detalle_repetidas', 'detalle_lentas',
+    )
+    readonly_fields = fields
+
+    def has_module_permission(self, request):
+        return request.user.is_active and request.user.is_staff
+
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_staff
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_superuser
+
+    @admin.display(description="Consultas repetidas (posible N+1)")
+    def detalle_repetidas(self, obj):
+        if not obj.repetidas:
+            return "—"
+        return format_html_join(
+            '', '<p><strong>{} veces, {} ms</strong></p><pre style="white-space:pre-wrap">{}</pre>',
+            ((forma['veces'], forma['ms'], forma['sql']) for forma in obj.repetidas),
+        )
+
+    @admin.display(description="Consultas lentas (EXPLAIN)")
+    def detalle_lentas(self, obj):
+        if not obj.lentas:
+            return "—"
+        return format_html_join(
+            '', '<p><strong>{} ms</strong></p><pre style="white-space:pre-wrap">{}</pre><pre>{}</pre>',
+            ((consulta['ms'], consulta['sql'], consulta['plan']) for consulta in obj.lentas),
+        )
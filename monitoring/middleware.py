@@ -0,0 +1,146 @@
+"""
+Perfilado SQL por petición (opcional).
+
+Con PERFILADO_SQL_MUESTRA mayor que 0, esa fracción de las peticiones se
+atiende con un execute_wrapper que mide cada consulta. Al terminar se guarda
+un PerfilPeticion con el número de consultas, el tiempo en la base, las
+consultas de la misma forma repetidas (posible N+1) y el EXPLAIN de las más
+lentas. Con la muestra en 0 el middleware se retira al arrancar
+(MiddlewareNotUsed) y no agrega nada a las peticiones.
+
+Los parámetros de las consultas no se guardan ni llegan al plan: el EXPLAIN
+es GENERIC_PLAN (PostgreSQL 16) sobre el SQL con marcadores $1, $2, ..., así
+que en el admin no aparecen correos, códigos ni tokens. Es sin ANALYZE, así
+que no vuelve a ejecutar la consulta. Las consultas hechas al recorrer un
+StreamingHttpResponse ocurren después del middleware y quedan fuera.
+"""
+import logging
+import random
+import re
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError, connections
+
+from .models import PerfilPeticion
+
+logger = logging.getLogger(__name__)
+
+MAXIMO_REPETIDAS = 10
+MAXIMO_EXPLAIN = 3
+LONGITUD_SQL = 5000
+# Cada cuántos registros se recorta el búfer
+FRECUENCIA_RECORTE = 50
+
+_MARCADOR = re.compile(r'%[s%]')
+# `IN (%s, %s, %s)` y `VALUES (%s, %s), (%s, %s)` tienen la misma forma sin importar el tamaño
+_LISTA_PARAMETROS = re.compile(r'\((?:%s, )*%s\)')
+_TUPLAS_REPETIDAS = re.compile(r'(\([^()]*\))(?:, \1)+')
+
+
+def forma_consulta(sql):
+    """SQL con las listas de parámetros colapsadas, para agrupar consultas iguales."""
+    return _TUPLAS_REPETIDAS.sub(r'\1, ...', _LISTA_PARAMETROS.sub('(%s, ...)', sql))
+
+
+class _Registro:
+    """execute_wrapper que anota (sql, segundos) de todas las consultas y aparte las lentas."""
+
+    def __init__(self, lenta):
+        self.lenta = lenta
+        self.consultas = []
+        self.lentas = []
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.consultas.append((sql, segundos))
+            if segundos >= self.lenta and not many:
+                self.lentas.append((context['connection'].alias, sql, segundos))
+
+
+def _sql_generico(sql):
+    """Cambia los %s de Django por $1, $2, ... (y %% por %)."""
+    numeros = iter(range(1, sql.count('%s') + 1))
+    return _MARCADOR.sub(lambda m: '%' if m.group() == '%%' else f'${next(numeros)}', sql)
+
+
+def _explicar(alias, sql):
+    if not sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+        return ''
+    try:
+        with connections[alias].cursor() as cursor:
+            # Sin parámetros: el plan no incluye los valores de la petición
+            cursor.execute('EXPLAIN (GENERIC_PLAN) ' + _sql_generico(sql))
+            return '\n'.join(fila[0] for fila in cursor.fetchall())
+    except DatabaseError as e:
+        return f"EXPLAIN no disponible: {e}"
+
+
+def _repetidas(consultas):
+    formas = {}
+    for sql, segundos in consultas:
+        forma = formas.setdefault(forma_consulta(sql), [0, 0.0])
+        forma[0] += 1
+        forma[1] += segundos
+    repetidas = [
+        {'sql': sql[:LONGITUD_SQL], 'veces': veces, 'ms': round(segundos * 1000, 2)}
+        for sql, (veces, segundos) in formas.items()
+        if veces >= settings.PERFILADO_SQL_REPETIDAS
+    ]
+    repetidas.sort(key=lambda forma: -forma['veces'])
+    return repetidas[:MAXIMO_REPETIDAS]
+
+
+def guardar_perfil(request, respuesta, registro, segundos):
+    """Guarda el perfil de la petición y recorta el búfer a PERFILADO_SQL_MAXIMO."""
+    lentas = sorted(registro.lentas, key=lambda consulta: -consulta[2])[:MAXIMO_EXPLAIN]
+    repetidas = _repetidas(registro.consultas)
+    perfil = PerfilPeticion.objects.create(
+        metodo=request.method,
+        ruta=request.get_full_path()[:500],
+        estado=respuesta.status_code,
+        consultas=len(registro.consultas),
+        tiempo_bd_ms=round(sum(s for _, s in registro.consultas) * 1000, 2),
+        tiempo_total_ms=round(segundos * 1000, 2),
+        repetidas=repetidas,
+        lentas=[
+            {'sql': sql[:LONGITUD_SQL], 'ms': round(s * 1000, 2), 'plan': _explicar(alias, sql)}
+            for alias, sql, s in lentas
+        ],
+        posible_n_mas_1=bool(repetidas),
+    )
+    if perfil.pk % FRECUENCIA_RECORTE == 0:
+        PerfilPeticion.objects.filter(pk__lte=perfil.pk - settings.PERFILADO_SQL_MAXIMO).delete()
+
+
+class PerfiladoSQLMiddleware:
+    def __init__(self, get_response):
+        if not settings.PERFILADO_SQL_MUESTRA:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.excluidas = ('/' + settings.STATIC_URL.lstrip('/'), '/salud/')
+
+    def __call__(self, request):
+        if random.random() >= settings.PERFILADO_SQL_MUESTRA or request.path.startswith(self.excluidas):
+            return self.get_response(request)
+
+        registro = _Registro(settings.PERFILADO_SQL_LENTA_MS / 1000)
+        inicio = time.perf_counter()
+        with ExitStack() as pila:
+            for alias in connections:
+                pila.enter_context(connections[alias].execute_wrapper(registro))
+            respuesta = self.get_response(request)
+        segundos = time.perf_counter() - inicio
+
+        # El perfilado nunca debe tumbar la petición
+        try:
+            guardar_perfil(request, respuesta, registro, segundos)
+        except DatabaseError:
+            logger.exception("No se pudo guardar el perfil SQL de %s", request.path)
+        return respuesta
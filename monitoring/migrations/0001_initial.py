@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerfilPeticion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateTimeField(auto_now_add=True, verbose_name='FECHA')),
+                ('metodo', models.CharField(max_length=10, verbose_name='MÉTODO')),
+                ('ruta', models.CharField(max_length=500, verbose_name='RUTA')),
+                ('estado', models.PositiveSmallIntegerField(verbose_name='ESTADO HTTP')),
+                ('consultas', models.PositiveIntegerField(verbose_name='CONSULTAS')),
+                ('tiempo_bd_ms', models.FloatField(verbose_name='TIEMPO EN BD (ms)')),
+                ('tiempo_total_ms', models.FloatField(verbose_name='TIEMPO TOTAL (ms)')),
+                ('repetidas', models.JSONField(default=list, verbose_name='CONSULTAS REPETIDAS')),
+                ('lentas', models.JSONField(default=list, verbose_name='CONSULTAS LENTAS')),
+                ('posible_n_mas_1', models.BooleanField(default=False, verbose_name='POSIBLE N+1')),
+            ],
+            options={
+                'verbose_name': 'Perfil de Petición',
+                'verbose_name_plural': 'Perfiles de Peticiones',
+                'ordering': ['-id'],
+            },
+        ),
+    ]
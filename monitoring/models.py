@@ -0,0 +1,31 @@
+from django.db import models
+
+# ====================================================================
+# 1. Perfil de petición (búfer circular del perfilado SQL)
+# ====================================================================
+
+class PerfilPeticion(models.Model):
+    """
+    Consultas SQL de una petición muestreada por monitoring.middleware. Solo
+    se conservan los últimos PERFILADO_SQL_MAXIMO registros.
+    """
+    fecha = models.DateTimeField(auto_now_add=True, verbose_name="FECHA")
+    metodo = models.CharField(max_length=10, verbose_name="MÉTODO")
+    ruta = models.CharField(max_length=500, verbose_name="RUTA")
+    estado = models.PositiveSmallIntegerField(verbose_name="ESTADO HTTP")
+    consultas = models.PositiveIntegerField(verbose_name="CONSULTAS")
+    tiempo_bd_ms = models.FloatField(verbose_name="TIEMPO EN BD (ms)")
+    tiempo_total_ms = models.FloatField(verbose_name="TIEMPO TOTAL (ms)")
+    # [{'sql', 'veces', 'ms'}] de las consultas con la misma forma repetidas
+    repetidas = models.JSONField(default=list, verbose_name="CONSULTAS REPETIDAS")
+    # [{'sql', 'ms', 'plan'}] de las consultas lentas, con su EXPLAIN
+    lentas = models.JSONField(default=list, verbose_name="CONSULTAS LENTAS")
+    posible_n_mas_1 = models.BooleanField(default=False, verbose_name="POSIBLE N+1")
+
+    class Meta:
+        verbose_name = "Perfil de Petición"
+        verbose_name_plural = "Perfiles de Peticiones"
+        ordering = ['-id']
+
+    def __str__(self):
+        return f"{self.metodo} {self.ruta} ({self.consultas} consultas)"
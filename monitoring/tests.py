@@ -0,0 +1,48 @@
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from people.models import Alumno
+from .middleware import _Registro, _sql_generico, guardar_perfil
+from .models import PerfilPeticion
+
+
+@override_settings(PERFILADO_SQL_REPETIDAS=3, PERFILADO_SQL_MAXIMO=1000)
+class PerfiladoSQLTests(TestCase):
+    """monitoring.middleware: lo que se guarda de una petición perfilada."""
+
+    def _perfilar(self, consultas):
+        registro = _Registro(lenta=0)
+        with connection.execute_wrapper(registro):
+            consultas()
+        guardar_perfil(RequestFactory().get('/admin/'), HttpResponse(), registro, 0.1)
+        return PerfilPeticion.objects.get()
+
+    def test_el_plan_no_incluye_los_parametros(self):
+        perfil = self._perfilar(lambda: list(Alumno.objects.filter(
+            correo_electronico='SECRETO@ALUMNOS.UDG.MX', nombre_completo__icontains='PÉREZ',
+        )))
+
+        plan = perfil.lentas[0]['plan']
+        self.assertIn('$1', plan)
+        self.assertNotIn('SECRETO', str(perfil.lentas))
+        self.assertNotIn('PÉREZ', str(perfil.lentas))
+
+    def test_detecta_consultas_repetidas(self):
+        Alumno.objects.bulk_create([
+            Alumno(codigo_estudiante=f'20000000{i}', nombre_completo=f'ALUMNO {i}') for i in range(4)
+        ])
+
+        perfil = self._perfilar(lambda: [
+            Alumno.objects.filter(pk=f'20000000{i}').first() for i in range(4)
+        ])
+
+        self.assertTrue(perfil.posible_n_mas_1)
+        self.assertEqual(perfil.repetidas[0]['veces'], 4)
+        self.assertEqual(perfil.consultas, 4)
+
+    def test_sql_generico(self):
+        self.assertEqual(
+            _sql_generico("SELECT 1 WHERE a = %s AND b LIKE 'x%%' AND c IN (%s, %s)"),
+            "SELECT 1 WHERE a = $1 AND b LIKE 'x%' AND c IN ($2, $3)",
+        )
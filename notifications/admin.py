@@ -0,0 +1,28 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Correo
+
+
+@admin.register(Correo)
+class CorreoAdmin(admin.ModelAdmin):
+    """
+    Consulta de la bandeja de salida. Los correos solo se crean desde la cola.
+    """
+    list_display = ('asunto', 'estado', 'intentos', 'fecha_creacion', 'siguiente_intento', 'fecha_envio')
+    list_filter = ('estado',)
+    search_fields = ('asunto',)
+    readonly_fields = (
+        'asunto', 'mensaje', 'remitente', 'destinatarios', 'estado', 'intentos',
+        'siguiente_intento', 'ultimo_error', 'fecha_creacion', 'fecha_envio',
+    )
+    actions = ['reintentar']
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description="Reintentar envío de los correos seleccionados")
+    def reintentar(self, request, queryset):
+        total = queryset.exclude(estado__in=['ENVIADO', 'ENVIANDO']).update(
+            estado='PENDIENTE', intentos=0, siguiente_intento=timezone.now()
+        )
+        self.message_user(request, f"🔁 {total} correos devueltos a la cola.")
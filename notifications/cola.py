@@ -0,0 +1,152 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Correo
+
+
+# ====================================================================
+# Encolado
+# ====================================================================
+
+def encolar(asunto, mensaje, destinatarios, remitente=None):
+    """Guarda un correo en la bandeja de salida y regresa inmediatamente."""
+    return Correo.objects.create(
+        asunto=asunto,
+        mensaje=mensaje,
+        remitente=remitente,
+        destinatarios=list(destinatarios),
+    )
+
+
+# ====================================================================
+# Envío por lotes
+# ====================================================================
+
+def _como_email(correo, conexion):
+    return EmailMessage(
+        subject=correo.asunto,
+        body=correo.mensaje,
+        from_email=correo.remitente,
+        to=correo.destinatarios,
+        connection=conexion,
+    )
+
+
+def _registrar_fallo(correo, error, ahora):
+    correo.intentos += 1
+    correo.ultimo_error = str(error)
+    if correo.intentos >= settings.CORREO_MAX_INTENTOS:
+        correo.estado = 'FALLIDO'
+    else:
+        # Espera exponencial: base, 2·base, 4·base, ...
+        espera = settings.CORREO_ESPERA_BASE * 2 ** (correo.intentos - 1)
+        correo.estado = 'PENDIENTE'
+        correo.siguiente_intento = ahora + timedelta(seconds=espera)
+
+
+def _enviar_lote(lote, conexion, ahora, al_terminar=None):
+    """
+    Envía los correos de `lote` por una misma conexión y actualiza su estado
+    en memoria; `al_terminar(correo)` se llama en cuanto cada uno queda
+    enviado o fallido. Regresa una tupla (enviados, fallidos).
+    """
+    al_terminar = al_terminar or (lambda correo: None)
+    enviados = fallidos = 0
+    try:
+        conexion.open()
+    except Exception as e:
+        for correo in lote:
+            _registrar_fallo(correo, e, ahora)
+            al_terminar(correo)
+        return 0, len(lote)
+
+    try:
+        for correo in lote:
+            try:
+                conexion.send_messages([_como_email(correo, conexion)])
+            except Exception as e:
+                _registrar_fallo(correo, e, ahora)
+                fallidos += 1
+                # Se descarta la sesión; el siguiente mensaje abre una nueva
+                conexion.close()
+            else:
+                correo.estado = 'ENVIADO'
+                correo.intentos += 1
+                correo.ultimo_error = ''
+                correo.fecha_envio = timezone.now()
+                enviados += 1
+            al_terminar(correo)
+    finally:
+        conexion.close()
+
+    return enviados, fallidos
+
+
+CAMPOS_ENVIO = ['estado', 'intentos', 'siguiente_intento', 'ultimo_error', 'fecha_envio']
+
+
+def _reservar_lote(limite, ahora):
+    """
+    Marca como ENVIANDO hasta `limite` correos listos y los regresa. La
+    reserva vence en CORREO_RESERVA segundos (en `siguiente_intento`): si el
+    proceso que la tomó muere, otro vuelve a tomar los correos que no
+    alcanzó a marcar. La transacción solo dura lo que el UPDATE.
+    """
+    with transaction.atomic():
+        lote = list(
+            Correo.objects.select_for_update(skip_locked=True)
+            .filter(estado__in=['PENDIENTE', 'ENVIANDO'], siguiente_intento__lte=ahora)
+            .order_by('siguiente_intento')[:limite]
+        )
+        vence = ahora + timedelta(seconds=settings.CORREO_RESERVA)
+        Correo.objects.filter(pk__in=[correo.pk for correo in lote]).update(
+            estado='ENVIANDO', siguiente_intento=vence,
+        )
+    return lote
+
+
+def enviar_pendientes(limite=None, conexion=None):
+    """
+    Envía un lote de correos pendientes usando una sola conexión.
+
+    El lote se reserva en una transacción corta (SKIP LOCKED, estado
+    ENVIANDO), así que varios procesos pueden vaciar la cola a la vez sin
+    tomar el mismo mensaje. El envío ocurre fuera de la transacción y el
+    estado de cada correo se guarda en cuanto termina, de modo que si el
+    proceso muere solo se reenvía el mensaje que estaba en curso.
+    Regresa una tupla (enviados, fallidos).
+    """
+    limite = limite or settings.CORREO_LOTE
+    ahora = timezone.now()
+
+    lote = _reservar_lote(limite, ahora)
+    if not lote:
+        return 0, 0
+
+    return _enviar_lote(
+        lote, conexion or get_connection(), ahora,
+        al_terminar=lambda correo: correo.save(update_fields=CAMPOS_ENVIO),
+    )
+
+
+def enviar_ahora(mensajes, remitente=None, conexion=None):
+    """
+    Envía de inmediato una lista de (asunto, mensaje, destinatarios) por una
+    sola conexión. Todos quedan registrados en la bandeja de salida; los que
+    fallan se reintentan después con `enviar_pendientes`.
+    Regresa una tupla (enviados, fallidos).
+    """
+    lote = [
+        Correo(asunto=asunto, mensaje=mensaje, remitente=remitente, destinatarios=list(destinatarios))
+        for asunto, mensaje, destinatarios in mensajes
+    ]
+    if not lote:
+        return 0, 0
+
+    enviados, fallidos = _enviar_lote(lote, conexion or get_connection(), timezone.now())
+    Correo.objects.bulk_create(lote)
+    return enviados, fallidos
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notifications.cola import enviar_pendientes
+
+
+class Command(BaseCommand):
+    help = "Envía los correos pendientes de la bandeja de salida."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, help="Correos por lote (por defecto CORREO_LOTE).")
+        parser.add_argument('--continuo', action='store_true', help="Sigue revisando la cola indefinidamente.")
+        parser.add_argument('--intervalo', type=float, default=10, help="Segundos de espera cuando la cola está vacía.")
+
+    def handle(self, *args, **options):
+        while True:
+            enviados, fallidos = enviar_pendientes(limite=options['lote'])
+            if enviados or fallidos:
+                self.stdout.write(f"{enviados} enviados, {fallidos} fallidos.")
+                continue
+
+            # Cola vacía
+            if not options['continuo']:
+                break
+            time.sleep(options['intervalo'])
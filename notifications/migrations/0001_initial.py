@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Correo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asunto', models.CharField(max_length=255, verbose_name='ASUNTO')),
+                ('mensaje', models.TextField(verbose_name='MENSAJE')),
+                ('remitente', models.CharField(blank=True, max_length=254, null=True, verbose_name='REMITENTE')),
+                ('destinatarios', models.JSONField(default=list, verbose_name='DESTINATARIOS')),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('ENVIADO', 'Enviado'), ('FALLIDO', 'Fallido')], default='PENDIENTE', max_length=10, verbose_name='ESTADO')),
+                ('intentos', models.PositiveSmallIntegerField(default=0, verbose_name='INTENTOS')),
+                ('siguiente_intento', models.DateTimeField(default=django.utils.timezone.now, verbose_name='SIGUIENTE INTENTO')),
+                ('ultimo_error', models.TextField(blank=True, default='', verbose_name='ÚLTIMO ERROR')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='FECHA DE CREACIÓN')),
+                ('fecha_envio', models.DateTimeField(blank=True, null=True, verbose_name='FECHA DE ENVÍO')),
+            ],
+            options={
+                'verbose_name': 'Correo',
+                'verbose_name_plural': 'Bandeja de Salida',
+                'ordering': ['-fecha_creacion'],
+                'indexes': [models.Index(fields=['estado', 'siguiente_intento'], name='correo_estado_intento_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils import timezone
+
+# ====================================================================
+# 1. Correo (Bandeja de salida)
+# ====================================================================
+
+class Correo(models.Model):
+    """
+    Mensaje en la bandeja de salida. Las vistas solo encolan; el comando
+    `enviar_correos` los envía por lotes reutilizando una conexión SMTP.
+    """
+    ESTADO_CHOICES = [
+        ('PENDIENTE', 'Pendiente'),
+        ('ENVIANDO', 'Enviando'),
+        ('ENVIADO', 'Enviado'),
+        ('FALLIDO', 'Fallido'),
+    ]
+
+    asunto = models.CharField(max_length=255, verbose_name="ASUNTO")
+    mensaje = models.TextField(verbose_name="MENSAJE")
+    remitente = models.CharField(max_length=254, null=True, blank=True, verbose_name="REMITENTE")
+    destinatarios = models.JSONField(default=list, verbose_name="DESTINATARIOS")
+    estado = models.CharField(max_length=10, choices=ESTADO_CHOICES, default='PENDIENTE', verbose_name="ESTADO")
+    intentos = models.PositiveSmallIntegerField(default=0, verbose_name="INTENTOS")
+    siguiente_intento = models.DateTimeField(default=timezone.now, verbose_name="SIGUIENTE INTENTO")
+    ultimo_error = models.TextField(blank=True, default='', verbose_name="ÚLTIMO ERROR")
+    fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="FECHA DE CREACIÓN")
+    fecha_envio = models.DateTimeField(null=True, blank=True, verbose_name="FECHA DE ENVÍO")
+
+    class Meta:
+        verbose_name = "Correo"
+        verbose_name_plural = "Bandeja de Salida"
+        ordering = ['-fecha_creacion']
+        indexes = [
+            models.Index(fields=['estado', 'siguiente_intento'], name='correo_estado_intento_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.asunto} ({self.estado})"
@@ -0,0 +1,148 @@
+from datetime import timedelta
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .cola import encolar, enviar_ahora, enviar_pendientes
+from .models import Correo
+
+
+class ConexionPrueba(EmailBackend):
+    """
+    Backend locmem que cuenta las conexiones abiertas, falla con los
+    destinatarios de `rechazados` y anota cómo se veía la cola al enviar.
+    """
+
+    def __init__(self, rechazados=(), falla_al_abrir=False, **kwargs):
+        super().__init__(**kwargs)
+        self.rechazados = set(rechazados)
+        self.falla_al_abrir = falla_al_abrir
+        self.aperturas = 0
+        self.observado = []
+
+    def open(self):
+        if self.falla_al_abrir:
+            raise ConnectionRefusedError("sin servidor")
+        self.aperturas += 1
+        return True
+
+    def send_messages(self, mensajes):
+        for mensaje in mensajes:
+            self.observado.append((
+                connection.in_atomic_block,
+                # enviar_ahora guarda los correos después de enviarlos
+                Correo.objects.filter(asunto=mensaje.subject).values_list('estado', flat=True).first(),
+            ))
+            if self.rechazados & set(mensaje.to):
+                raise OSError(f"rechazado: {mensaje.to}")
+        return super().send_messages(mensajes)
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    CORREO_LOTE=100, CORREO_MAX_INTENTOS=3, CORREO_ESPERA_BASE=60, CORREO_RESERVA=600,
+)
+class ColaCorreosTests(TransactionTestCase):
+    """notifications.cola con el backend en memoria (requiere PostgreSQL por SKIP LOCKED)."""
+
+    def _encolar(self, *destinatarios):
+        return [
+            encolar(f"Aviso {i}", "Mensaje", [destinatario])
+            for i, destinatario in enumerate(destinatarios)
+        ]
+
+    def test_envia_el_lote_por_una_sola_conexion(self):
+        self._encolar('a@sigap.mx', 'b@sigap.mx', 'c@sigap.mx')
+        conexion = ConexionPrueba()
+
+        self.assertEqual(enviar_pendientes(conexion=conexion), (3, 0))
+
+        self.assertEqual(conexion.aperturas, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(
+            set(Correo.objects.values_list('estado', 'intentos')), {('ENVIADO', 1)},
+        )
+        self.assertFalse(Correo.objects.filter(fecha_envio__isnull=True).exists())
+        # Nada queda pendiente
+        self.assertEqual(enviar_pendientes(conexion=ConexionPrueba()), (0, 0))
+
+    def test_envia_fuera_de_la_transaccion_con_el_lote_reservado(self):
+        self._encolar('a@sigap.mx', 'b@sigap.mx')
+        conexion = ConexionPrueba()
+
+        enviar_pendientes(conexion=conexion)
+
+        self.assertEqual(conexion.observado, [(False, 'ENVIANDO'), (False, 'ENVIANDO')])
+
+    def test_reintenta_con_espera_exponencial(self):
+        correo, = self._encolar('malo@sigap.mx')
+
+        esperas = []
+        for intento in range(1, 4):
+            antes = timezone.now()
+            self.assertEqual(enviar_pendientes(conexion=ConexionPrueba(['malo@sigap.mx'])), (0, 1))
+            correo.refresh_from_db()
+            self.assertEqual(correo.intentos, intento)
+            self.assertIn('rechazado', correo.ultimo_error)
+            esperas.append(correo.siguiente_intento - antes)
+            # Antes de la espera no se vuelve a intentar
+            self.assertEqual(enviar_pendientes(conexion=ConexionPrueba()), (0, 0))
+            Correo.objects.filter(pk=correo.pk).update(siguiente_intento=timezone.now())
+
+        self.assertEqual(correo.estado, 'FALLIDO')
+        self.assertAlmostEqual(esperas[0].total_seconds(), 60, delta=5)
+        self.assertAlmostEqual(esperas[1].total_seconds(), 120, delta=5)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_un_fallo_no_detiene_el_resto_del_lote(self):
+        self._encolar('a@sigap.mx', 'malo@sigap.mx', 'c@sigap.mx')
+
+        self.assertEqual(enviar_pendientes(conexion=ConexionPrueba(['malo@sigap.mx'])), (2, 1))
+
+        self.assertEqual(
+            dict(Correo.objects.values_list('destinatarios__0', 'estado')),
+            {'a@sigap.mx': 'ENVIADO', 'malo@sigap.mx': 'PENDIENTE', 'c@sigap.mx': 'ENVIADO'},
+        )
+
+    def test_sin_conexion_todo_el_lote_se_reintenta(self):
+        self._encolar('a@sigap.mx', 'b@sigap.mx')
+
+        self.assertEqual(enviar_pendientes(conexion=ConexionPrueba(falla_al_abrir=True)), (0, 2))
+
+        self.assertEqual(
+            set(Correo.objects.values_list('estado', 'intentos')), {('PENDIENTE', 1)},
+        )
+
+    def test_reserva_vencida_se_vuelve_a_tomar(self):
+        vigente, vencido = self._encolar('a@sigap.mx', 'b@sigap.mx')
+        # Dos procesos que murieron a media entrega: uno hace poco, otro hace mucho
+        Correo.objects.filter(pk=vigente.pk).update(
+            estado='ENVIANDO', siguiente_intento=timezone.now() + timedelta(minutes=5),
+        )
+        Correo.objects.filter(pk=vencido.pk).update(
+            estado='ENVIANDO', siguiente_intento=timezone.now() - timedelta(seconds=1),
+        )
+
+        self.assertEqual(enviar_pendientes(conexion=ConexionPrueba()), (1, 0))
+
+        self.assertEqual(mail.outbox[0].to, ['b@sigap.mx'])
+        vigente.refresh_from_db()
+        self.assertEqual(vigente.estado, 'ENVIANDO')
+
+    def test_enviar_ahora_registra_los_fallidos_para_reintentar(self):
+        conexion = ConexionPrueba(['malo@sigap.mx'])
+
+        resultado = enviar_ahora(
+            [("Uno", "Mensaje", ['a@sigap.mx']), ("Dos", "Mensaje", ['malo@sigap.mx'])],
+            conexion=conexion,
+        )
+
+        self.assertEqual(resultado, (1, 1))
+        self.assertEqual(conexion.aperturas, 1)
+        self.assertEqual(
+            dict(Correo.objects.values_list('asunto', 'estado')), {'Uno': 'ENVIADO', 'Dos': 'PENDIENTE'},
+        )
+
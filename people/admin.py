@@ -1,27 +1,139 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.template.response import TemplateResponse
+from django.urls import path
+from .autocompletado import AutocompletarPersonasView, nombre_url
+from .busqueda import buscar_personas
+from .importacion import PADRONES, importar_padron, leer_archivo
 from .models import Alumno, Asesor, Evaluador
 
+
+# --- Importación de padrones (CSV / XLSX) ---
+
+class ImportarPadronForm(forms.Form):
+    archivo = forms.FileField(label="ARCHIVO CSV O XLSX")
+
+
+class ImportarPadronMixin:
+    """
+    Agrega al changelist un botón para importar el padrón desde un archivo.
+    """
+    change_list_template = 'admin/people/change_list_importar.html'
+    tipo_padron = None
+
+    def get_urls(self):
+        urls = super().get_urls()
+        opts = self.model._meta
+        custom_urls = [
+            path(
+                'importar/',
+                self.admin_site.admin_view(self.importar_view),
+                name=f'{opts.app_label}_{opts.model_name}_importar',
+            ),
+        ]
+        return custom_urls + urls
+
+    def importar_view(self, request):
+        if not (self.has_add_permission(request) and self.has_change_permission(request)):
+            raise PermissionDenied
+
+        resultado = None
+        form = ImportarPadronForm(request.POST or None, request.FILES or None)
+        padron = PADRONES[self.tipo_padron]
+        if request.method == 'POST' and form.is_valid():
+            archivo = form.cleaned_data['archivo']
+            try:
+                # Codificación, formato y encabezado se validan antes de escribir
+                filas = leer_archivo(archivo, archivo.name, padron.columnas)
+            except ValidationError as e:
+                form.add_error('archivo', e)
+            else:
+                resultado = importar_padron(self.tipo_padron, filas)
+                nivel = messages.WARNING if resultado.errores or resultado.repetidos else messages.SUCCESS
+                self.message_user(
+                    request,
+                    f"📥 {resultado.importados} de {resultado.total} filas importadas "
+                    f"({len(resultado.errores)} con errores, {len(resultado.repetidos)} con código repetido) "
+                    f"— {resultado.filas_por_segundo:.0f} filas/s.",
+                    level=nivel,
+                )
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': f"Importar {self.model._meta.verbose_name_plural}",
+            'form': form,
+            'resultado': resultado,
+            'columnas': ', '.join(padron.columnas),
+        }
+        return TemplateResponse(request, 'admin/people/importar_padron.html', context)
+
+
+# --- Búsqueda sin acentos por similitud (pg_trgm) ---
+
+class ChangeListPorSimilitud(ChangeList):
+    """Al buscar, ordena por similitud salvo que se elija otra columna."""
+
+    def get_ordering(self, request, queryset):
+        if 'similitud' in queryset.query.annotations and ORDER_VAR not in self.params:
+            return ['-similitud', self.lookup_opts.pk.name]
+        return super().get_ordering(request, queryset)
+
+
+class BusquedaPersonasMixin:
+    """
+    Búsqueda por prefijo de código y por similitud de nombre / correo, sin
+    acentos. La usan también los autocompletados que apuntan a estos modelos,
+    a través del endpoint con caché de people.autocompletado.
+    """
+    campos_similitud = ()
+    autocompletado_con_cache = True
+
+    def get_urls(self):
+        urls = super().get_urls()
+        vista = AutocompletarPersonasView.as_view(admin_site=self.admin_site)
+        custom_urls = [
+            path('autocompletar/', self.admin_site.admin_view(vista, cacheable=True), name=nombre_url(self.model)),
+        ]
+        return custom_urls + urls
+
+    def get_search_results(self, request, queryset, search_term):
+        codigo = self.model._meta.pk.name
+        return buscar_personas(queryset, search_term, codigo, self.campos_similitud), False
+
+    def get_changelist(self, request, **kwargs):
+        return ChangeListPorSimilitud
+
+
 @admin.register(Alumno)
-class AlumnoAdmin(admin.ModelAdmin):
+class AlumnoAdmin(BusquedaPersonasMixin, ImportarPadronMixin, admin.ModelAdmin):
     """
     Configuración del admin para el modelo Alumno.
     """
     list_display = ('codigo_estudiante', 'nombre_completo', 'correo_electronico')
     search_fields = ('codigo_estudiante', 'nombre_completo', 'correo_electronico')
+    campos_similitud = ('nombre_completo', 'correo_electronico')
+    tipo_padron = 'alumnos'
 
 @admin.register(Asesor)
-class AsesorAdmin(admin.ModelAdmin):
+class AsesorAdmin(BusquedaPersonasMixin, ImportarPadronMixin, admin.ModelAdmin):
     """
     Configuración del admin para el modelo Asesor.
     """
     list_display = ('codigo_asesor', 'nombre_completo', 'correo_electronico')
     search_fields = ('codigo_asesor', 'nombre_completo', 'correo_electronico')
+    campos_similitud = ('nombre_completo', 'correo_electronico')
+    tipo_padron = 'asesores'
 
 @admin.register(Evaluador)
-class EvaluadorAdmin(admin.ModelAdmin):
+class EvaluadorAdmin(BusquedaPersonasMixin, ImportarPadronMixin, admin.ModelAdmin):
     """
     Configuración del admin para el modelo Evaluador.
     """
     list_display = ('codigo_evaluador', 'nombre_completo', 'correo_evaluador', 'especializacion')
     search_fields = ('codigo_evaluador', 'nombre_completo', 'correo_evaluador')
     list_filter = ('especializacion',)
+    campos_similitud = ('nombre_completo', 'correo_evaluador')
+    tipo_padron = 'evaluadores'
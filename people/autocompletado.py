@@ -0,0 +1,107 @@
+"""
+Autocompletado de personas para los formularios del admin.
+
+Los select de Alumno / Asesor / Evaluador con todas las filas vuelven el
+formulario de proyecto tan pesado como el padrón. Con `autocomplete_fields`
+el formulario solo lleva las opciones ya elegidas y el resto se consulta por
+AJAX a un endpoint por modelo (`<app>_<modelo>_autocompletar`):
+
+- Busca con BusquedaPersonasMixin: prefijo del código (índice de la llave
+  primaria) y similitud de trigramas sin acentos (índices GIN).
+- Pagina con LIMIT/OFFSET pidiendo una fila de más, sin COUNT(*).
+- Guarda cada página en la caché AUTOCOMPLETADO_CACHE_SEGUNDOS, con el
+  término normalizado en la llave ("josé" y "JOSE" comparten entrada). Los
+  permisos se revisan en cada petición, antes de leer la caché.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+
+from .busqueda import normalizar
+
+
+def nombre_url(modelo):
+    opts = modelo._meta
+    return f'{opts.app_label}_{opts.model_name}_autocompletar'
+
+
+class AutocompletarPersonasView(AutocompleteJsonView):
+    """AutocompleteJsonView con caché por término y página, y sin COUNT(*)."""
+
+    def get(self, request, *args, **kwargs):
+        self.term, self.model_admin, self.source_field, to_field_name = self.process_request(request)
+        if not self.has_perm(request):
+            raise PermissionDenied
+
+        try:
+            pagina = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            pagina = 1
+        segundos = settings.AUTOCOMPLETADO_CACHE_SEGUNDOS
+        clave = self.clave_cache(to_field_name, pagina)
+
+        datos = cache.get(clave) if segundos else None
+        if datos is None:
+            datos = self.pagina(to_field_name, pagina)
+            if segundos:
+                cache.set(clave, datos, segundos)
+
+        respuesta = JsonResponse(datos)
+        if segundos:
+            patch_cache_control(respuesta, private=True, max_age=segundos)
+        return respuesta
+
+    def clave_cache(self, to_field_name, pagina):
+        origen = self.source_field
+        termino = hashlib.md5(normalizar(self.term).encode()).hexdigest()
+        return (
+            f'autocompletar:{origen.model._meta.label_lower}.{origen.name}:'
+            f'{to_field_name}:{pagina}:{termino}'
+        )
+
+    def pagina(self, to_field_name, pagina):
+        queryset = self.get_queryset()
+        if not queryset.ordered:
+            queryset = queryset.order_by(self.model_admin.model._meta.pk.name)
+        inicio = (pagina - 1) * self.paginate_by
+        # Una fila de más indica si hay otra página
+        filas = list(queryset[inicio:inicio + self.paginate_by + 1])
+        return {
+            'results': [self.serialize_result(obj, to_field_name) for obj in filas[:self.paginate_by]],
+            'pagination': {'more': len(filas) > self.paginate_by},
+        }
+
+
+class AutocompletarPersonasSelect(AutocompleteSelect):
+    """Widget de autocompletado que consulta el endpoint con caché del modelo."""
+
+    def get_url(self):
+        modelo = self.field.remote_field.model
+        return reverse(f'{self.admin_site.name}:{nombre_url(modelo)}')
+
+
+class AutocompletadoPersonasMixin:
+    """
+    Para ModelAdmin e inlines: los campos de `autocomplete_fields` que
+    apuntan a un modelo registrado con BusquedaPersonasMixin usan el endpoint
+    con caché en lugar del autocompletado general del admin.
+    """
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        admin_destino = self.admin_site._registry.get(db_field.remote_field.model)
+        if (
+            'widget' not in kwargs
+            and db_field.name in self.get_autocomplete_fields(request)
+            and getattr(admin_destino, 'autocompletado_con_cache', False)
+        ):
+            kwargs['widget'] = AutocompletarPersonasSelect(
+                db_field, self.admin_site, using=kwargs.get('using'),
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -0,0 +1,50 @@
+"""
+Búsqueda de personas sin acentos y tolerante a errores (pg_trgm + unaccent).
+
+Los nombres se guardan en mayúsculas y con acentos ("JOSÉ PÉREZ"). Las
+columnas de texto tienen índices GIN de trigramas sobre `sigap_unaccent(col)`,
+una versión IMMUTABLE de unaccent() creada en la migración 0002.
+"""
+import unicodedata
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import F, Func, Q, TextField
+from django.db.models.functions import Greatest
+
+
+class SinAcentos(Func):
+    """Quita los acentos en la base de datos; coincide con los índices de trigramas."""
+    function = 'sigap_unaccent'
+    output_field = TextField()
+
+
+def normalizar(texto):
+    """Mayúsculas y sin acentos, igual que SinAcentos sobre los datos guardados."""
+    texto = unicodedata.normalize('NFKD', texto.strip().upper())
+    return ''.join(c for c in texto if not unicodedata.combining(c))
+
+
+def buscar_personas(queryset, termino, campo_codigo, campos):
+    """
+    Filtra por código (prefijo) o por coincidencia parcial / similitud de
+    trigramas en `campos`, y ordena del resultado más parecido al menos.
+    La similitud queda anotada como `similitud`.
+    """
+    termino = normalizar(termino)
+    if not termino:
+        return queryset
+
+    columnas = {f'{campo}_sin_acentos': SinAcentos(campo) for campo in campos}
+    filtro = Q(**{f'{campo_codigo}__startswith': termino})
+    for columna in columnas:
+        filtro |= Q(**{f'{columna}__contains': termino})
+        filtro |= Q(**{f'{columna}__trigram_word_similar': termino})
+
+    similitudes = [TrigramWordSimilarity(termino, F(columna)) for columna in columnas]
+    similitud = Greatest(*similitudes) if len(similitudes) > 1 else similitudes[0]
+
+    return (
+        queryset.annotate(**columnas, similitud=similitud)
+        .filter(filtro)
+        .order_by('-similitud', campo_codigo)
+    )
@@ -0,0 +1,226 @@
+import codecs
+import csv
+import time
+from dataclasses import dataclass, field
+
+from django.core.exceptions import ValidationError
+
+from .models import Alumno, Asesor, Evaluador
+from .signals import padron_importado
+
+# ====================================================================
+# Definición de los padrones importables
+# ====================================================================
+
+@dataclass(frozen=True)
+class Padron:
+    """Describe cómo se importa un modelo de personas desde un archivo."""
+    modelo: type
+    clave: str
+    campos: tuple
+
+    @property
+    def columnas(self):
+        return (self.clave,) + self.campos
+
+    def construir(self, fila):
+        """
+        Limpia y valida una fila y regresa la instancia sin guardar (los campos
+        la convierten a mayúsculas al escribir). Lanza ValidationError si la
+        fila es inválida.
+        """
+        datos = {}
+        errores = []
+        for nombre in self.columnas:
+            campo = self.modelo._meta.get_field(nombre)
+            valor = fila.get(nombre)
+            if valor is not None:
+                valor = str(valor).strip() or None
+            try:
+                datos[nombre] = campo.clean(valor, None)
+            except ValidationError as e:
+                errores.extend(f"{nombre}: {mensaje}" for mensaje in e.messages)
+        if errores:
+            raise ValidationError(errores)
+        return self.modelo(**datos)
+
+    def guardar(self, instancias):
+        """Inserta o actualiza un lote completo en una sola sentencia."""
+        self.modelo.objects.bulk_create(
+            instancias,
+            update_conflicts=True,
+            unique_fields=[self.clave],
+            update_fields=list(self.campos),
+        )
+        padron_importado.send(sender=self.modelo, claves=[i.pk for i in instancias])
+
+
+PADRONES = {
+    'alumnos': Padron(Alumno, 'codigo_estudiante', ('nombre_completo', 'correo_electronico')),
+    'asesores': Padron(Asesor, 'codigo_asesor', ('nombre_completo', 'correo_electronico')),
+    'evaluadores': Padron(Evaluador, 'codigo_evaluador', ('nombre_completo', 'correo_evaluador', 'especializacion')),
+}
+
+
+@dataclass
+class ResultadoImportacion:
+    """Resumen de una importación: conteos, errores por fila y velocidad."""
+    total: int = 0
+    importados: int = 0
+    errores: list = field(default_factory=list)
+    # (fila, fila anterior con el mismo código); se conserva la última
+    repetidos: list = field(default_factory=list)
+    segundos: float = 0.0
+
+    @property
+    def filas_por_segundo(self):
+        if not self.segundos:
+            return 0.0
+        return self.total / self.segundos
+
+
+# ====================================================================
+# Lectura de archivos (fila por fila, sin cargar todo en memoria)
+# ====================================================================
+
+# Excel guarda los CSV en cp1252 (Windows) salvo que se elija "CSV UTF-8";
+# si ninguna sirve queda latin-1, que acepta cualquier byte
+CODIFICACIONES_CSV = ('utf-8-sig', 'cp1252')
+_BLOQUE = 1 << 16
+
+
+def _normalizar_encabezado(encabezado):
+    return [str(columna or '').strip().lower() for columna in encabezado]
+
+
+def _validar_encabezado(encabezado, columnas):
+    faltantes = [columna for columna in columnas if columna not in encabezado]
+    if faltantes:
+        raise ValidationError(
+            f"Faltan columnas en el encabezado: {', '.join(faltantes)}. "
+            f"Se esperaban: {', '.join(columnas)}."
+        )
+
+
+def _detectar_codificacion(archivo):
+    """
+    Primera codificación de CODIFICACIONES_CSV con la que se decodifica el
+    archivo completo. Se revisa antes de escribir nada, por bloques.
+    """
+    for codificacion in CODIFICACIONES_CSV:
+        decodificador = codecs.getincrementaldecoder(codificacion)()
+        archivo.seek(0)
+        try:
+            for bloque in iter(lambda: archivo.read(_BLOQUE), b''):
+                decodificador.decode(bloque)
+            decodificador.decode(b'', final=True)
+        except UnicodeDecodeError:
+            continue
+        archivo.seek(0)
+        return codificacion
+    archivo.seek(0)
+    return 'latin-1'
+
+
+def leer_csv(archivo, columnas=()):
+    """
+    Itera las filas de un CSV (archivo binario) como diccionarios. La
+    codificación y el encabezado se validan al llamar, no al iterar.
+    """
+    lector = csv.reader(codecs.iterdecode(archivo, _detectar_codificacion(archivo)))
+    encabezado = _normalizar_encabezado(next(lector, []))
+    _validar_encabezado(encabezado, columnas)
+    return (dict(zip(encabezado, valores)) for valores in lector)
+
+
+def leer_xlsx(archivo, columnas=()):
+    """
+    Itera las filas de la primera hoja de un XLSX como diccionarios. El
+    archivo y el encabezado se validan al llamar, no al iterar.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError("Se requiere openpyxl para importar archivos XLSX.")
+
+    try:
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+        filas = libro.active.iter_rows(values_only=True)
+        encabezado = _normalizar_encabezado(next(filas, ()))
+    except Exception as e:
+        # BadZipFile, InvalidFileException, XML dañado...
+        raise ValidationError(f"El archivo no es un XLSX válido ({type(e).__name__}).")
+    try:
+        _validar_encabezado(encabezado, columnas)
+    except ValidationError:
+        libro.close()
+        raise
+
+    def iterar():
+        try:
+            for valores in filas:
+                yield dict(zip(encabezado, valores))
+        finally:
+            libro.close()
+
+    return iterar()
+
+
+def leer_archivo(archivo, nombre, columnas=()):
+    """
+    Elige el lector según la extensión del archivo. Lanza ValidationError
+    (antes de leer las filas) si el archivo no se puede leer o le falta
+    alguna de `columnas`.
+    """
+    if nombre.lower().endswith('.xlsx'):
+        return leer_xlsx(archivo, columnas)
+    return leer_csv(archivo, columnas)
+
+
+# ====================================================================
+# Importación por lotes
+# ====================================================================
+
+def importar_padron(tipo, filas, tamano_lote=1000):
+    """
+    Importa un padrón (alumnos, asesores o evaluadores) desde un iterable de
+    filas. Las filas válidas se escriben por lotes con bulk_create
+    (insertar o actualizar por código); las inválidas se reportan con su
+    número de fila, y los códigos repetidos en `repetidos`.
+    """
+    padron = PADRONES[tipo]
+    resultado = ResultadoImportacion()
+    inicio = time.perf_counter()
+    lote = {}
+    vistos = {}
+
+    # La fila 1 es el encabezado
+    for numero, fila in enumerate(filas, start=2):
+        if not any(fila.values()):
+            continue
+        resultado.total += 1
+        try:
+            instancia = padron.construir(fila)
+        except ValidationError as e:
+            resultado.errores.append((numero, '; '.join(e.messages)))
+            continue
+
+        # Un mismo código no puede repetirse dentro del INSERT ... ON CONFLICT;
+        # si el archivo lo repite, se conserva la última fila. El código se
+        # compara como se guardará ('e1' y 'E1' son el mismo).
+        clave = padron.modelo._meta.pk.get_prep_value(instancia.pk)
+        if clave in vistos:
+            resultado.repetidos.append((numero, vistos[clave]))
+        else:
+            resultado.importados += 1
+        vistos[clave] = numero
+        lote[clave] = instancia
+        if len(lote) >= tamano_lote:
+            padron.guardar(list(lote.values()))
+            lote = {}
+
+    if lote:
+        padron.guardar(list(lote.values()))
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
@@ -0,0 +1,51 @@
+import csv
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from people.importacion import PADRONES, importar_padron, leer_archivo
+
+
+class Command(BaseCommand):
+    help = "Importa un padrón de alumnos, asesores o evaluadores desde un archivo CSV o XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument('tipo', choices=sorted(PADRONES), help="Padrón a importar.")
+        parser.add_argument('archivo', help="Ruta del archivo CSV o XLSX.")
+        parser.add_argument('--lote', type=int, default=1000, help="Filas por lote de escritura.")
+        parser.add_argument('--errores', help="Guarda el reporte completo de errores en este CSV.")
+
+    def handle(self, *args, **options):
+        try:
+            archivo = open(options['archivo'], 'rb')
+        except OSError as e:
+            raise CommandError(f"No se pudo abrir el archivo: {e}")
+
+        with archivo:
+            try:
+                filas = leer_archivo(archivo, options['archivo'], PADRONES[options['tipo']].columnas)
+            except ValidationError as e:
+                raise CommandError(' '.join(e.messages))
+            resultado = importar_padron(options['tipo'], filas, tamano_lote=options['lote'])
+
+        for numero, mensaje in resultado.errores[:50]:
+            self.stderr.write(f"Fila {numero}: {mensaje}")
+        if len(resultado.errores) > 50:
+            self.stderr.write(f"... y {len(resultado.errores) - 50} errores más.")
+        for numero, anterior in resultado.repetidos[:50]:
+            self.stderr.write(f"Fila {numero}: código repetido (fila {anterior}); se conserva la última.")
+        if len(resultado.repetidos) > 50:
+            self.stderr.write(f"... y {len(resultado.repetidos) - 50} códigos repetidos más.")
+
+        if options['errores']:
+            with open(options['errores'], 'w', newline='', encoding='utf-8') as salida:
+                escritor = csv.writer(salida)
+                escritor.writerow(['fila', 'error'])
+                escritor.writerows(resultado.errores)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado.importados} de {resultado.total} filas importadas "
+            f"({len(resultado.errores)} con errores, {len(resultado.repetidos)} con código repetido) "
+            f"en {resultado.segundos:.2f} s "
+            f"— {resultado.filas_por_segundo:.0f} filas/s."
+        ))
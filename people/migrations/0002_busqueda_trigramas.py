@@ -0,0 +1,53 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+import django.contrib.postgres.indexes
+import people.busqueda
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+# unaccent() no es IMMUTABLE y no se puede indexar; esta envoltura fija el
+# diccionario para que sí lo sea (ver people.busqueda.SinAcentos).
+CREAR_SIGAP_UNACCENT = """
+CREATE OR REPLACE FUNCTION sigap_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+"""
+
+BORRAR_SIGAP_UNACCENT = "DROP FUNCTION IF EXISTS sigap_unaccent(text);"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunSQL(CREAR_SIGAP_UNACCENT, BORRAR_SIGAP_UNACCENT),
+        migrations.AddIndex(
+            model_name='alumno',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('nombre_completo'), name='gin_trgm_ops'), name='alumno_nombre_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='alumno',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('correo_electronico'), name='gin_trgm_ops'), name='alumno_correo_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='asesor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('nombre_completo'), name='gin_trgm_ops'), name='asesor_nombre_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='asesor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('correo_electronico'), name='gin_trgm_ops'), name='asesor_correo_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluador',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('nombre_completo'), name='gin_trgm_ops'), name='evaluador_nombre_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='evaluador',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(people.busqueda.SinAcentos('correo_evaluador'), name='gin_trgm_ops'), name='evaluador_correo_trgm'),
+        ),
+    ]
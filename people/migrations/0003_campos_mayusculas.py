@@ -0,0 +1,74 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:10
+
+import SIGAP.fields
+from django.db import migrations
+
+from SIGAP.fields import mayusculas_por_lotes
+
+
+def convertir_existentes(apps, schema_editor):
+    # Las llaves primarias ya se capturaban en mayúsculas
+    mayusculas_por_lotes(apps.get_model('people', 'Alumno'), ['nombre_completo', 'correo_electronico'])
+    mayusculas_por_lotes(apps.get_model('people', 'Asesor'), ['nombre_completo', 'correo_electronico'])
+    mayusculas_por_lotes(apps.get_model('people', 'Evaluador'), ['nombre_completo', 'correo_evaluador', 'especializacion'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_busqueda_trigramas'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alumno',
+            name='codigo_estudiante',
+            field=SIGAP.fields.MayusculasCharField(max_length=9, primary_key=True, serialize=False, verbose_name='CÓDIGO DE ESTUDIANTE'),
+        ),
+        migrations.AlterField(
+            model_name='alumno',
+            name='correo_electronico',
+            field=SIGAP.fields.MayusculasEmailField(blank=True, max_length=100, null=True, verbose_name='CORREO ELECTRÓNICO'),
+        ),
+        migrations.AlterField(
+            model_name='alumno',
+            name='nombre_completo',
+            field=SIGAP.fields.MayusculasCharField(max_length=200, verbose_name='NOMBRE COMPLETO'),
+        ),
+        migrations.AlterField(
+            model_name='asesor',
+            name='codigo_asesor',
+            field=SIGAP.fields.MayusculasCharField(max_length=20, primary_key=True, serialize=False, verbose_name='CÓDIGO DE ASESOR'),
+        ),
+        migrations.AlterField(
+            model_name='asesor',
+            name='correo_electronico',
+            field=SIGAP.fields.MayusculasEmailField(max_length=254, verbose_name='CORREO ELECTRÓNICO'),
+        ),
+        migrations.AlterField(
+            model_name='asesor',
+            name='nombre_completo',
+            field=SIGAP.fields.MayusculasCharField(max_length=200, verbose_name='NOMBRE COMPLETO'),
+        ),
+        migrations.AlterField(
+            model_name='evaluador',
+            name='codigo_evaluador',
+            field=SIGAP.fields.MayusculasCharField(max_length=20, primary_key=True, serialize=False, verbose_name='CÓDIGO DE EVALUADOR'),
+        ),
+        migrations.AlterField(
+            model_name='evaluador',
+            name='correo_evaluador',
+            field=SIGAP.fields.MayusculasEmailField(max_length=254, verbose_name='CORREO EVALUADOR'),
+        ),
+        migrations.AlterField(
+            model_name='evaluador',
+            name='especializacion',
+            field=SIGAP.fields.MayusculasCharField(max_length=100, verbose_name='ESPECIALIZACIÓN'),
+        ),
+        migrations.AlterField(
+            model_name='evaluador',
+            name='nombre_completo',
+            field=SIGAP.fields.MayusculasCharField(max_length=200, verbose_name='NOMBRE COMPLETO'),
+        ),
+        migrations.RunPython(convertir_existentes, migrations.RunPython.noop),
+    ]
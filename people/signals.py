@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Se envía después de escribir un lote con `importar_padron`, que no pasa por
+# save() ni por post_save. Argumentos: sender (modelo) y claves (códigos).
+padron_importado = Signal()
@@ -1,3 +1,95 @@
+import io
+
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 
-# Create your tests here.
+from .busqueda import buscar_personas
+from .importacion import importar_padron, leer_archivo
+from .models import Alumno, Evaluador
+
+COLUMNAS = 'codigo_evaluador,nombre_completo,correo_evaluador,especializacion\n'
+
+
+class ImportacionPadronTests(TestCase):
+    """people.importacion: lectura del archivo e inserción o actualización por código."""
+
+    def importar(self, contenido, nombre='evaluadores.csv', codificacion='utf-8'):
+        archivo = io.BytesIO(contenido.encode(codificacion))
+        return importar_padron('evaluadores', leer_archivo(archivo, nombre, ('codigo_evaluador',)), tamano_lote=2)
+
+    def test_inserta_y_actualiza_por_codigo(self):
+        Evaluador.objects.create(
+            codigo_evaluador='E1', nombre_completo='NOMBRE VIEJO', correo_evaluador='viejo@sigap.mx',
+            especializacion='REPORTE',
+        )
+
+        resultado = self.importar(
+            COLUMNAS
+            + 'e1,Nombre Nuevo,nuevo@sigap.mx,Prototipo\n'
+            + 'E2,Otra Persona,otra@sigap.mx,Reporte\n'
+            + 'E3,,sin-nombre@sigap.mx,Reporte\n'
+            + 'E4,Cuarta,cuarta@sigap.mx,Reporte\n'
+        )
+
+        self.assertEqual((resultado.total, resultado.importados), (4, 3))
+        self.assertEqual([numero for numero, _ in resultado.errores], [4])
+        self.assertEqual(
+            dict(Evaluador.objects.values_list('codigo_evaluador', 'nombre_completo')),
+            {'E1': 'NOMBRE NUEVO', 'E2': 'OTRA PERSONA', 'E4': 'CUARTA'},
+        )
+
+    def test_csv_de_excel_en_cp1252(self):
+        resultado = self.importar(COLUMNAS + 'E1,José Núñez,jose@sigap.mx,Educación\n', codificacion='cp1252')
+
+        self.assertEqual(resultado.importados, 1)
+        self.assertEqual(Evaluador.objects.get().nombre_completo, 'JOSÉ NÚÑEZ')
+
+    def test_codigo_repetido_se_reporta_y_gana_la_ultima_fila(self):
+        resultado = self.importar(
+            COLUMNAS
+            + 'E1,Primera,uno@sigap.mx,Reporte\n'
+            + 'E2,Otra,otra@sigap.mx,Reporte\n'
+            + 'e1,Segunda,dos@sigap.mx,Reporte\n'
+        )
+
+        self.assertEqual((resultado.total, resultado.importados), (3, 2))
+        self.assertEqual(resultado.repetidos, [(4, 2)])
+        self.assertEqual(Evaluador.objects.get(pk='E1').nombre_completo, 'SEGUNDA')
+
+    def test_encabezado_incompleto_no_escribe_nada(self):
+        with self.assertRaisesMessage(ValidationError, 'codigo_evaluador'):
+            self.importar('codigo,nombre\nE1,Alguien\n')
+        with self.assertRaisesMessage(ValidationError, 'XLSX'):
+            self.importar('no es un libro', nombre='evaluadores.xlsx')
+        self.assertFalse(Evaluador.objects.exists())
+
+
+class BusquedaPersonasTests(TestCase):
+    """people.busqueda.buscar_personas: sin acentos ni mayúsculas, por nombre, correo o código."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Alumno.objects.bulk_create([
+            Alumno(codigo_estudiante='219000001', nombre_completo='JOSÉ PÉREZ ÁLVAREZ',
+                   correo_electronico='jose.perez@alumnos.udg.mx'),
+            Alumno(codigo_estudiante='219000002', nombre_completo='MARÍA LÓPEZ',
+                   correo_electronico='maria@alumnos.udg.mx'),
+            Alumno(codigo_estudiante='318000003', nombre_completo='PEDRO RAMÍREZ',
+                   correo_electronico='pedro@alumnos.udg.mx'),
+        ])
+
+    def codigos(self, termino):
+        resultado = buscar_personas(
+            Alumno.objects.all(), termino, 'codigo_estudiante', ('nombre_completo', 'correo_electronico'),
+        )
+        return list(resultado.values_list('codigo_estudiante', flat=True))
+
+    def test_sin_acentos_ni_mayusculas(self):
+        for termino in ('jose perez', 'JOSÉ PÉREZ', 'alvarez', 'Pérez Álv'):
+            with self.subTest(termino=termino):
+                self.assertEqual(self.codigos(termino), ['219000001'])
+        self.assertEqual(self.codigos('lopez'), ['219000002'])
+
+    def test_prefijo_de_codigo_y_correo(self):
+        self.assertEqual(sorted(self.codigos('219')), ['219000001', '219000002'])
+        self.assertEqual(self.codigos('maria@alumnos'), ['219000002'])
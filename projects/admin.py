@@ -1,42 +1,194 @@
+from django.conf import settings
 from django.contrib import admin, messages
-from django.core.mail import send_mail
-from django.urls import path
-from django.shortcuts import redirect
-from django.utils.html import format_html
-from .models import Proyecto, Formato1, Participacion, Prorroga
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.admin.utils import quote, unquote
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Exists, F, OuterRef, Prefetch, Q, Subquery, Window
+from django.db.models.functions import Left, RowNumber
+from django.http import JsonResponse, StreamingHttpResponse
+from django.urls import path, reverse
+from django.shortcuts import get_object_or_404, redirect
+from django.template.response import TemplateResponse
+from django.utils.html import format_html, format_html_join
+from django.utils.http import urlencode
+from django.utils.text import Truncator
+from .asignacion import asignar_evaluadores
+from .busqueda import buscar_protocolos, buscar_proyectos, marcar_fragmento
+from .correos import (
+    correo_evaluador, correo_evaluador_varios, correo_participantes,
+    correo_participantes_varios, destinatarios_proyecto,
+)
+from .dictamenes import generar_dictamenes
+from .enlaces import verificar_enlaces
+from .exportacion import csv_en_streaming, en_async
+from .folios import asignar_folio
+from .models import Proyecto, Formato1, Participacion, Prorroga, VerificacionEnlace
+from .similitud import protocolos_similares
 from evaluation.models import Evaluaciones
+from evaluation.recomendacion import recomendar_evaluadores
+from notifications.cola import encolar, enviar_ahora
+from people.autocompletado import AutocompletadoPersonasMixin
 
 
 # --- Inlines (Formularios anidados dentro de ProyectoAdmin) ---
 
-class ParticipacionInline(admin.TabularInline):
+# El alumno se busca por AJAX: el formulario no lleva un <select> con todo el padrón
+class ParticipacionInline(AutocompletadoPersonasMixin, admin.TabularInline):
     model = Participacion
     extra = 1
-    #autocomplete_fields = ['alumno']
+    autocomplete_fields = ['alumno']
 
 class ProrrogaInline(admin.TabularInline):
     model = Prorroga
     extra = 0
 
+# Solo las evaluaciones más recientes, con las observaciones recortadas;
+# el historial completo se pide por página a ProyectoAdmin.historial_evaluaciones
+EVALUACIONES_VISIBLES = 5
+OBSERVACIONES_RESUMEN = 200
+EVALUACIONES_POR_PAGINA = 20
+
 class EvaluacionesInline(admin.TabularInline):
     model = Evaluaciones
     extra = 0
-    readonly_fields = ('fecha_evaluacion', 'evaluador', 'tipo_revision', 'resolutivo', 'observaciones')
+    fields = ('fecha_evaluacion', 'evaluador', 'tipo_revision', 'resolutivo', 'observaciones_resumen')
+    readonly_fields = fields
     can_delete = False
+    template = 'admin/projects/evaluaciones_inline.html'
+
+    def get_queryset(self, request):
+        posicion = Window(
+            RowNumber(),
+            partition_by=F('proyecto'),
+            order_by=(F('fecha_evaluacion').desc(), F('id_evaluacion').desc()),
+        )
+        return (
+            super().get_queryset(request)
+            .select_related('evaluador')
+            .defer('observaciones')
+            .annotate(posicion=posicion, resumen=Left('observaciones', OBSERVACIONES_RESUMEN + 1))
+            .filter(posicion__lte=EVALUACIONES_VISIBLES)
+            .order_by('-fecha_evaluacion', '-id_evaluacion')
+        )
+
+    @admin.display(description="OBSERVACIONES")
+    def observaciones_resumen(self, obj):
+        if len(obj.resumen) > OBSERVACIONES_RESUMEN:
+            return obj.resumen[:OBSERVACIONES_RESUMEN].rstrip() + '…'
+        return obj.resumen
+
+
+# --- Estado de los enlaces (resultado de projects.enlaces) ---
+
+CAMPOS_URL = ('evidencia_url', 'protocolo_dictamen_url')
+ICONOS_ENLACE = {
+    VerificacionEnlace.OK: '✅',
+    VerificacionEnlace.PRIVADO: '🔒',
+    VerificacionEnlace.ROTO: '❌',
+    VerificacionEnlace.ERROR: '⚠️',
+}
+
+
+def _verificaciones(campo, **filtros):
+    return VerificacionEnlace.objects.filter(url=OuterRef(campo), **filtros)
+
+
+class EstadoEnlacesFilter(admin.SimpleListFilter):
+    title = "estado de enlaces"
+    parameter_name = 'enlaces'
+
+    def lookups(self, request, model_admin):
+        return [
+            (VerificacionEnlace.OK, "Todos accesibles"),
+            (VerificacionEnlace.PRIVADO, "Alguno requiere permisos"),
+            (VerificacionEnlace.ROTO, "Alguno roto"),
+            (VerificacionEnlace.ERROR, "Alguno sin respuesta"),
+            ('SIN_VERIFICAR', "Alguno sin verificar"),
+        ]
+
+    def queryset(self, request, queryset):
+        valor = self.value()
+        if not valor:
+            return queryset
+        if valor == 'SIN_VERIFICAR':
+            condicion = Q()
+            for campo in CAMPOS_URL:
+                condicion |= Q(**{f'{campo}__isnull': False}) & ~Exists(_verificaciones(campo))
+            return queryset.filter(condicion)
+        if valor == VerificacionEnlace.OK:
+            queryset = queryset.exclude(evidencia_url__isnull=True, protocolo_dictamen_url__isnull=True)
+            for campo in CAMPOS_URL:
+                queryset = queryset.filter(
+                    Q(**{f'{campo}__isnull': True}) | Exists(_verificaciones(campo, estado=VerificacionEnlace.OK))
+                )
+            return queryset
+        condicion = Q()
+        for campo in CAMPOS_URL:
+            condicion |= Exists(_verificaciones(campo, estado=valor))
+        return queryset.filter(condicion)
+
+
+# --- Aviso de protocolos casi duplicados (projects.similitud) ---
+
+class AvisoSimilaresMixin:
+    """
+    Al abrir la página de edición avisa si el Formato 1 se parece a otros
+    protocolos de cualquier calendario, con ligas a cada uno.
+    """
+
+    def formato1_de(self, object_id):
+        return object_id
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        if request.method == 'GET':
+            self._avisar_similares(request, self.formato1_de(unquote(object_id)))
+        return super().change_view(request, object_id, form_url, extra_context)
+
+    def _avisar_similares(self, request, formato1_id):
+        similares = protocolos_similares(formato1_id) if formato1_id else []
+        if not similares:
+            return
+        ligas = []
+        for similar in similares:
+            liga = format_html(
+                '<a href="{}">{}</a> ({}%)',
+                reverse('admin:projects_formato1_change', args=[quote(similar.folio)]),
+                similar.folio, round(similar.similitud * 100),
+            )
+            if similar.en_proyectos:
+                liga = format_html(
+                    '{} · <a href="{}">proyecto</a>',
+                    liga, reverse('admin:projects_proyecto_change', args=[quote(similar.folio)]),
+                )
+            ligas.append((liga,))
+        messages.warning(request, format_html(
+            "⚠️ El Formato 1 se parece a otros protocolos (similitud estimada): {}",
+            format_html_join(', ', '{}', ligas),
+        ))
 
 
 # --- Registros Principales ---
 
 @admin.register(Proyecto)
-class ProyectoAdmin(admin.ModelAdmin):
+class ProyectoAdmin(AvisoSimilaresMixin, admin.ModelAdmin):
     list_display = (
         'folio', 'titulo', 'asesor', 'evaluador', 'modalidad',
-        'calendario_registro', 'dictamen',
+        'calendario_registro', 'dictamen', 'estado_enlaces',
         'boton_enviar_correo', 'boton_enviar_correo_evaluador'
     )
 
+    # asesor y evaluador se muestran en cada fila
+    list_select_related = ('asesor', 'evaluador')
+
     list_filter = (
-        'modalidad', 'calendario_registro', 'dictamen', 'asesor', 'evaluador'
+        'modalidad', 'calendario_registro', 'dictamen', 'ultima_revision',
+        'ultimo_resolutivo', 'asesor', 'evaluador', EstadoEnlacesFilter,
+    )
+
+    readonly_fields = (
+        'ultima_revision', 'ultimo_resolutivo', 'fecha_ultima_evaluacion', 'total_evaluaciones'
     )
 
     search_fields = (
@@ -50,6 +202,64 @@ class ProyectoAdmin(admin.ModelAdmin):
         EvaluacionesInline
     ]
 
+    actions = [
+        'notificar_participantes', 'notificar_evaluadores',
+        'exportar_proyectos_csv', 'exportar_evaluaciones_csv',
+        'asignar_evaluadores_automatico', 'generar_dictamenes_pdf',
+        'verificar_enlaces_seleccionados',
+    ]
+
+    # El estado de cada enlace viene en la misma consulta del listado
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(**{
+            f'estado_{campo}': Subquery(_verificaciones(campo).values('estado')[:1]) for campo in CAMPOS_URL
+        })
+
+    # La búsqueda usa el documento indexado (folio, título, asesor, evaluador
+    # y participantes) en lugar de icontains sobre las tablas unidas.
+    def get_search_results(self, request, queryset, search_term):
+        return buscar_proyectos(queryset, search_term), False
+
+    # El folio de un proyecto nuevo lo asigna projects.folios al guardar
+    def get_readonly_fields(self, request, obj=None):
+        campos = super().get_readonly_fields(request, obj)
+        return campos if obj else ('folio', *campos)
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.folio = asignar_folio(obj.calendario_registro)
+        super().save_model(request, obj, form, change)
+
+    # Debajo del evaluador, los que más se parecen al protocolo por lo que ya
+    # revisaron (evaluation.recomendacion); un clic los elige en el select.
+    # Solo al abrir la página (GET): get_form se llama varias veces por vista.
+    def render_change_form(self, request, context, add=False, change=False, form_url='', obj=None):
+        campo = context['adminform'].form.fields.get('evaluador')
+        if request.method == 'GET' and obj is not None and campo is not None:
+            recomendaciones = self._recomendaciones(request, obj)
+            if recomendaciones:
+                campo.help_text = format_html(
+                    "Recomendados por afinidad con los protocolos que han revisado: {}",
+                    format_html_join(' · ', (
+                        '<a href="#" data-evaluador="{}" onclick="var s=document.getElementById(\'id_evaluador\');'
+                        ' s.value=this.dataset.evaluador; s.dispatchEvent(new Event(\'change\')); return false;">'
+                        '{}</a> ({}%, {} proyectos)'
+                    ), (
+                        (r.evaluador.pk, r.evaluador.nombre_completo, round(r.similitud * 100), r.proyectos)
+                        for r in recomendaciones
+                    )),
+                )
+        return super().render_change_form(request, context, add, change, form_url, obj)
+
+    def _recomendaciones(self, request, obj):
+        if not hasattr(request, '_recomendaciones_evaluador'):
+            request._recomendaciones_evaluador = recomendar_evaluadores(obj)
+        return request._recomendaciones_evaluador
+
+    # El Formato 1 se liga por la llave foránea o, en registros viejos, por folio
+    def formato1_de(self, object_id):
+        return Proyecto.objects.filter(pk=object_id).values_list('formato1', flat=True).first() or object_id
+
     # --- Botón personalizado para asesor ---
     def boton_enviar_correo(self, obj):
         return format_html(
@@ -70,156 +280,325 @@ class ProyectoAdmin(admin.ModelAdmin):
         )
     boton_enviar_correo_evaluador.short_description = "Correo Evaluador"
 
-    # --------------------- URLs extras ---------------------
+    # --- Estado de la evidencia y del protocolo ---
+    @admin.display(description="Enlaces")
+    def estado_enlaces(self, obj):
+        iconos = []
+        for campo, nombre in zip(CAMPOS_URL, ("Evidencia", "Protocolo")):
+            if not getattr(obj, campo):
+                iconos.append(('—', f"{nombre}: sin URL"))
+                continue
+            estado = getattr(obj, f'estado_{campo}', None)
+            iconos.append((ICONOS_ENLACE.get(estado, '❔'), f"{nombre}: {estado or 'SIN VERIFICAR'}"))
+        return format_html(
+            '<span title="{}">{}</span> <span title="{}">{}</span>',
+            iconos[0][1], iconos[0][0], iconos[1][1], iconos[1][0],
+        )
+
+    # --- URL personalizada ---
     def get_urls(self):
-        from django.urls import path
         urls = super().get_urls()
         custom_urls = [
-            path(
-                'enviar-correo-evaluador/<str:folio>/',
-                self.admin_site.admin_view(self.enviar_correo_evaluador),
-                name='enviar_correo_evaluador',
-            ),
+            path('enviar-correo/<str:folio>/', self.admin_site.admin_view(self.enviar_correo), name='enviar_correo'),
+            path('enviar-correo-evaluador/<str:folio>/', self.admin_site.admin_view(self.enviar_correo_evaluador), name='enviar_correo_evaluador'),
+            path('evaluaciones/<str:folio>/', self.admin_site.admin_view(self.historial_evaluaciones), name='projects_proyecto_evaluaciones'),
         ]
         return custom_urls + urls
 
+    # --------------------- Historial de evaluaciones ---------------------
+    # JSON para el botón del inline de evaluaciones. Del más reciente al más
+    # antiguo, paginado por `antes` (id de la última evaluación recibida).
+    def historial_evaluaciones(self, request, folio):
+        proyecto = get_object_or_404(Proyecto, pk=folio)
+        if not self.has_view_permission(request, proyecto):
+            raise PermissionDenied
+
+        evaluaciones = (
+            Evaluaciones.objects.filter(proyecto=proyecto)
+            .select_related('evaluador')
+            .order_by('-fecha_evaluacion', '-id_evaluacion')
+        )
+        antes = request.GET.get('antes', '')
+        if antes.isdigit():
+            fecha = Subquery(evaluaciones.filter(pk=antes).values('fecha_evaluacion'))
+            evaluaciones = evaluaciones.filter(
+                Q(fecha_evaluacion__lt=fecha) | Q(fecha_evaluacion=fecha, id_evaluacion__lt=antes)
+            )
+        pagina = list(evaluaciones[:EVALUACIONES_POR_PAGINA + 1])
+
+        siguiente = None
+        if len(pagina) > EVALUACIONES_POR_PAGINA:
+            pagina = pagina[:EVALUACIONES_POR_PAGINA]
+            siguiente = f"{request.path}?{urlencode({'antes': pagina[-1].id_evaluacion})}"
+        return JsonResponse({
+            'resultados': [
+                {
+                    'id': evaluacion.id_evaluacion,
+                    'fecha': evaluacion.fecha_evaluacion,
+                    'evaluador': str(evaluacion.evaluador) if evaluacion.evaluador else '',
+                    'tipo_revision': evaluacion.get_tipo_revision_display(),
+                    'resolutivo': evaluacion.get_resolutivo_display(),
+                    'observaciones': evaluacion.observaciones,
+                }
+                for evaluacion in pagina
+            ],
+            'siguiente': siguiente,
+        }, json_dumps_params={'ensure_ascii': False})
+
     # --------------------- Lógica del correo ---------------------
+    # Los botones solo encolan el mensaje; el comando `enviar_correos` lo envía.
     def enviar_correo_evaluador(self, request, folio):
-        from django.shortcuts import redirect
-        from django.core.mail import send_mail
-        from django.conf import settings
-
-        proyecto = Proyecto.objects.get(pk=folio)
-        formato1 = Formato1.objects.get(folio=proyecto.folio)
+        proyecto = get_object_or_404(Proyecto.objects.select_related('evaluador'), pk=folio)
+        formato1 = Formato1.objects.defer('documento_busqueda').filter(folio=proyecto.folio).first()
         evaluador = proyecto.evaluador
 
-        if evaluador and evaluador.correo_evaluador:
-            send_mail(
-                subject="Notificación de Proyecto Asignado",
-                message=(
-                    f"Estimado/a {evaluador.nombre_completo},\n\n"
-                    f"Se le ha asignado el proyecto:\n"
-                    f"Folio: {proyecto.folio}\n\n"
-                    f" **Introducción:**\n{formato1.introduccion}\n\n"
-                    f" **Justificación:**\n{formato1.justificacion}\n\n"
-                    f" **Objetivo:**\n{formato1.objetivo}\n\n"
-                    f" **Resumen:**\n{formato1.resumen}\n\n"
-                    
-                ),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[evaluador.correo_evaluador],
-                fail_silently=False,
+        if not formato1:
+            self.message_user(request, "❌ El proyecto no tiene Formato 1 registrado.", level='error')
+        elif evaluador and evaluador.correo_evaluador:
+            asunto, mensaje = correo_evaluador(proyecto, formato1)
+            encolar(
+                asunto,
+                mensaje,
+                [evaluador.correo_evaluador],
+                remitente=settings.DEFAULT_FROM_EMAIL,
             )
 
-            self.message_user(request, "📧 Correo enviado al evaluador.")
+            self.message_user(request, "📧 Correo al evaluador en cola de envío.")
         else:
             self.message_user(request, "❌ El evaluador no tiene correo.", level='error')
 
         return redirect(f'../../{folio}/change/')
 
-
-
-    # --- URL personalizada ---
-    def get_urls(self):
-        urls = super().get_urls()
-        custom_urls = [
-            path('enviar-correo/<str:folio>/', self.admin_site.admin_view(self.enviar_correo), name='enviar_correo'),
-            path('enviar-correo-evaluador/<str:folio>/', self.admin_site.admin_view(self.enviar_correo_evaluador), name='enviar_correo_evaluador'),
-        ]
-        return custom_urls + urls
-
-    # --- Lógica del envío de correo ---
     def enviar_correo(self, request, folio):
-        proyecto = Proyecto.objects.get(pk=folio)
-
-        destinatarios = []
-
-        # Correos de asesor y evaluador
-        if proyecto.asesor and proyecto.asesor.correo_electronico:
-            destinatarios.append(proyecto.asesor.correo_electronico)
-        if proyecto.evaluador and proyecto.evaluador.correo_evaluador:
-            destinatarios.append(proyecto.evaluador.correo_evaluador)
-
-        # Correos de alumnos participantes
-        for participacion in proyecto.participacion_set.all():
-            alumno = participacion.alumno
-            if alumno and alumno.correo_electronico:
-                destinatarios.append(alumno.correo_electronico)
-
-        destinatarios = list(set(destinatarios))  # quitar duplicados
+        proyecto = get_object_or_404(
+            Proyecto.objects.select_related('asesor', 'evaluador').prefetch_related(
+                Prefetch('participacion_set', queryset=Participacion.objects.select_related('alumno'))
+            ),
+            pk=folio,
+        )
+        destinatarios = destinatarios_proyecto(proyecto)
 
         if not destinatarios:
             messages.error(request, "❌ No hay correos registrados para este proyecto.")
             return redirect(request.META.get('HTTP_REFERER', 'admin:index'))
 
-        # Mensaje del correo
-        asunto = f"Notificación del Proyecto {proyecto.folio}"
+        asunto, mensaje = correo_participantes(proyecto)
+        encolar(asunto, mensaje, destinatarios)
+
+        messages.success(request, f"✅ Correo en cola de envío para los participantes del proyecto {proyecto.folio}.")
+        return redirect(request.META.get('HTTP_REFERER', 'admin:index'))
+
+
+    # --------------------- Notificación masiva ---------------------
+    def _proyectos_para_notificar(self, queryset):
+        """
+        Carga los proyectos con asesor, evaluador, participantes y Formato1
+        en un número fijo de consultas, sin importar cuántos se seleccionen.
+        """
+        proyectos = list(
+            queryset.select_related('asesor', 'evaluador')
+            .prefetch_related(
+                Prefetch('participacion_set', queryset=Participacion.objects.select_related('alumno'))
+            )
+        )
+        # Una sola consulta: por folio (enlace histórico) o por la llave formato1
+        formatos = Formato1.objects.defer('documento_busqueda').in_bulk(
+            {p.folio for p in proyectos} | {p.formato1_id for p in proyectos if p.formato1_id}
+        )
+        for proyecto in proyectos:
+            if proyecto.folio not in formatos and proyecto.formato1_id in formatos:
+                formatos[proyecto.folio] = formatos[proyecto.formato1_id]
+        return proyectos, formatos
+
+    def _reportar_envio(self, request, enviados, fallidos, omitidos=0):
+        mensaje = f"✅ {enviados} correos enviados, {fallidos} fallidos."
+        if fallidos:
+            mensaje += " Los fallidos quedan en la bandeja de salida para reintento."
+        if omitidos:
+            mensaje += f" {omitidos} proyectos sin destinatarios."
+        nivel = messages.WARNING if fallidos or omitidos else messages.SUCCESS
+        self.message_user(request, mensaje, level=nivel)
+
+    @admin.action(description="📨 Notificar a los participantes de los proyectos seleccionados")
+    def notificar_participantes(self, request, queryset):
+        proyectos, _ = self._proyectos_para_notificar(queryset)
+
+        # Un solo correo por destinatario, aunque aparezca en varios proyectos
+        por_destinatario = {}
+        omitidos = 0
+        for proyecto in proyectos:
+            destinatarios = destinatarios_proyecto(proyecto)
+            if not destinatarios:
+                omitidos += 1
+            for correo in destinatarios:
+                por_destinatario.setdefault(correo, []).append(proyecto)
+
+        mensajes = [
+            (*correo_participantes_varios(lista), [correo])
+            for correo, lista in por_destinatario.items()
+        ]
+        enviados, fallidos = enviar_ahora(mensajes)
+        self._reportar_envio(request, enviados, fallidos, omitidos)
+
+    @admin.action(description="📧 Notificar a los evaluadores de los proyectos seleccionados")
+    def notificar_evaluadores(self, request, queryset):
+        proyectos, formatos = self._proyectos_para_notificar(queryset)
+
+        por_evaluador = {}
+        omitidos = 0
+        for proyecto in proyectos:
+            evaluador = proyecto.evaluador
+            if not (evaluador and evaluador.correo_evaluador and proyecto.folio in formatos):
+                omitidos += 1
+                continue
+            por_evaluador.setdefault(evaluador.correo_evaluador, []).append(proyecto)
+
+        mensajes = [
+            (*correo_evaluador_varios(lista, formatos), [correo])
+            for correo, lista in por_evaluador.items()
+        ]
+        enviados, fallidos = enviar_ahora(mensajes, remitente=settings.DEFAULT_FROM_EMAIL)
+        self._reportar_envio(request, enviados, fallidos, omitidos)
+
+    # --------------------- Exportación (CSV en streaming) ---------------------
+    # Bajo ASGI (SERVIDOR_MODO=asgi) el iterador debe ser asíncrono; si no,
+    # Django junta todo el CSV en memoria antes de enviarlo.
+    def _exportar_csv(self, request, hoja, queryset):
+        lineas = csv_en_streaming(hoja, queryset)
+        if isinstance(request, ASGIRequest):
+            lineas = en_async(lineas)
+        respuesta = StreamingHttpResponse(lineas, content_type='text/csv; charset=utf-8')
+        respuesta['Content-Disposition'] = f'attachment; filename="{hoja}.csv"'
+        return respuesta
+
+    @admin.action(description="📄 Exportar proyectos y participantes (CSV)")
+    def exportar_proyectos_csv(self, request, queryset):
+        return self._exportar_csv(request, 'proyectos', queryset)
+
+    @admin.action(description="📄 Exportar historial de evaluaciones (CSV)")
+    def exportar_evaluaciones_csv(self, request, queryset):
+        return self._exportar_csv(request, 'evaluaciones', queryset)
+
+    # --------------------- Dictámenes en PDF ---------------------
+    @admin.action(description="🖨️ Generar dictámenes en PDF")
+    def generar_dictamenes_pdf(self, request, queryset):
+        resultado = generar_dictamenes(queryset)
         mensaje = (
-            f"Estimados participantes,\n\n"
-            f"Este es un aviso relacionado con el proyecto '{proyecto.titulo}' "
-            f"(folio: {proyecto.folio}).\n\n"
-            f"Por favor revisen su cuenta SIGAP para más información.\n\n"
-            f"Atentamente,\nComité de Evaluación"
+            f"🖨️ {resultado.generados} dictámenes generados, {resultado.omitidos} sin cambios "
+            f"({resultado.por_segundo:.0f} proyectos/s)."
         )
-
-        send_mail(
-            subject=asunto,
-            message=mensaje,
-            from_email=None,
-            recipient_list=destinatarios,
-            fail_silently=False,
+        if resultado.errores:
+            mensaje += f" {len(resultado.errores)} con errores: " + ', '.join(f for f, _ in resultado.errores[:10])
+        nivel = messages.WARNING if resultado.errores else messages.SUCCESS
+        self.message_user(request, mensaje, level=nivel)
+
+    # --------------------- Verificación de enlaces ---------------------
+    # Corre dentro de la petición: se acota a ENLACES_MAXIMO_ADMIN URL para no
+    # pasar el timeout del servidor; las verificaciones grandes van por el comando.
+    @admin.action(description="🔗 Verificar enlaces de evidencia y protocolo")
+    def verificar_enlaces_seleccionados(self, request, queryset):
+        resultado = verificar_enlaces(queryset, maximo=settings.ENLACES_MAXIMO_ADMIN)
+        conteos = ', '.join(
+            f"{ICONOS_ENLACE[estado]} {total}" for estado, total in sorted(resultado.por_estado.items())
         )
+        mensaje = f"🔗 {resultado.verificados} enlaces verificados"
+        mensaje += f" ({conteos})." if conteos else "."
+        if resultado.en_cache:
+            mensaje += f" {resultado.en_cache} con verificación vigente."
+        if resultado.sin_revisar:
+            mensaje += (
+                f" ⚠️ {resultado.sin_revisar} quedaron sin revisar (máximo {settings.ENLACES_MAXIMO_ADMIN}"
+                " por acción): vuelva a ejecutarla o use `manage.py verificar_enlaces --calendario …`."
+            )
+        self.message_user(request, mensaje, level=messages.WARNING if resultado.sin_revisar else messages.INFO)
+
+    # --------------------- Asignación automática de evaluadores ---------------------
+    # Primero muestra el plan (simulación); se guarda solo al confirmar.
+    @admin.action(description="🧮 Asignar evaluadores automáticamente")
+    def asignar_evaluadores_automatico(self, request, queryset):
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+
+        if request.POST.get('confirmar'):
+            resultado = asignar_evaluadores(queryset)
+            mensaje = f"🧮 {len(resultado.asignaciones)} proyectos asignados a {len(resultado.nuevos)} evaluadores."
+            if resultado.sin_asignar:
+                mensaje += f" {resultado.sin_asignar} quedaron sin evaluador disponible."
+            nivel = messages.WARNING if resultado.sin_asignar else messages.SUCCESS
+            self.message_user(request, mensaje, level=nivel)
+            return None
+
+        resultado = asignar_evaluadores(queryset, simular=True)
+        evaluadores = {evaluador.pk: evaluador for _, evaluador in resultado.asignaciones}
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': "Asignar evaluadores automáticamente",
+            'resultado': resultado,
+            'resumen': resultado.resumen_por_evaluador(evaluadores.values()),
+            'muestra': resultado.asignaciones[:200],
+            'seleccionados': request.POST.getlist(ACTION_CHECKBOX_NAME),
+            'select_across': request.POST.get('select_across', '0'),
+            'action_checkbox_name': ACTION_CHECKBOX_NAME,
+        }
+        return TemplateResponse(request, 'admin/projects/asignar_evaluadores.html', context)
 
-        messages.success(request, f"✅ Correo enviado correctamente a los participantes del proyecto {proyecto.folio}.")
-        return redirect(request.META.get('HTTP_REFERER', 'admin:index'))
+
+@admin.register(Participacion)
+class ParticipacionAdmin(AutocompletadoPersonasMixin, admin.ModelAdmin):
+    list_display = ('proyecto', 'alumno', 'es_representante')
+    list_select_related = ('proyecto', 'alumno')
+    list_filter = ('es_representante',)
+    autocomplete_fields = ['proyecto', 'alumno']
 
 
-def enviar_correo_evaluador(self, request, folio):
-    proyecto = Proyecto.objects.get(pk=folio)
+@admin.register(VerificacionEnlace)
+class VerificacionEnlaceAdmin(admin.ModelAdmin):
+    list_display = ('url', 'estado', 'codigo_http', 'url_final', 'fecha_verificacion')
+    list_filter = ('estado', 'codigo_http')
+    search_fields = ('url',)
+    readonly_fields = ('url', 'estado', 'codigo_http', 'url_final', 'error', 'fecha_verificacion')
 
-    if not proyecto.evaluador or not proyecto.evaluador.correo_evaluador:
-        messages.error(request, "❌ Este proyecto no tiene correo de evaluador registrado.")
-        return redirect(request.META.get('HTTP_REFERER', 'admin:index'))
+    def has_add_permission(self, request):
+        return False
 
-    destinatario = proyecto.evaluador.correo_evaluador
-
-    # Construcción del mensaje con los campos solicitados
-    asunto = f"[Evaluación] Información del Proyecto {proyecto.folio}"
-
-    mensaje = (
-        f"Estimado evaluador,\n\n"
-        f"Se le ha asignado el proyecto con los siguientes datos:\n\n"
-        f"• Folio: {proyecto.folio}\n"
-        f"• Título: {proyecto.titulo}\n\n"
-        f"--- INTRODUCCIÓN ---\n{proyecto.introduccion}\n\n"
-        f"--- JUSTIFICACIÓN ---\n{proyecto.justificacion}\n\n"
-        f"--- OBJETIVO ---\n{proyecto.objetivo}\n\n"
-        f"--- RESUMEN ---\n{proyecto.resumen}\n\n"
-        f"Por favor ingrese a SIGAP para continuar con el proceso de evaluación.\n\n"
-        f"Atentamente,\n"
-        f"Comité de Evaluación"
-    )
 
-    send_mail(
-        subject=asunto,
-        message=mensaje,
-        from_email=None,
-        recipient_list=[destinatario],
-        fail_silently=False,
-    )
+# Caracteres del resumen que se muestran en la lista cuando no hay búsqueda
+FRAGMENTO_CARACTERES = 200
 
-    messages.success(request, f"✅ Correo enviado al evaluador del proyecto {proyecto.folio}.")
-    return redirect(request.META.get('HTTP_REFERER', 'admin:index'))
 
+class ChangeListPorRango(ChangeList):
+    """Al buscar, ordena por relevancia salvo que se elija otra columna."""
 
-@admin.register(Participacion)
-class ParticipacionAdmin(admin.ModelAdmin):
-    list_display = ('proyecto', 'alumno', 'es_representante')
-    list_filter = ('es_representante',)
-    autocomplete_fields = ['proyecto', 'alumno']
+    def get_ordering(self, request, queryset):
+        if 'rango' in queryset.query.annotations and ORDER_VAR not in self.params:
+            return ['-rango', self.lookup_opts.pk.name]
+        return super().get_ordering(request, queryset)
 
 
 @admin.register(Formato1)
-class Formato1Admin(admin.ModelAdmin):
-    list_display = ('folio', 'resumen')
-    search_fields = ('folio', 'resumen', 'introduccion')
+class Formato1Admin(AvisoSimilaresMixin, admin.ModelAdmin):
+    """
+    Búsqueda por tema en texto completo (projects.busqueda.buscar_protocolos):
+    los resultados salen ordenados por relevancia y con los pasajes donde
+    aparecen los términos.
+    """
+    list_display = ('folio', 'fragmento')
+    search_fields = ('folio', 'objetivo', 'resumen', 'introduccion', 'justificacion')
+    search_help_text = 'Temas en español, sin importar acentos: "energía solar", riego -urbano, o un folio.'
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('documento_busqueda')
+
+    def get_search_results(self, request, queryset, search_term):
+        return buscar_protocolos(queryset, search_term), False
+
+    def get_changelist(self, request, **kwargs):
+        return ChangeListPorRango
+
+    @admin.display(description="Fragmento")
+    def fragmento(self, obj):
+        fragmento = getattr(obj, 'fragmento', None)
+        if fragmento is None:
+            return Truncator(obj.resumen).chars(FRAGMENTO_CARACTERES)
+        return marcar_fragmento(fragmento)
@@ -0,0 +1,170 @@
+"""
+Asignación automática de evaluadores.
+
+Reparte los proyectos sin evaluador entre los evaluadores con una cola de
+prioridad: cada proyecto va al evaluador con menos carga abierta (proyectos
+con dictamen PENDIENTE), dando preferencia a los que tienen una
+especialización afín a la modalidad. Un evaluador no afín solo se elige si
+tiene al menos `penalizacion` proyectos menos que el mejor afín.
+"""
+import heapq
+import time
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from people.busqueda import normalizar
+from people.models import Evaluador
+from reports.resumen import programar_recalculo
+from .models import Proyecto
+from .signals import proyectos_modificados
+
+PENALIZACION_ESPECIALIDAD = 5
+
+# Se comparan raíces de palabras (los primeros caracteres), así 'PROTOTIPOS
+# ELECTRÓNICOS' es afín a 'PROTOTIPO' y 'MATERIAL DIDÁCTICO' a 'MATERIALES EDUCATIVOS'
+_LONGITUD_RAIZ = 5
+_PALABRAS_VACIAS = {'DE', 'DEL', 'LA', 'LAS', 'EL', 'LOS', 'Y', 'EN', 'PARA', 'CON'}
+
+
+def _raices(texto):
+    return {
+        palabra[:_LONGITUD_RAIZ] for palabra in normalizar(texto or '').split()
+        if palabra not in _PALABRAS_VACIAS and len(palabra) > 3
+    }
+
+
+def es_afin(especializacion, modalidad):
+    """True si la especialización comparte alguna raíz de palabra con la modalidad."""
+    return bool(_raices(especializacion) & _raices(modalidad))
+
+
+@dataclass
+class ResultadoAsignacion:
+    """Plan de asignación (y si se guardó) con la carga resultante por evaluador."""
+    asignaciones: list = field(default_factory=list)  # (proyecto, evaluador)
+    carga_inicial: dict = field(default_factory=dict)
+    nuevos: dict = field(default_factory=dict)
+    no_afines: int = 0
+    sin_asignar: int = 0
+    aplicado: bool = False
+    segundos: float = 0.0
+
+    def resumen_por_evaluador(self, evaluadores):
+        """Filas (evaluador, carga inicial, nuevos, carga final), de mayor a menor carga final."""
+        filas = [
+            (evaluador, self.carga_inicial.get(evaluador.pk, 0), self.nuevos.get(evaluador.pk, 0))
+            for evaluador in evaluadores
+        ]
+        filas = [(e, inicial, nuevos, inicial + nuevos) for e, inicial, nuevos in filas]
+        return sorted(filas, key=lambda fila: (-fila[3], fila[0].pk))
+
+
+# ====================================================================
+# Cálculo del plan
+# ====================================================================
+
+def carga_abierta():
+    """Proyectos con dictamen PENDIENTE por evaluador (todos los calendarios)."""
+    return dict(
+        Proyecto.objects.filter(dictamen='PENDIENTE', evaluador__isnull=False)
+        .order_by().values('evaluador').annotate(total=Count('pk'))
+        .values_list('evaluador', 'total')
+    )
+
+
+def planear_asignacion(proyectos, evaluadores, carga, penalizacion=PENALIZACION_ESPECIALIDAD, maximo=None):
+    """
+    Calcula el plan sin tocar la base de datos. `carga` es {codigo: proyectos
+    abiertos}; se actualiza conforme se asigna. Regresa ResultadoAsignacion.
+
+    Hay un montículo global y uno por modalidad con los evaluadores afines.
+    La carga solo crece, así que una entrada vieja siempre sale antes de
+    tiempo y se corrige en ese momento (sin volver a insertar al asignar).
+    """
+    resultado = ResultadoAsignacion(carga_inicial=dict(carga))
+    evaluadores = {evaluador.pk: evaluador for evaluador in evaluadores}
+    carga = {codigo: carga.get(codigo, 0) for codigo in evaluadores}
+
+    global_ = [(carga[codigo], codigo) for codigo in evaluadores]
+    heapq.heapify(global_)
+    por_modalidad = {}
+    for modalidad in {proyecto.modalidad for proyecto in proyectos}:
+        afines = [
+            (carga[codigo], codigo) for codigo, evaluador in evaluadores.items()
+            if es_afin(evaluador.especializacion, modalidad)
+        ]
+        heapq.heapify(afines)
+        por_modalidad[modalidad] = afines
+
+    def cima(monticulo):
+        while monticulo:
+            actual, codigo = monticulo[0]
+            if maximo is not None and carga[codigo] >= maximo:
+                heapq.heappop(monticulo)
+            elif actual != carga[codigo]:
+                heapq.heapreplace(monticulo, (carga[codigo], codigo))
+            else:
+                return monticulo[0]
+        return None
+
+    for proyecto in proyectos:
+        afin = cima(por_modalidad[proyecto.modalidad])
+        cualquiera = cima(global_)
+        if cualquiera is None:
+            resultado.sin_asignar += 1
+            continue
+        # El no afín solo gana con al menos `penalizacion` proyectos menos
+        # (con penalización 0 la cima global puede ser el mismo afín)
+        if afin is not None and (afin[1] == cualquiera[1] or afin[0] < cualquiera[0] + penalizacion):
+            codigo = afin[1]
+        else:
+            codigo = cualquiera[1]
+            resultado.no_afines += 1
+
+        carga[codigo] += 1
+        resultado.nuevos[codigo] = resultado.nuevos.get(codigo, 0) + 1
+        resultado.asignaciones.append((proyecto, evaluadores[codigo]))
+
+    return resultado
+
+
+# ====================================================================
+# Asignación sobre la base de datos
+# ====================================================================
+
+def asignar_evaluadores(proyectos, simular=False, penalizacion=PENALIZACION_ESPECIALIDAD, maximo=None):
+    """
+    Asigna evaluador a los proyectos del queryset que no lo tienen. Con
+    `simular` solo regresa el plan. Si no, lo guarda con un solo bulk_update
+    y actualiza la búsqueda y las estadísticas de los calendarios afectados.
+    """
+    inicio = time.perf_counter()
+    with transaction.atomic():
+        pendientes = proyectos.filter(evaluador__isnull=True).order_by('folio')
+        if not simular:
+            # Evita pisar una asignación manual hecha mientras se calcula el plan
+            pendientes = pendientes.select_for_update(of=('self',))
+        pendientes = list(pendientes.only('folio', 'modalidad', 'calendario_registro'))
+        evaluadores = list(Evaluador.objects.only('codigo_evaluador', 'nombre_completo', 'especializacion'))
+
+        resultado = planear_asignacion(pendientes, evaluadores, carga_abierta(), penalizacion, maximo)
+
+        if not simular and resultado.asignaciones:
+            ahora = timezone.now()
+            for proyecto, evaluador in resultado.asignaciones:
+                proyecto.evaluador = evaluador
+                proyecto.actualizado = ahora
+            asignados = [proyecto for proyecto, _ in resultado.asignaciones]
+            Proyecto.objects.bulk_update(asignados, ['evaluador', 'actualizado'], batch_size=1000)
+
+            # bulk_update no dispara señales
+            proyectos_modificados(Proyecto.objects.filter(folio__in=[p.folio for p in asignados]))
+            calendarios = {proyecto.calendario_registro for proyecto in asignados}
+            programar_recalculo(calendarios)
+            resultado.aplicado = True
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
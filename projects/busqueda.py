@@ -0,0 +1,130 @@
+"""
+Documentos de búsqueda (tsvector de PostgreSQL con índice GIN).
+
+- Proyectos: reemplaza la búsqueda del admin con icontains sobre cuatro
+  tablas unidas; el documento se guarda ya armado en
+  `Proyecto.documento_busqueda` y la consulta solo toca esa columna.
+- Formato 1: búsqueda por tema en el texto del protocolo, en español y sin
+  acentos, sobre la columna generada `Formato1.documento_busqueda`, con
+  los resultados ordenados por relevancia y fragmentos resaltados.
+"""
+import re
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Concat
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from people.busqueda import SinAcentos, normalizar
+from people.models import Asesor, Evaluador
+from .models import Participacion
+
+# Sin stemming: el documento contiene folios y nombres propios. Los acentos
+# se quitan antes (sigap_unaccent en el documento, normalizar en la consulta)
+CONFIGURACION = 'simple'
+
+# Español sin acentos (migración 0009 de projects); la misma de Formato1.documento_busqueda
+CONFIGURACION_PROTOCOLOS = 'sigap_es'
+
+# Marcas de los términos encontrados en los fragmentos (ver marcar_fragmento)
+INICIO_MARCA = '\x02'
+FIN_MARCA = '\x03'
+
+_TOKEN = re.compile(r'[\w-]+')
+
+
+def documento_busqueda():
+    """Expresión que arma el documento de cada proyecto dentro de un UPDATE."""
+    asesor = Asesor.objects.filter(pk=OuterRef('asesor_id')).values('nombre_completo')
+    evaluador = Evaluador.objects.filter(pk=OuterRef('evaluador_id')).values('nombre_completo')
+    participantes = (
+        Participacion.objects.filter(proyecto=OuterRef('pk'))
+        .order_by()
+        .values('proyecto')
+        .annotate(texto=StringAgg(
+            Concat(
+                'alumno__codigo_estudiante', Value(' '), 'alumno__nombre_completo',
+                output_field=TextField(),
+            ),
+            delimiter=' ',
+        ))
+        .values('texto')
+    )
+    partes = ('folio', 'titulo', Subquery(asesor), Subquery(evaluador), Subquery(participantes))
+    return SearchVector(*(SinAcentos(parte) for parte in partes), config=CONFIGURACION)
+
+
+def actualizar_documentos(proyectos):
+    """Recalcula el documento de búsqueda de los proyectos del queryset."""
+    return proyectos.update(documento_busqueda=documento_busqueda())
+
+
+def buscar_proyectos(queryset, termino):
+    """
+    Filtra por el documento de búsqueda. Cada palabra del término se busca
+    como prefijo, así que 'PER JOS' encuentra a 'JOSÉ PÉREZ'.
+    """
+    tokens = _TOKEN.findall(normalizar(termino).lower())
+    if not tokens:
+        return queryset
+    consulta = SearchQuery(
+        ' & '.join(f"{token}:*" for token in tokens),
+        config=CONFIGURACION,
+        search_type='raw',
+    )
+    return queryset.filter(documento_busqueda=consulta)
+
+
+# ====================================================================
+# Formato 1
+# ====================================================================
+
+def buscar_protocolos(queryset, termino):
+    """
+    Filtra los Formato1 por tema con la sintaxis de los buscadores web
+    ("comillas" para frases, `or`, `-palabra` para excluir) o por prefijo de
+    folio. Anota `rango` (relevancia; pesa más el objetivo, luego el
+    resumen, la introducción y la justificación) y `fragmento`.
+    """
+    termino = termino.strip()
+    if not termino:
+        return queryset
+    consulta = SearchQuery(termino, config=CONFIGURACION_PROTOCOLOS, search_type='websearch')
+    return (
+        queryset.filter(Q(documento_busqueda=consulta) | Q(folio__startswith=termino.upper()))
+        .annotate(
+            rango=SearchRank(F('documento_busqueda'), consulta),
+            fragmento=fragmento_protocolo(consulta),
+        )
+    )
+
+
+def fragmento_protocolo(consulta):
+    """
+    Expresión con los pasajes del protocolo donde aparece la consulta.
+    PostgreSQL la calcula solo para las filas de la página.
+    """
+    separador = Value(' … ')
+    return SearchHeadline(
+        Concat(
+            'objetivo', separador, 'resumen', separador, 'introduccion', separador, 'justificacion',
+            output_field=TextField(),
+        ),
+        consulta,
+        config=CONFIGURACION_PROTOCOLOS,
+        start_sel=INICIO_MARCA,
+        stop_sel=FIN_MARCA,
+        max_words=30,
+        min_words=10,
+        max_fragments=2,
+        fragment_delimiter=' … ',
+    )
+
+
+def marcar_fragmento(fragmento):
+    """HTML del fragmento: el texto escapado y los términos entre <mark>."""
+    return mark_safe(
+        escape(fragmento).replace(INICIO_MARCA, '<mark>').replace(FIN_MARCA, '</mark>')
+    )
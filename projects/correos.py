@@ -0,0 +1,97 @@
+"""
+Composición de los correos de notificación de proyectos.
+
+Solo arman asunto, mensaje y destinatarios; el envío lo hace la bandeja de
+salida de `notifications`.
+"""
+
+
+def destinatarios_proyecto(proyecto):
+    """Correos del asesor, evaluador y alumnos participantes, sin duplicados."""
+    destinatarios = []
+
+    # Correos de asesor y evaluador
+    if proyecto.asesor and proyecto.asesor.correo_electronico:
+        destinatarios.append(proyecto.asesor.correo_electronico)
+    if proyecto.evaluador and proyecto.evaluador.correo_evaluador:
+        destinatarios.append(proyecto.evaluador.correo_evaluador)
+
+    # Correos de alumnos participantes
+    for participacion in proyecto.participacion_set.all():
+        alumno = participacion.alumno
+        if alumno and alumno.correo_electronico:
+            destinatarios.append(alumno.correo_electronico)
+
+    return list(dict.fromkeys(destinatarios))  # quitar duplicados
+
+
+def correo_participantes(proyecto):
+    """Regresa (asunto, mensaje) del aviso a los participantes del proyecto."""
+    asunto = f"Notificación del Proyecto {proyecto.folio}"
+    mensaje = (
+        f"Estimados participantes,\n\n"
+        f"Este es un aviso relacionado con el proyecto '{proyecto.titulo}' "
+        f"(folio: {proyecto.folio}).\n\n"
+        f"Por favor revisen su cuenta SIGAP para más información.\n\n"
+        f"Atentamente,\nComité de Evaluación"
+    )
+    return asunto, mensaje
+
+
+def correo_evaluador(proyecto, formato1):
+    """Regresa (asunto, mensaje) de la asignación del proyecto al evaluador."""
+    evaluador = proyecto.evaluador
+    asunto = "Notificación de Proyecto Asignado"
+    mensaje = (
+        f"Estimado/a {evaluador.nombre_completo},\n\n"
+        f"Se le ha asignado el proyecto:\n"
+        f"Folio: {proyecto.folio}\n\n"
+        f" **Introducción:**\n{formato1.introduccion}\n\n"
+        f" **Justificación:**\n{formato1.justificacion}\n\n"
+        f" **Objetivo:**\n{formato1.objetivo}\n\n"
+        f" **Resumen:**\n{formato1.resumen}\n\n"
+    )
+    return asunto, mensaje
+
+
+def correo_participantes_varios(proyectos):
+    """Aviso único para un destinatario que participa en varios proyectos."""
+    if len(proyectos) == 1:
+        return correo_participantes(proyectos[0])
+
+    lista = "\n".join(f"• '{p.titulo}' (folio: {p.folio})" for p in proyectos)
+    asunto = f"Notificación de {len(proyectos)} Proyectos"
+    mensaje = (
+        f"Estimados participantes,\n\n"
+        f"Este es un aviso relacionado con los siguientes proyectos:\n\n"
+        f"{lista}\n\n"
+        f"Por favor revisen su cuenta SIGAP para más información.\n\n"
+        f"Atentamente,\nComité de Evaluación"
+    )
+    return asunto, mensaje
+
+
+def correo_evaluador_varios(proyectos, formatos):
+    """
+    Aviso único para un evaluador con varios proyectos asignados.
+    `formatos` relaciona cada folio con su Formato1.
+    """
+    if len(proyectos) == 1:
+        return correo_evaluador(proyectos[0], formatos[proyectos[0].folio])
+
+    evaluador = proyectos[0].evaluador
+    secciones = "".join(
+        f"Folio: {p.folio}\n\n"
+        f" **Introducción:**\n{formatos[p.folio].introduccion}\n\n"
+        f" **Justificación:**\n{formatos[p.folio].justificacion}\n\n"
+        f" **Objetivo:**\n{formatos[p.folio].objetivo}\n\n"
+        f" **Resumen:**\n{formatos[p.folio].resumen}\n\n"
+        for p in proyectos
+    )
+    asunto = f"Notificación de {len(proyectos)} Proyectos Asignados"
+    mensaje = (
+        f"Estimado/a {evaluador.nombre_completo},\n\n"
+        f"Se le han asignado los proyectos:\n\n"
+        f"{secciones}"
+    )
+    return asunto, mensaje
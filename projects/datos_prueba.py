@@ -0,0 +1,277 @@
+"""
+Datos sintéticos para desarrollo y medición de rendimiento.
+
+Genera personas, proyectos con 3 a 5 participantes, Formato 1, historial de
+evaluaciones y prórrogas con bulk_create, por lotes y con una semilla fija
+(mismos parámetros, mismos datos). bulk_create no dispara señales, así que
+al final se recalculan en bloque el estado de evaluación, el documento de
+búsqueda y las estadísticas de los calendarios generados.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from evaluation.estado import actualizar_estado
+from evaluation.models import Evaluaciones
+from people.models import Alumno, Asesor, Evaluador
+from reports.resumen import programar_recalculo, recalcular_calendarios
+from .folios import asignar_folios
+from .models import BandaProtocolo, ContadorFolio, Formato1, HuellaProtocolo, Participacion, Prorroga, Proyecto
+from .signals import proyectos_modificados
+
+TAMANO_LOTE = 5000
+
+NOMBRES = (
+    'JOSÉ', 'MARÍA', 'JUAN', 'GUADALUPE', 'LUIS', 'ANA', 'CARLOS', 'FERNANDA', 'JORGE', 'SOFÍA',
+    'MIGUEL', 'VALERIA', 'ALEJANDRO', 'DANIELA', 'RICARDO', 'XIMENA', 'EDUARDO', 'ANDREA', 'RAÚL', 'PAOLA',
+    'FRANCISCO', 'ITZEL', 'ÁNGEL', 'LETICIA', 'ROBERTO', 'CAMILA', 'HÉCTOR', 'REGINA', 'ARTURO', 'NAYELI',
+)
+APELLIDOS = (
+    'HERNÁNDEZ', 'GARCÍA', 'MARTÍNEZ', 'LÓPEZ', 'GONZÁLEZ', 'PÉREZ', 'RODRÍGUEZ', 'SÁNCHEZ', 'RAMÍREZ',
+    'CRUZ', 'FLORES', 'GÓMEZ', 'MORALES', 'VÁZQUEZ', 'REYES', 'JIMÉNEZ', 'TORRES', 'DÍAZ', 'GUTIÉRREZ',
+    'RUIZ', 'MENDOZA', 'AGUILAR', 'ORTIZ', 'MORENO', 'CASTILLO', 'ROMERO', 'ÁLVAREZ', 'MÉNDEZ', 'CHÁVEZ',
+    'RIVERA', 'JUÁREZ', 'RAMOS', 'DOMÍNGUEZ', 'HERRERA', 'MEDINA', 'CASTRO', 'VARGAS', 'GUZMÁN', 'VELÁZQUEZ',
+)
+ESPECIALIZACIONES = (
+    'INVESTIGACIÓN EDUCATIVA', 'MATERIALES DIDÁCTICOS', 'PROTOTIPOS ELECTRÓNICOS', 'REPORTES TÉCNICOS',
+    'VINCULACIÓN Y SERVICIO SOCIAL', 'SISTEMAS COMPUTACIONALES', 'ADMINISTRACIÓN', 'SALUD PÚBLICA',
+)
+ACCIONES = ('DESARROLLO DE', 'DISEÑO DE', 'IMPLEMENTACIÓN DE', 'EVALUACIÓN DE', 'ANÁLISIS DE', 'PROPUESTA DE')
+OBJETOS = (
+    'UN SISTEMA DE INFORMACIÓN', 'UN PROTOTIPO', 'MATERIAL DIDÁCTICO', 'UNA APLICACIÓN MÓVIL',
+    'UN MODELO DE GESTIÓN', 'UN PROGRAMA DE CAPACITACIÓN', 'UNA ESTRATEGIA DE DIFUSIÓN', 'UN SENSOR DE BAJO COSTO',
+)
+CONTEXTOS = (
+    'PARA EL CONTROL DE INVENTARIOS', 'PARA LA ENSEÑANZA DE MATEMÁTICAS', 'EN COMUNIDADES RURALES',
+    'PARA PEQUEÑAS EMPRESAS', 'EN EL CENTRO UNIVERSITARIO', 'PARA EL MONITOREO AMBIENTAL',
+    'PARA LA GESTIÓN DE RESIDUOS', 'EN ESCUELAS DE NIVEL BÁSICO', 'PARA EL SECTOR SALUD', 'PARA EL AHORRO DE ENERGÍA',
+)
+PALABRAS = (
+    'PROYECTO', 'ESTUDIANTES', 'COMUNIDAD', 'PROCESO', 'RESULTADOS', 'ANÁLISIS', 'DATOS', 'PROPUESTA',
+    'MEJORA', 'SISTEMA', 'USUARIOS', 'EVALUACIÓN', 'METODOLOGÍA', 'IMPACTO', 'DESARROLLO', 'NECESIDAD',
+    'HERRAMIENTA', 'APRENDIZAJE', 'CALIDAD', 'SERVICIO', 'INFORMACIÓN', 'OBJETIVO', 'DISEÑO', 'PRUEBAS',
+)
+MODALIDADES = [clave for clave, _ in Proyecto.MODALIDAD_CHOICES]
+OBSERVACIONES = (
+    'SIN OBSERVACIONES.', 'CORREGIR EL FORMATO DE LAS REFERENCIAS.', 'AMPLIAR LA JUSTIFICACIÓN.',
+    'FALTA EVIDENCIA DE LOS RESULTADOS.', 'REVISAR LA REDACCIÓN DEL OBJETIVO GENERAL.', 'CUMPLE CON LO SOLICITADO.',
+)
+
+
+@dataclass
+class ResultadoGeneracion:
+    """Filas enviadas por modelo (las personas que ya existían se conservan) y tiempo total."""
+    filas: dict = field(default_factory=dict)
+    segundos: float = 0.0
+
+    def sumar(self, modelo, total):
+        nombre = modelo._meta.verbose_name_plural
+        self.filas[nombre] = self.filas.get(nombre, 0) + total
+
+
+def nombres_calendarios(inicio, cantidad):
+    """`cantidad` calendarios consecutivos desde `inicio`: 2023A, 2023B, 2024A, ..."""
+    anio, ciclo = int(inicio[:4]), inicio[4:].upper() or 'A'
+    calendarios = []
+    for _ in range(cantidad):
+        calendarios.append(f"{anio}{ciclo}")
+        anio, ciclo = (anio, 'B') if ciclo == 'A' else (anio + 1, 'A')
+    return calendarios
+
+
+def _inicio_calendario(calendario):
+    mes = 2 if calendario[4:] == 'A' else 8
+    return timezone.make_aware(datetime(int(calendario[:4]), mes, 1, 9))
+
+
+def _nombre(azar):
+    return f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}"
+
+
+def _texto(azar, palabras):
+    return ' '.join(azar.choice(PALABRAS) for _ in range(palabras)) + '.'
+
+
+def _insertar(modelo, instancias, resultado, **opciones):
+    creadas = modelo.objects.bulk_create(instancias, batch_size=TAMANO_LOTE, **opciones)
+    resultado.sumar(modelo, len(instancias))
+    return creadas
+
+
+# ====================================================================
+# Personas
+# ====================================================================
+
+def generar_personas(azar, alumnos, asesores, evaluadores, resultado):
+    """
+    Inserta las personas (las que ya existen con el mismo código se
+    conservan) y regresa las listas de códigos.
+    """
+    codigos_asesores = [f"A{numero:05d}" for numero in range(asesores)]
+    _insertar(Asesor, [
+        Asesor(codigo_asesor=codigo, nombre_completo=_nombre(azar),
+               correo_electronico=f"{codigo.lower()}@academicos.sigap.test")
+        for codigo in codigos_asesores
+    ], resultado, ignore_conflicts=True)
+
+    codigos_evaluadores = [f"E{numero:04d}" for numero in range(evaluadores)]
+    _insertar(Evaluador, [
+        Evaluador(codigo_evaluador=codigo, nombre_completo=_nombre(azar),
+                  correo_evaluador=f"{codigo.lower()}@academicos.sigap.test",
+                  especializacion=azar.choice(ESPECIALIZACIONES))
+        for codigo in codigos_evaluadores
+    ], resultado, ignore_conflicts=True)
+
+    codigos_alumnos = [f"{210000000 + numero:09d}" for numero in range(alumnos)]
+    for inicio in range(0, alumnos, TAMANO_LOTE):
+        _insertar(Alumno, [
+            Alumno(codigo_estudiante=codigo, nombre_completo=_nombre(azar),
+                   correo_electronico=f"{codigo}@alumnos.sigap.test")
+            for codigo in codigos_alumnos[inicio:inicio + TAMANO_LOTE]
+        ], resultado, ignore_conflicts=True)
+
+    return codigos_alumnos, codigos_asesores, codigos_evaluadores
+
+
+# ====================================================================
+# Proyectos
+# ====================================================================
+
+def _historial(azar, proyecto, evaluadores, antiguedad):
+    """
+    Evaluaciones FORMA -> FONDO -> FINAL de un proyecto; los calendarios
+    antiguos llegan más lejos. Regresa (evaluaciones, fechas, dictamen).
+    """
+    evaluaciones, fechas = [], []
+    fecha = _inicio_calendario(proyecto.calendario_registro)
+    etapas = min(3, azar.randint(0, 2) + antiguedad)
+    dictamen = 'PENDIENTE'
+    for tipo in ('FORMA', 'FONDO', 'FINAL')[:etapas]:
+        # Algunas revisiones piden correcciones antes de aprobarse
+        revisiones = azar.choice((1, 1, 1, 2))
+        for numero in range(revisiones):
+            fecha += timedelta(days=azar.randint(5, 25), hours=azar.randint(0, 8))
+            if numero < revisiones - 1:
+                resolutivo = 'PENDIENTE'
+            elif tipo == 'FINAL':
+                resolutivo = dictamen = azar.choice(('APROBADO', 'APROBADO', 'RECHAZADO'))
+            else:
+                resolutivo = 'APROBADO'
+            evaluaciones.append(Evaluaciones(
+                proyecto=proyecto,
+                evaluador_id=proyecto.evaluador_id or azar.choice(evaluadores),
+                tipo_revision=tipo,
+                resolutivo=resolutivo,
+                observaciones=azar.choice(OBSERVACIONES),
+            ))
+            fechas.append(fecha)
+    # Los que no han terminado pueden estar esperando correcciones
+    if evaluaciones and dictamen == 'PENDIENTE' and azar.random() < 0.4:
+        evaluaciones[-1].resolutivo = 'PENDIENTE'
+    return evaluaciones, fechas, dictamen
+
+
+def generar_calendario(azar, calendario, cantidad, antiguedad, alumnos, asesores, evaluadores, resultado):
+    """Proyectos de un calendario con todas sus relaciones, por lotes."""
+    for inicio in range(0, cantidad, TAMANO_LOTE):
+        proyectos, formatos, participaciones, prorrogas = [], [], [], []
+        evaluaciones, fechas = [], []
+        for folio in asignar_folios(calendario, min(TAMANO_LOTE, cantidad - inicio)):
+            formato1 = Formato1(
+                folio=folio,
+                introduccion=_texto(azar, 60),
+                justificacion=_texto(azar, 40),
+                objetivo=_texto(azar, 20),
+                resumen=_texto(azar, 50),
+            )
+            proyecto = Proyecto(
+                folio=folio,
+                titulo=f"{azar.choice(ACCIONES)} {azar.choice(OBJETOS)} {azar.choice(CONTEXTOS)}",
+                asesor_id=azar.choice(asesores),
+                evaluador_id=azar.choice(evaluadores) if antiguedad or azar.random() < 0.6 else None,
+                formato1=formato1,
+                modalidad=azar.choice(MODALIDADES),
+                nivel_competencia=azar.choice(('MÓDULO 1', 'MÓDULO 2', 'MÓDULOS 1 Y 2', None)),
+                calendario_registro=calendario,
+            )
+            historial, fechas_historial, proyecto.dictamen = _historial(azar, proyecto, evaluadores, antiguedad)
+            evaluaciones += historial
+            fechas += fechas_historial
+
+            for posicion, codigo in enumerate(azar.sample(alumnos, azar.randint(3, 5))):
+                participaciones.append(Participacion(
+                    proyecto=proyecto, alumno_id=codigo, es_representante=posicion == 0,
+                ))
+            if azar.random() < 0.08:
+                prorrogas.append(Prorroga(
+                    proyecto=proyecto,
+                    justificacion=_texto(azar, 25),
+                    calendario_presentacion=nombres_calendarios(calendario, 2)[1],
+                ))
+            formatos.append(formato1)
+            proyectos.append(proyecto)
+
+        _insertar(Formato1, formatos, resultado)
+        _insertar(Proyecto, proyectos, resultado)
+        _insertar(Participacion, participaciones, resultado)
+        _insertar(Prorroga, prorrogas, resultado)
+        # fecha_evaluacion es auto_now_add: se asigna después de insertar
+        creadas = _insertar(Evaluaciones, evaluaciones, resultado)
+        for evaluacion, fecha in zip(creadas, fechas):
+            evaluacion.fecha_evaluacion = fecha
+        Evaluaciones.objects.bulk_update(creadas, ['fecha_evaluacion'], batch_size=TAMANO_LOTE)
+
+
+def generar_datos(calendarios, proyectos_por_calendario, alumnos, asesores=400, evaluadores=300, semilla=1):
+    """
+    Genera todos los datos. Los calendarios no deben tener proyectos (ver
+    borrar_calendarios). Regresa ResultadoGeneracion.
+    """
+    inicio = time.perf_counter()
+    azar = random.Random(semilla)
+    resultado = ResultadoGeneracion()
+    with transaction.atomic():
+        codigos_alumnos, codigos_asesores, codigos_evaluadores = generar_personas(
+            azar, alumnos, asesores, evaluadores, resultado,
+        )
+        for posicion, calendario in enumerate(calendarios):
+            # El último calendario es el actual; los anteriores tienen más avance
+            antiguedad = len(calendarios) - 1 - posicion
+            generar_calendario(
+                azar, calendario, proyectos_por_calendario, antiguedad,
+                codigos_alumnos, codigos_asesores, codigos_evaluadores, resultado,
+            )
+
+        generados = Proyecto.objects.filter(calendario_registro__in=calendarios)
+        actualizar_estado(generados)
+        proyectos_modificados(generados)
+        programar_recalculo(calendarios)
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
+
+
+def borrar_calendarios(calendarios):
+    """
+    Borra los proyectos de los calendarios con sus relaciones. Se borra con
+    DELETE directos, sin las señales por fila (que recalcularían cada
+    proyecto); las estadísticas se reconstruyen al final.
+    """
+    with transaction.atomic():
+        proyectos = Proyecto.objects.filter(calendario_registro__in=calendarios)
+        folios = proyectos.values('folio')
+        for modelo in (Evaluaciones, Participacion, Prorroga):
+            modelo.objects.filter(proyecto__in=folios)._raw_delete(modelo.objects.db)
+        formatos = list(proyectos.exclude(formato1=None).values_list('formato1', flat=True))
+        total = proyectos._raw_delete(Proyecto.objects.db)
+        BandaProtocolo.objects.filter(huella__in=formatos)._raw_delete(BandaProtocolo.objects.db)
+        HuellaProtocolo.objects.filter(formato1__in=formatos)._raw_delete(HuellaProtocolo.objects.db)
+        Formato1.objects.filter(pk__in=formatos)._raw_delete(Formato1.objects.db)
+        # La numeración vuelve a empezar
+        ContadorFolio.objects.filter(calendario__in=calendarios).delete()
+    recalcular_calendarios(calendarios)
+    return total
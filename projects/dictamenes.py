@@ -0,0 +1,240 @@
+"""
+Generación de los dictámenes en PDF (el archivo de `protocolo_dictamen_url`).
+
+Cada dictamen se guarda como `<folio>/<huella>.pdf`, donde la huella es un
+SHA-256 de los datos que lo componen; si el archivo ya existe, el proyecto
+no cambió y se omite. Al generar una versión nueva se borran las anteriores.
+Los PDF se escriben en un pool de procesos (projects.pdf no depende de Django).
+"""
+import hashlib
+import json
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Case, IntegerField, Prefetch, Value, When
+from django.utils import timezone
+
+from evaluation.models import Evaluaciones
+from .models import Formato1, Participacion, Proyecto
+from .pdf import escribir_pdf
+
+# Cambiar cuando cambie el contenido del documento, para regenerar todos
+VERSION_PLANTILLA = '1'
+TAMANO_LOTE = 500
+
+_CARACTERES_NO_VALIDOS = re.compile(r'[^\w-]')
+
+
+@dataclass
+class ResultadoDictamenes:
+    """Resumen de una generación: conteos, errores y velocidad."""
+    generados: int = 0
+    omitidos: int = 0
+    errores: list = field(default_factory=list)
+    segundos: float = 0.0
+
+    @property
+    def total(self):
+        return self.generados + self.omitidos + len(self.errores)
+
+    @property
+    def por_segundo(self):
+        if not self.segundos:
+            return 0.0
+        return self.total / self.segundos
+
+
+# ====================================================================
+# Contenido del dictamen
+# ====================================================================
+
+def _fecha(valor):
+    return timezone.localtime(valor).strftime('%d/%m/%Y') if valor else ''
+
+
+def bloques_dictamen(proyecto, formato1, evaluacion):
+    """Contenido del documento como lista de (estilo, texto); solo tipos simples."""
+    bloques = [
+        ('titulo', "DICTAMEN DE PROYECTO MODULAR"),
+        ('texto', f"FOLIO: {proyecto.folio}"),
+        ('texto', f"CALENDARIO: {proyecto.calendario_registro}"),
+        ('texto', f"TÍTULO: {proyecto.titulo}"),
+        ('texto', f"MODALIDAD: {proyecto.modalidad}" + (f" ({proyecto.variante})" if proyecto.variante else '')),
+        ('texto', f"MÓDULOS REGISTRADOS: {proyecto.nivel_competencia or ''}"),
+        ('texto', f"ASESOR: {proyecto.asesor.nombre_completo if proyecto.asesor else ''}"),
+        ('texto', f"EVALUADOR: {proyecto.evaluador.nombre_completo if proyecto.evaluador else ''}"),
+        ('texto', ''),
+        ('subtitulo', "PARTICIPANTES"),
+    ]
+    for participacion in proyecto.participacion_set.all():
+        alumno = participacion.alumno
+        rol = " (REPRESENTANTE)" if participacion.es_representante else ''
+        bloques.append(('texto', f"{alumno.codigo_estudiante} - {alumno.nombre_completo}{rol}"))
+
+    if formato1:
+        for titulo, texto in (
+            ("INTRODUCCIÓN", formato1.introduccion),
+            ("JUSTIFICACIÓN", formato1.justificacion),
+            ("OBJETIVO", formato1.objetivo),
+            ("RESUMEN", formato1.resumen),
+        ):
+            bloques += [('texto', ''), ('subtitulo', titulo), ('texto', texto)]
+
+    bloques += [('texto', ''), ('subtitulo', "RESULTADO DE LA EVALUACIÓN")]
+    if evaluacion:
+        bloques += [
+            ('texto', f"REVISIÓN: {evaluacion.get_tipo_revision_display().upper()}"),
+            ('texto', f"RESOLUTIVO: {evaluacion.resolutivo}"),
+            ('texto', f"FECHA: {_fecha(evaluacion.fecha_evaluacion)}"),
+            ('texto', f"OBSERVACIONES: {evaluacion.observaciones}"),
+        ]
+    else:
+        bloques.append(('texto', "SIN EVALUACIONES REGISTRADAS"))
+    bloques += [('texto', ''), ('subtitulo', f"DICTAMEN FINAL: {proyecto.dictamen}")]
+    return bloques
+
+
+def huella_dictamen(bloques):
+    contenido = json.dumps([VERSION_PLANTILLA, bloques], ensure_ascii=False)
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+def _nombre_archivo(folio, huella):
+    return f"{_CARACTERES_NO_VALIDOS.sub('_', folio)}/{huella[:16]}.pdf"
+
+
+def _borrar_versiones_anteriores(ruta):
+    for anterior in ruta.parent.glob('*.pdf'):
+        if anterior != ruta:
+            anterior.unlink(missing_ok=True)
+
+
+def url_dictamen(nombre):
+    """URL pública del archivo, o None si DICTAMENES_URL no está configurada."""
+    if not settings.DICTAMENES_URL:
+        return None
+    return settings.DICTAMENES_URL.rstrip('/') + '/' + nombre
+
+
+# ====================================================================
+# Carga por lotes
+# ====================================================================
+
+def _lotes_proyectos(proyectos, tamano_lote):
+    """
+    Recorre los proyectos por folio (keyset) y regresa cada lote con sus
+    relaciones cargadas: (proyecto, formato1, evaluación final).
+    """
+    proyectos = (
+        proyectos.order_by('folio')
+        .select_related('asesor', 'evaluador')
+        .prefetch_related(Prefetch(
+            'participacion_set',
+            queryset=Participacion.objects.select_related('alumno').order_by(
+                '-es_representante', 'alumno__codigo_estudiante'
+            ),
+        ))
+    )
+    ultimo = None
+    while True:
+        lote = proyectos if ultimo is None else proyectos.filter(folio__gt=ultimo)
+        lote = list(lote[:tamano_lote])
+        if not lote:
+            return
+        folios = [proyecto.folio for proyecto in lote]
+        # Una sola consulta: por folio (enlace histórico) o por la llave formato1
+        formatos = Formato1.objects.defer('documento_busqueda').in_bulk(
+            set(folios) | {proyecto.formato1_id for proyecto in lote if proyecto.formato1_id}
+        )
+        # La revisión FINAL más reciente; si no hay, la última evaluación
+        finales = {
+            evaluacion.proyecto_id: evaluacion
+            for evaluacion in Evaluaciones.objects.filter(proyecto__in=folios)
+            .annotate(es_final=Case(
+                When(tipo_revision='FINAL', then=Value(1)), default=Value(0), output_field=IntegerField(),
+            ))
+            .order_by('proyecto', '-es_final', '-fecha_evaluacion', '-id_evaluacion')
+            .distinct('proyecto')
+        }
+        yield [
+            (proyecto, formatos.get(proyecto.folio) or formatos.get(proyecto.formato1_id), finales.get(proyecto.folio))
+            for proyecto in lote
+        ]
+        ultimo = folios[-1]
+
+
+# ====================================================================
+# Generación
+# ====================================================================
+
+def _enviar_lote(pool, lote, destino, forzar, resultado):
+    """Manda al pool los PDF que cambiaron; regresa (futuros, proyectos con URL nueva)."""
+    futuros = {}
+    urls = []
+    for proyecto, formato1, evaluacion in lote:
+        bloques = bloques_dictamen(proyecto, formato1, evaluacion)
+        nombre = _nombre_archivo(proyecto.folio, huella_dictamen(bloques))
+        ruta = destino / nombre
+        if ruta.exists() and not forzar:
+            resultado.omitidos += 1
+        else:
+            ruta.parent.mkdir(exist_ok=True)
+            futuros[proyecto.folio] = pool.submit(escribir_pdf, (str(ruta), bloques))
+        url = url_dictamen(nombre)
+        if url and proyecto.protocolo_dictamen_url != url:
+            proyecto.protocolo_dictamen_url = url
+            urls.append(proyecto)
+    return futuros, urls
+
+
+def _recoger_lote(futuros, urls, resultado):
+    """Espera los PDF de un lote y guarda las URL de los que se escribieron."""
+    fallidos = set()
+    for folio, futuro in futuros.items():
+        try:
+            _borrar_versiones_anteriores(Path(futuro.result()))
+            resultado.generados += 1
+        except Exception as e:
+            resultado.errores.append((folio, str(e)))
+            fallidos.add(folio)
+
+    urls = [proyecto for proyecto in urls if proyecto.folio not in fallidos]
+    if urls:
+        ahora = timezone.now()
+        for proyecto in urls:
+            proyecto.actualizado = ahora
+        Proyecto.objects.bulk_update(urls, ['protocolo_dictamen_url', 'actualizado'])
+
+
+def generar_dictamenes(proyectos, procesos=None, forzar=False, tamano_lote=TAMANO_LOTE):
+    """
+    Genera los dictámenes de los proyectos del queryset. Omite los que ya
+    tienen su PDF con la huella actual (salvo `forzar`) y, si DICTAMENES_URL
+    está configurada, actualiza `protocolo_dictamen_url`.
+    """
+    destino = Path(settings.DICTAMENES_ROOT)
+    destino.mkdir(parents=True, exist_ok=True)
+    procesos = procesos or settings.DICTAMENES_PROCESOS
+    resultado = ResultadoDictamenes()
+    inicio = time.perf_counter()
+
+    # 'spawn': los procesos no heredan las conexiones a la base de datos
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as pool:
+        anterior = None
+        for lote in _lotes_proyectos(proyectos, tamano_lote):
+            actual = _enviar_lote(pool, lote, destino, forzar, resultado)
+            # El pool escribe este lote mientras se recoge el anterior y se lee el siguiente
+            if anterior:
+                _recoger_lote(*anterior, resultado)
+            anterior = actual
+        if anterior:
+            _recoger_lote(*anterior, resultado)
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
@@ -0,0 +1,204 @@
+"""
+Verificación concurrente de los enlaces de los proyectos
+(`evidencia_url` y `protocolo_dictamen_url`).
+
+Las URL se revisan con httpx en asyncio: concurrencia global acotada, y por
+host un máximo de solicitudes simultáneas y un intervalo mínimo entre
+solicitudes. El resultado se guarda por URL en VerificacionEnlace y no se
+vuelve a revisar hasta que pasa ENLACES_TTL_HORAS.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import VerificacionEnlace
+
+# Respuestas 200 que en realidad son la página de inicio de sesión
+HOSTS_INICIO_SESION = ('accounts.google.com', 'login.microsoftonline.com', 'login.live.com')
+
+CONCURRENCIA = 20
+CONCURRENCIA_POR_HOST = 2
+INTERVALO_POR_HOST = 0.2
+TIEMPO_LIMITE = 10.0
+LOTE_GUARDADO = 1000
+
+
+@dataclass
+class ResultadoVerificacion:
+    """Resumen de una verificación: conteos por estado y velocidad."""
+    por_estado: dict = field(default_factory=dict)
+    en_cache: int = 0
+    sin_revisar: int = 0
+    segundos: float = 0.0
+
+    @property
+    def verificados(self):
+        return sum(self.por_estado.values())
+
+    @property
+    def por_segundo(self):
+        if not self.segundos:
+            return 0.0
+        return self.verificados / self.segundos
+
+
+# ====================================================================
+# Verificación (asyncio)
+# ====================================================================
+
+class _LimiteHost:
+    """Solicitudes simultáneas y separación mínima entre solicitudes a un mismo host."""
+
+    def __init__(self, concurrencia, intervalo):
+        self.semaforo = asyncio.Semaphore(concurrencia)
+        self.intervalo = intervalo
+        self._candado = asyncio.Lock()
+        self._siguiente = 0.0
+
+    async def esperar_turno(self):
+        async with self._candado:
+            ahora = asyncio.get_running_loop().time()
+            espera = self._siguiente - ahora
+            self._siguiente = max(ahora, self._siguiente) + self.intervalo
+        if espera > 0:
+            await asyncio.sleep(espera)
+
+
+class _Limitador:
+    """Límite global de solicitudes en curso y un _LimiteHost por host."""
+
+    def __init__(self, concurrencia, por_host, intervalo):
+        self.semaforo = asyncio.Semaphore(concurrencia)
+        self.por_host = por_host
+        self.intervalo = intervalo
+        self._hosts = {}
+
+    def host(self, nombre):
+        if nombre not in self._hosts:
+            self._hosts[nombre] = _LimiteHost(self.por_host, self.intervalo)
+        return self._hosts[nombre]
+
+
+def clasificar(codigo, url_final):
+    """Estado de VerificacionEnlace a partir del código HTTP y la URL final."""
+    if 200 <= codigo < 400:
+        if urlsplit(url_final).hostname in HOSTS_INICIO_SESION:
+            return VerificacionEnlace.PRIVADO
+        return VerificacionEnlace.OK
+    if codigo in (401, 403):
+        return VerificacionEnlace.PRIVADO
+    return VerificacionEnlace.ROTO
+
+
+async def _verificar(cliente, url, limitador):
+    partes = urlsplit(url)
+    if partes.scheme not in ('http', 'https') or not partes.hostname:
+        return {'url': url, 'estado': VerificacionEnlace.ROTO, 'error': "URL inválida"}
+
+    limite = limitador.host(partes.hostname)
+    # Primero el turno del host y después el lugar global: las URL que esperan
+    # a un host saturado (Drive, Docs) no ocupan lugares que usarían otros hosts
+    async with limite.semaforo:
+        await limite.esperar_turno()
+        async with limitador.semaforo:
+            try:
+                respuesta = await cliente.head(url)
+                # Muchos servidores no aceptan HEAD; se repite con GET sin leer el cuerpo
+                if respuesta.status_code in (403, 405, 501):
+                    async with cliente.stream('GET', url) as respuesta:
+                        pass
+            except Exception as e:
+                return {'url': url, 'estado': VerificacionEnlace.ERROR, 'error': f"{type(e).__name__}: {e}"[:500]}
+
+    url_final = str(respuesta.url)
+    return {
+        'url': url,
+        'estado': clasificar(respuesta.status_code, url_final),
+        'codigo_http': respuesta.status_code,
+        'url_final': url_final[:500],
+    }
+
+
+async def verificar_urls(urls, concurrencia=CONCURRENCIA, por_host=CONCURRENCIA_POR_HOST,
+                         intervalo=INTERVALO_POR_HOST, tiempo_limite=TIEMPO_LIMITE):
+    """Verifica las URL concurrentemente; regresa una lista de diccionarios de resultado."""
+    import httpx
+
+    limitador = _Limitador(concurrencia, por_host, intervalo)
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=tiempo_limite,
+        limits=httpx.Limits(max_connections=concurrencia),
+        headers={'User-Agent': 'SIGAP verificador de enlaces'},
+    ) as cliente:
+        return await asyncio.gather(*(_verificar(cliente, url, limitador) for url in urls))
+
+
+# ====================================================================
+# Verificación de proyectos con caché en la base de datos
+# ====================================================================
+
+def urls_de_proyectos(proyectos):
+    """URL distintas (evidencia y protocolo) de los proyectos del queryset."""
+    urls = set()
+    for evidencia, protocolo in proyectos.order_by().values_list('evidencia_url', 'protocolo_dictamen_url'):
+        urls.update(url for url in (evidencia, protocolo) if url)
+    return urls
+
+
+def _vigentes(urls):
+    limite = timezone.now() - timedelta(hours=settings.ENLACES_TTL_HORAS)
+    urls = list(urls)
+    vigentes = set()
+    for inicio in range(0, len(urls), LOTE_GUARDADO):
+        vigentes.update(
+            VerificacionEnlace.objects.filter(
+                url__in=urls[inicio:inicio + LOTE_GUARDADO], fecha_verificacion__gte=limite,
+            ).values_list('url', flat=True)
+        )
+    return vigentes
+
+
+def verificar_enlaces(proyectos, forzar=False, maximo=None, **opciones):
+    """
+    Verifica los enlaces de los proyectos del queryset y guarda el
+    resultado. Las URL revisadas hace menos de ENLACES_TTL_HORAS se omiten,
+    salvo con `forzar`. Con `maximo` se revisan a lo más esas URL y el resto
+    queda en `sin_revisar`. `opciones` pasa a verificar_urls.
+    """
+    inicio = time.perf_counter()
+    resultado = ResultadoVerificacion()
+    urls = urls_de_proyectos(proyectos)
+    if not forzar:
+        vigentes = _vigentes(urls)
+        resultado.en_cache = len(vigentes)
+        urls -= vigentes
+
+    urls = sorted(urls)
+    if maximo is not None and len(urls) > maximo:
+        resultado.sin_revisar = len(urls) - maximo
+        urls = urls[:maximo]
+
+    filas = asyncio.run(verificar_urls(urls, **opciones)) if urls else []
+
+    ahora = timezone.now()
+    verificaciones = []
+    for fila in filas:
+        resultado.por_estado[fila['estado']] = resultado.por_estado.get(fila['estado'], 0) + 1
+        verificaciones.append(VerificacionEnlace(fecha_verificacion=ahora, **fila))
+    VerificacionEnlace.objects.bulk_create(
+        verificaciones,
+        batch_size=LOTE_GUARDADO,
+        update_conflicts=True,
+        unique_fields=['url'],
+        update_fields=['estado', 'codigo_http', 'url_final', 'error', 'fecha_verificacion'],
+    )
+
+    resultado.segundos = time.perf_counter() - inicio
+    return resultado
+
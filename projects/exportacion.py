@@ -0,0 +1,173 @@
+"""
+Exportación completa de proyectos (CSV en streaming o XLSX).
+
+Los proyectos se recorren con un cursor del lado del servidor
+(`iterator(chunk_size=...)`) y sus relaciones se cargan por lote, así que la
+memoria no crece con el número de filas y la primera línea sale de inmediato.
+Bajo ASGI, Django lee completo el iterador síncrono de un
+StreamingHttpResponse antes de enviarlo: ahí se usa `en_async`.
+"""
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from evaluation.models import Evaluaciones
+from .models import Formato1, Participacion
+
+TAMANO_LOTE = 500
+
+# ====================================================================
+# Hojas de la exportación
+# ====================================================================
+
+COLUMNAS_PROYECTOS = (
+    'FOLIO', 'TITULO', 'MODALIDAD', 'VARIANTE', 'NIVEL_COMPETENCIA', 'CALENDARIO',
+    'DICTAMEN', 'ULTIMA_REVISION', 'ULTIMO_RESOLUTIVO',
+    'ASESOR_CODIGO', 'ASESOR_NOMBRE', 'ASESOR_CORREO',
+    'EVALUADOR_CODIGO', 'EVALUADOR_NOMBRE', 'EVALUADOR_CORREO',
+    'INTRODUCCION', 'JUSTIFICACION', 'OBJETIVO', 'RESUMEN',
+    'ALUMNO_CODIGO', 'ALUMNO_NOMBRE', 'ALUMNO_CORREO', 'ES_REPRESENTANTE',
+)
+
+COLUMNAS_EVALUACIONES = (
+    'FOLIO', 'ID_EVALUACION', 'FECHA', 'TIPO_REVISION', 'RESOLUTIVO',
+    'EVALUADOR_CODIGO', 'EVALUADOR_NOMBRE', 'OBSERVACIONES',
+)
+
+
+def _lotes(iterable, tamano):
+    iterador = iter(iterable)
+    while lote := list(islice(iterador, tamano)):
+        yield lote
+
+
+def _fecha(valor):
+    return timezone.localtime(valor).strftime('%Y-%m-%d %H:%M') if valor else ''
+
+
+def filas_proyectos(proyectos, tamano_lote=TAMANO_LOTE):
+    """
+    Una fila por participante (los datos del proyecto se repiten); los
+    proyectos sin participantes salen en una fila con el alumno vacío.
+    """
+    proyectos = (
+        proyectos.order_by('folio')
+        .select_related('asesor', 'evaluador')
+        .prefetch_related(Prefetch(
+            'participacion_set',
+            queryset=Participacion.objects.select_related('alumno').order_by(
+                '-es_representante', 'alumno__codigo_estudiante'
+            ),
+        ))
+    )
+    for lote in _lotes(proyectos.iterator(chunk_size=tamano_lote), tamano_lote):
+        # Una sola consulta: por folio (enlace histórico) o por la llave formato1
+        formatos = Formato1.objects.defer('documento_busqueda').in_bulk(
+            {proyecto.folio for proyecto in lote} | {proyecto.formato1_id for proyecto in lote if proyecto.formato1_id}
+        )
+        for proyecto in lote:
+            asesor = proyecto.asesor
+            evaluador = proyecto.evaluador
+            formato1 = formatos.get(proyecto.folio) or formatos.get(proyecto.formato1_id)
+            base = [
+                proyecto.folio, proyecto.titulo, proyecto.modalidad, proyecto.variante or '',
+                proyecto.nivel_competencia or '', proyecto.calendario_registro, proyecto.dictamen,
+                proyecto.ultima_revision or '', proyecto.ultimo_resolutivo or '',
+                asesor.codigo_asesor if asesor else '',
+                asesor.nombre_completo if asesor else '',
+                (asesor.correo_electronico or '') if asesor else '',
+                evaluador.codigo_evaluador if evaluador else '',
+                evaluador.nombre_completo if evaluador else '',
+                (evaluador.correo_evaluador or '') if evaluador else '',
+                formato1.introduccion if formato1 else '',
+                formato1.justificacion if formato1 else '',
+                formato1.objetivo if formato1 else '',
+                formato1.resumen if formato1 else '',
+            ]
+            participaciones = proyecto.participacion_set.all()
+            if not participaciones:
+                yield base + ['', '', '', '']
+            for participacion in participaciones:
+                alumno = participacion.alumno
+                yield base + [
+                    alumno.codigo_estudiante, alumno.nombre_completo, alumno.correo_electronico or '',
+                    'SI' if participacion.es_representante else 'NO',
+                ]
+
+
+def filas_evaluaciones(proyectos, tamano_lote=TAMANO_LOTE):
+    """Historial completo de evaluaciones de los proyectos, en orden cronológico."""
+    evaluaciones = (
+        Evaluaciones.objects.filter(proyecto__in=proyectos.order_by().values('pk'))
+        .select_related('evaluador')
+        .order_by('proyecto', 'fecha_evaluacion', 'id_evaluacion')
+    )
+    for evaluacion in evaluaciones.iterator(chunk_size=tamano_lote):
+        evaluador = evaluacion.evaluador
+        yield [
+            evaluacion.proyecto_id, evaluacion.id_evaluacion, _fecha(evaluacion.fecha_evaluacion),
+            evaluacion.tipo_revision, evaluacion.resolutivo,
+            evaluador.codigo_evaluador if evaluador else '',
+            evaluador.nombre_completo if evaluador else '',
+            evaluacion.observaciones,
+        ]
+
+
+HOJAS = {
+    'proyectos': (COLUMNAS_PROYECTOS, filas_proyectos),
+    'evaluaciones': (COLUMNAS_EVALUACIONES, filas_evaluaciones),
+}
+
+
+# ====================================================================
+# Escritores
+# ====================================================================
+
+class _Eco:
+    """Pseudo-archivo para csv.writer: regresa la línea en vez de guardarla."""
+
+    def write(self, valor):
+        return valor
+
+
+def csv_en_streaming(hoja, proyectos, tamano_lote=TAMANO_LOTE):
+    """
+    Genera el CSV línea por línea (para StreamingHttpResponse o un archivo).
+    Empieza con BOM para que Excel reconozca UTF-8.
+    """
+    columnas, filas = HOJAS[hoja]
+    escritor = csv.writer(_Eco())
+    yield '\ufeff' + escritor.writerow(columnas)
+    for fila in filas(proyectos, tamano_lote):
+        yield escritor.writerow(fila)
+
+
+async def en_async(lineas, tamano_lote=TAMANO_LOTE):
+    """
+    Iterador asíncrono sobre `lineas` para StreamingHttpResponse bajo ASGI.
+    Las consultas siguen en el hilo de la petición (thread_sensitive) y cada
+    salto trae `tamano_lote` líneas, no una.
+    """
+    lineas = iter(lineas)
+    siguientes = sync_to_async(lambda: ''.join(islice(lineas, tamano_lote)))
+    while bloque := await siguientes():
+        yield bloque
+
+
+def escribir_xlsx(destino, proyectos, tamano_lote=TAMANO_LOTE):
+    """
+    Escribe todas las hojas en un XLSX. El libro en modo write_only manda
+    las filas a disco conforme llegan, sin guardarlas en memoria.
+    """
+    from openpyxl import Workbook
+
+    libro = Workbook(write_only=True)
+    for nombre, (columnas, filas) in HOJAS.items():
+        hoja = libro.create_sheet(title=nombre.upper())
+        hoja.append(columnas)
+        for fila in filas(proyectos, tamano_lote):
+            hoja.append(fila)
+    libro.save(destino)
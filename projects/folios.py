@@ -0,0 +1,63 @@
+"""
+Asignación de folios de proyecto por calendario (`2025B-00042`).
+
+Cada calendario tiene una fila en ContadorFolio. Asignar es un solo
+UPDATE ... RETURNING (o un INSERT ... ON CONFLICT la primera vez) que
+bloquea solo la fila de ese calendario hasta el final de la transacción:
+no hay candados de tabla y los demás calendarios no esperan.
+
+A diferencia de una secuencia, el contador se revierte con la transacción,
+así que los folios no tienen huecos: se debe asignar dentro de la misma
+transacción que crea los proyectos. Para cargas masivas se pide un bloque
+de `cantidad` folios con una sola sentencia.
+"""
+import re
+
+from django.db import connection, transaction
+
+from .models import ContadorFolio, Proyecto
+
+DIGITOS = 5
+
+
+def formatear_folio(calendario, numero):
+    return f"{calendario}-{numero:0{DIGITOS}d}"
+
+
+def _ultimo_existente(calendario):
+    """Mayor número entre los folios ya capturados con el formato del calendario."""
+    patron = rf'^{re.escape(calendario)}-[0-9]{{1,9}}$'
+    folios = Proyecto.objects.filter(folio__regex=patron).values_list('folio', flat=True)
+    return max((int(folio.rsplit('-', 1)[1]) for folio in folios), default=0)
+
+
+def asignar_folios(calendario, cantidad=1):
+    """
+    Regresa `cantidad` folios consecutivos nuevos del calendario. La fila
+    del contador queda bloqueada hasta que termine la transacción en curso.
+    """
+    if cantidad < 1:
+        return []
+    calendario = calendario.strip().upper()
+    tabla = connection.ops.quote_name(ContadorFolio._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {tabla} SET ultimo = ultimo + %s WHERE calendario = %s RETURNING ultimo",
+            [cantidad, calendario],
+        )
+        fila = cursor.fetchone()
+        if fila is None:
+            # Primer folio del calendario: continúa después de los capturados a mano
+            cursor.execute(
+                f"INSERT INTO {tabla} (calendario, ultimo) VALUES (%s, %s) "
+                f"ON CONFLICT (calendario) DO UPDATE SET ultimo = {tabla}.ultimo + %s "
+                f"RETURNING ultimo",
+                [calendario, _ultimo_existente(calendario) + cantidad, cantidad],
+            )
+            fila = cursor.fetchone()
+    ultimo = fila[0]
+    return [formatear_folio(calendario, numero) for numero in range(ultimo - cantidad + 1, ultimo + 1)]
+
+
+def asignar_folio(calendario):
+    return asignar_folios(calendario, 1)[0]
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from projects.busqueda import actualizar_documentos
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = "Recalcula el documento de búsqueda de los proyectos (p. ej. tras cargas masivas)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendario', help="Solo los proyectos de este calendario.")
+        parser.add_argument('--lote', type=int, default=2000, help="Proyectos por UPDATE.")
+
+    def handle(self, *args, **options):
+        proyectos = Proyecto.objects.order_by('folio')
+        if options['calendario']:
+            proyectos = proyectos.filter(calendario_registro=options['calendario'].upper())
+
+        # Recorrido por folio (keyset) para mantener cada UPDATE corto
+        total = 0
+        ultimo = None
+        while True:
+            lote = proyectos
+            if ultimo is not None:
+                lote = lote.filter(folio__gt=ultimo)
+            folios = list(lote.values_list('folio', flat=True)[:options['lote']])
+            if not folios:
+                break
+            total += actualizar_documentos(Proyecto.objects.filter(folio__in=folios))
+            ultimo = folios[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"{total} documentos de búsqueda actualizados."))
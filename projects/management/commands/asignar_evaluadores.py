@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.asignacion import PENALIZACION_ESPECIALIDAD, asignar_evaluadores
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Asigna evaluador a los proyectos sin evaluador de un calendario, "
+        "equilibrando la carga abierta y la afinidad de especialización."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('calendario', help="Calendario de registro (p. ej. 2025A).")
+        parser.add_argument('--simular', action='store_true', help="Solo muestra el plan; no guarda nada.")
+        parser.add_argument('--penalizacion', type=int, default=PENALIZACION_ESPECIALIDAD,
+                            help="Proyectos de diferencia para preferir a un evaluador no afín.")
+        parser.add_argument('--maximo', type=int, help="Carga abierta máxima por evaluador.")
+        parser.add_argument('--detalle', action='store_true', help="Lista cada proyecto con su evaluador.")
+
+    def handle(self, *args, **options):
+        calendario = options['calendario'].upper()
+        proyectos = Proyecto.objects.filter(calendario_registro=calendario)
+        if not proyectos.exists():
+            raise CommandError(f"No hay proyectos en el calendario {calendario}.")
+
+        resultado = asignar_evaluadores(
+            proyectos,
+            simular=options['simular'],
+            penalizacion=options['penalizacion'],
+            maximo=options['maximo'],
+        )
+
+        if options['detalle']:
+            for proyecto, evaluador in resultado.asignaciones:
+                self.stdout.write(f"{proyecto.folio}\t{proyecto.modalidad}\t{evaluador.pk}\t{evaluador.especializacion or ''}")
+
+        finales = [resultado.carga_inicial.get(codigo, 0) + nuevos for codigo, nuevos in resultado.nuevos.items()]
+        self.stdout.write(
+            f"{len(resultado.asignaciones)} proyectos asignados a {len(resultado.nuevos)} evaluadores "
+            f"({resultado.no_afines} sin especialización afín, {resultado.sin_asignar} sin evaluador disponible)."
+        )
+        if finales:
+            self.stdout.write(f"Carga abierta final de los evaluadores asignados: {min(finales)} a {max(finales)}.")
+
+        estado = "Plan calculado (simulación, no se guardó nada)" if options['simular'] else "Asignación guardada"
+        self.stdout.write(self.style.SUCCESS(f"{estado} en {resultado.segundos:.2f} s."))
@@ -0,0 +1,101 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from evaluation.models import Evaluaciones
+from people.busqueda import buscar_personas
+from people.models import Alumno
+from projects.busqueda import buscar_proyectos
+from projects.models import Participacion, Proyecto
+
+
+def consultas_admin():
+    """
+    Consultas principales del admin, con valores de ejemplo tomados de los
+    datos existentes. Regresa una lista de (nombre, queryset).
+    """
+    ejemplo = Proyecto.objects.order_by('-calendario_registro').values(
+        'folio', 'calendario_registro', 'dictamen', 'modalidad', 'titulo'
+    ).first()
+    if not ejemplo:
+        return []
+
+    proyectos = Proyecto.objects.select_related('asesor', 'evaluador').order_by('-folio')
+    palabra = (ejemplo['titulo'] or ejemplo['folio']).split()[0]
+    return [
+        ("Listado de proyectos", proyectos[:100]),
+        ("Filtro por calendario", proyectos.filter(calendario_registro=ejemplo['calendario_registro'])[:100]),
+        ("Filtro por calendario y dictamen", proyectos.filter(
+            calendario_registro=ejemplo['calendario_registro'], dictamen=ejemplo['dictamen'],
+        )[:100]),
+        ("Pendientes del calendario", proyectos.filter(
+            calendario_registro=ejemplo['calendario_registro'], dictamen='PENDIENTE',
+        )[:100]),
+        ("Filtro por modalidad", proyectos.filter(modalidad=ejemplo['modalidad'])[:100]),
+        ("Búsqueda de proyectos", buscar_proyectos(proyectos, palabra)[:100]),
+        ("Participantes del proyecto", Participacion.objects.select_related('alumno').filter(
+            proyecto_id=ejemplo['folio'],
+        )),
+        ("Historial de evaluaciones", Evaluaciones.objects.filter(proyecto_id=ejemplo['folio'])),
+        ("Autocompletado de alumnos", buscar_personas(
+            Alumno.objects.all(), 'PEREZ', 'codigo_estudiante', ('nombre_completo', 'correo_electronico'),
+        )[:20]),
+    ]
+
+
+def _nodos(plan):
+    yield plan
+    for hijo in plan.get('Plans', ()):
+        yield from _nodos(hijo)
+
+
+def _filas_por_tabla(tablas):
+    if not tablas:
+        return {}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(%s)",
+            [list(tablas)],
+        )
+        return dict(cursor.fetchall())
+
+
+class Command(BaseCommand):
+    help = (
+        "Ejecuta EXPLAIN sobre las consultas principales del admin y marca los "
+        "Seq Scan sobre tablas grandes. Útil después de cada cambio de esquema."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--analyze', action='store_true', help="Usa EXPLAIN ANALYZE (ejecuta las consultas).")
+        parser.add_argument('--min-filas', type=int, default=10000,
+                            help="Solo se marcan los Seq Scan en tablas con al menos estas filas.")
+        parser.add_argument('--plan', action='store_true', help="Muestra el plan completo de cada consulta.")
+        parser.add_argument('--estricto', action='store_true', help="Termina con error si hay consultas marcadas.")
+
+    def handle(self, *args, **options):
+        consultas = consultas_admin()
+        if not consultas:
+            raise CommandError("No hay proyectos; no hay valores de ejemplo para las consultas.")
+
+        marcadas = 0
+        for nombre, queryset in consultas:
+            plan = json.loads(queryset.explain(format='json', analyze=options['analyze']))[0]['Plan']
+            escaneos = [n['Relation Name'] for n in _nodos(plan) if n['Node Type'] == 'Seq Scan']
+            filas = _filas_por_tabla(escaneos)
+            grandes = [t for t in escaneos if filas.get(t, 0) >= options['min_filas']]
+
+            if grandes:
+                marcadas += 1
+                detalle = ', '.join(f"{t} (~{filas[t]} filas)" for t in grandes)
+                self.stdout.write(self.style.WARNING(f"⚠ {nombre}: Seq Scan en {detalle}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"✔ {nombre}"))
+
+            if options['plan']:
+                self.stdout.write(queryset.explain(analyze=options['analyze']))
+                self.stdout.write('')
+
+        if marcadas and options['estricto']:
+            raise CommandError(f"{marcadas} consultas con Seq Scan sobre tablas grandes.")
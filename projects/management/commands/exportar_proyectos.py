@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.exportacion import HOJAS, TAMANO_LOTE, csv_en_streaming, escribir_xlsx
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Exporta los proyectos con participantes, asesor, evaluador, Formato 1 e "
+        "historial de evaluaciones. CSV (una hoja) o XLSX (todas las hojas)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendario', help="Solo los proyectos de este calendario.")
+        parser.add_argument('--formato', choices=['csv', 'xlsx'], default='csv')
+        parser.add_argument('--hoja', choices=sorted(HOJAS), default='proyectos',
+                            help="Hoja a exportar en CSV (el XLSX las incluye todas).")
+        parser.add_argument('--salida', help="Archivo de salida; en CSV, sin él se escribe a la salida estándar.")
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE, help="Proyectos por lote de lectura.")
+
+    def handle(self, *args, **options):
+        proyectos = Proyecto.objects.all()
+        if options['calendario']:
+            proyectos = proyectos.filter(calendario_registro=options['calendario'].upper())
+
+        if options['formato'] == 'xlsx':
+            if not options['salida']:
+                raise CommandError("El formato XLSX requiere --salida.")
+            try:
+                escribir_xlsx(options['salida'], proyectos, options['lote'])
+            except ImportError:
+                raise CommandError("Se requiere openpyxl para exportar archivos XLSX.")
+        else:
+            lineas = csv_en_streaming(options['hoja'], proyectos, options['lote'])
+            if options['salida']:
+                with open(options['salida'], 'w', newline='', encoding='utf-8') as salida:
+                    salida.writelines(lineas)
+            else:
+                # Por self.stdout, para que call_command(stdout=...) lo capture
+                for linea in lineas:
+                    self.stdout.write(linea, ending='')
+                return
+
+        self.stdout.write(self.style.SUCCESS(f"Exportación guardada en {options['salida']}."))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.datos_prueba import borrar_calendarios, generar_datos, nombres_calendarios
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera datos sintéticos con bulk_create: alumnos, asesores, evaluadores y, por "
+        "calendario, proyectos con 3 a 5 participantes, Formato 1, evaluaciones y prórrogas. "
+        "Solo para bases de desarrollo o de medición."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--inicio', default='2020A', help="Primer calendario (2020A, 2020B, ...).")
+        parser.add_argument('--calendarios', type=int, default=6, help="Número de calendarios consecutivos.")
+        parser.add_argument('--proyectos', type=int, default=5000, help="Proyectos por calendario.")
+        parser.add_argument('--alumnos', type=int, default=100000, help="Alumnos del padrón.")
+        parser.add_argument('--asesores', type=int, default=400)
+        parser.add_argument('--evaluadores', type=int, default=300)
+        parser.add_argument('--semilla', type=int, default=1, help="Misma semilla, mismos datos.")
+        parser.add_argument('--reemplazar', action='store_true',
+                            help="Borra antes los proyectos existentes de esos calendarios.")
+
+    def handle(self, *args, **options):
+        calendarios = nombres_calendarios(options['inicio'], options['calendarios'])
+        existentes = Proyecto.objects.filter(calendario_registro__in=calendarios).count()
+        if existentes and not options['reemplazar']:
+            raise CommandError(
+                f"Ya hay {existentes} proyectos en {', '.join(calendarios)}; use --reemplazar para borrarlos."
+            )
+        if existentes:
+            self.stdout.write(f"{borrar_calendarios(calendarios)} filas borradas.")
+
+        resultado = generar_datos(
+            calendarios,
+            options['proyectos'],
+            options['alumnos'],
+            asesores=options['asesores'],
+            evaluadores=options['evaluadores'],
+            semilla=options['semilla'],
+        )
+
+        for nombre, total in resultado.filas.items():
+            self.stdout.write(f"  {nombre}: {total}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Calendarios {', '.join(calendarios)} generados en {resultado.segundos:.2f} s."
+        ))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from projects.dictamenes import TAMANO_LOTE, generar_dictamenes
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera los dictámenes en PDF de los proyectos en un pool de procesos. "
+        "Los proyectos sin cambios desde la última generación se omiten."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendario', help="Solo los proyectos de este calendario.")
+        parser.add_argument('--folio', action='append', help="Solo este proyecto (se puede repetir).")
+        parser.add_argument('--procesos', type=int, help="Procesos del pool (por omisión DICTAMENES_PROCESOS).")
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE, help="Proyectos por lote de lectura.")
+        parser.add_argument('--forzar', action='store_true', help="Regenera aunque el PDF esté al día.")
+
+    def handle(self, *args, **options):
+        proyectos = Proyecto.objects.all()
+        if options['calendario']:
+            proyectos = proyectos.filter(calendario_registro=options['calendario'].upper())
+        if options['folio']:
+            proyectos = proyectos.filter(folio__in=[folio.upper() for folio in options['folio']])
+
+        resultado = generar_dictamenes(
+            proyectos, procesos=options['procesos'], forzar=options['forzar'], tamano_lote=options['lote'],
+        )
+
+        for folio, mensaje in resultado.errores[:50]:
+            self.stderr.write(f"{folio}: {mensaje}")
+        if len(resultado.errores) > 50:
+            self.stderr.write(f"... y {len(resultado.errores) - 50} errores más.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado.generados} dictámenes generados, {resultado.omitidos} sin cambios, "
+            f"{len(resultado.errores)} con errores en {resultado.segundos:.2f} s "
+            f"— {resultado.por_segundo:.0f} proyectos/s."
+        ))
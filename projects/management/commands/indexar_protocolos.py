@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from projects.similitud import TAMANO_LOTE, indexar_pendientes
+
+
+class Command(BaseCommand):
+    help = (
+        "Calcula las huellas MinHash de los Formato1 para la detección de protocolos casi "
+        "duplicados. Por omisión solo los que no tienen huella o la tienen de otra versión."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--todos', action='store_true', help="Recalcula también las huellas vigentes.")
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE, help="Protocolos por lote.")
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+
+        def al_avanzar(indexados):
+            self.stdout.write(f"  {indexados} protocolos indexados…")
+
+        total = indexar_pendientes(todos=options['todos'], tamano_lote=options['lote'], al_avanzar=al_avanzar)
+
+        segundos = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(f"{total} huellas actualizadas en {segundos:.1f} s."))
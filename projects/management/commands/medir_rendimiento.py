@@ -0,0 +1,72 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.rendimiento import REPETICIONES, comparar, ejecutar_suite
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide consultas y tiempo del changelist de proyectos (con búsqueda y cada filtro), "
+        "del formulario con sus inlines, de las acciones de correo y de la importación masiva. "
+        "No deja cambios en la base."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeticiones', type=int, default=REPETICIONES, help="Repeticiones por caso.")
+        parser.add_argument('--solo', action='append', help="Solo los casos que empiezan así (se puede repetir).")
+        parser.add_argument('--salida', help="Guarda el resultado en este JSON.")
+        parser.add_argument('--comparar', help="JSON de una corrida anterior para comparar.")
+        parser.add_argument('--umbral', type=float, default=0.2,
+                            help="Aumento relativo de la mediana que cuenta como regresión (0.2 = 20%%).")
+        parser.add_argument('--estricto', action='store_true', help="Termina con error si hay regresiones.")
+
+    def handle(self, *args, **options):
+        anterior = None
+        if options['comparar']:
+            try:
+                with open(options['comparar'], encoding='utf-8') as archivo:
+                    anterior = json.load(archivo)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"No se pudo leer {options['comparar']}: {e}")
+
+        self.stdout.write(f"{'CASO':<44}{'CONSULTAS':>10}{'MEDIANA ms':>12}{'MÍN ms':>10}{'MÁX ms':>10}")
+
+        def al_medir(nombre, medicion):
+            datos = medicion.como_dict()
+            if medicion.error:
+                self.stdout.write(self.style.ERROR(f"{nombre:<44}{medicion.error}"))
+                return
+            self.stdout.write(
+                f"{nombre:<44}{datos['consultas']:>10}{datos['mediana_ms']:>12.1f}"
+                f"{datos['minimo_ms']:>10.1f}{datos['maximo_ms']:>10.1f}"
+            )
+
+        resultado = ejecutar_suite(options['repeticiones'], options['solo'], al_medir)
+        if not resultado['casos']:
+            raise CommandError("No hay proyectos; genere datos primero con `generar_datos`.")
+
+        if options['salida']:
+            with open(options['salida'], 'w', encoding='utf-8') as archivo:
+                json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Resultado guardado en {options['salida']}."))
+
+        if anterior:
+            regresiones = 0
+            self.stdout.write('')
+            self.stdout.write(f"Comparación con {options['comparar']} ({anterior.get('commit') or 'sin commit'}):")
+            for nombre, antes, ahora, cambio, consultas_antes, consultas_ahora, regresion, motivo in comparar(
+                anterior, resultado, options['umbral'],
+            ):
+                regresiones += regresion
+                if motivo:
+                    # Los tiempos de una respuesta fallida no se comparan
+                    self.stdout.write(self.style.ERROR(f"{nombre:<44}{antes:>10.1f} → no comparable: {motivo}"))
+                    continue
+                linea = (
+                    f"{nombre:<44}{antes:>10.1f} → {ahora:<10.1f}{cambio:>+8.0%}"
+                    f"{consultas_antes:>8} → {consultas_ahora}"
+                )
+                self.stdout.write(self.style.WARNING(linea) if regresion else linea)
+            if regresiones and options['estricto']:
+                raise CommandError(f"{regresiones} casos con regresión.")
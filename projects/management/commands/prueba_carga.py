@@ -0,0 +1,155 @@
+import asyncio
+import random
+import uuid
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.admin.utils import quote
+from django.core.management.base import BaseCommand, CommandError
+
+from people.models import Alumno, Asesor
+from projects.models import Participacion, Proyecto
+from SIGAP.carga import Peticion, ejecutar_carga
+
+MUESTRA_FOLIOS = 500
+# Fracción de envíos del portal que repiten uno anterior (mismo token)
+REENVIOS = 0.1
+
+
+class Command(BaseCommand):
+    help = (
+        "Prueba de carga contra un servidor en ejecución (admin, API y /salud/). "
+        "Las rutas salen de los datos de esta base con una semilla fija; reporta p50/p99 y peticiones/s."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help="URL base del servidor.")
+        parser.add_argument('--usuarios', type=int, default=20, help="Usuarios virtuales concurrentes.")
+        parser.add_argument('--duracion', type=float, default=30.0, help="Segundos de la prueba.")
+        parser.add_argument('--semilla', type=int, default=1, help="Semilla de la elección de rutas.")
+        parser.add_argument('--usuario', help="Usuario staff del admin (sin él se omiten las páginas del admin).")
+        parser.add_argument('--contrasena', help="Contraseña del usuario del admin.")
+        parser.add_argument('--token', help="Token de la API (por omisión el primero de API_TOKENS).")
+        parser.add_argument('--solo', action='append', help="Solo este tipo de petición (se puede repetir).")
+        parser.add_argument('--registro', action='store_true',
+                            help="Incluye envíos al portal de registro. CREA proyectos en REGISTRO_CALENDARIO; "
+                                 "solo para bases de prueba.")
+
+    def envios_registro(self, azar, calendario):
+        """
+        Genera cuerpos para /registro/proyectos/: cada envío nuevo usa alumnos
+        que aún no tienen proyecto en el calendario, y una fracción repite un
+        envío anterior para ejercitar la idempotencia.
+        """
+        asesores = list(Asesor.objects.order_by('pk').values_list('pk', flat=True))
+        ocupados = Participacion.objects.filter(proyecto__calendario_registro=calendario).values('alumno')
+        libres = list(
+            Alumno.objects.exclude(pk__in=ocupados).exclude(correo_electronico=None)
+            .order_by('pk').values_list('pk', 'correo_electronico')
+        )
+        if not asesores or not libres:
+            raise CommandError(f"No hay asesores o alumnos libres para registrar en {calendario}.")
+        azar.shuffle(libres)
+        pendientes = iter(libres)
+        enviados = []
+
+        def cuerpo(azar_usuario):
+            grupo = [] if enviados and azar_usuario.random() < REENVIOS else list(
+                islice(pendientes, azar_usuario.randint(1, 4))
+            )
+            if not grupo:
+                return azar_usuario.choice(enviados)
+            (representante, correo), otros = grupo[0], grupo[1:]
+            datos = {
+                'token': str(uuid.UUID(int=azar_usuario.getrandbits(128))),
+                'representante': representante,
+                'correo': correo,
+                'participantes': [codigo for codigo, _ in otros],
+                'titulo': f"PROYECTO DE PRUEBA DE CARGA {len(enviados) + 1}",
+                'modalidad': azar_usuario.choice(Proyecto.MODALIDAD_CHOICES)[0],
+                'asesor': azar_usuario.choice(asesores),
+                'introduccion': "INTRODUCCIÓN DE PRUEBA",
+                'justificacion': "JUSTIFICACIÓN DE PRUEBA",
+                'objetivo': "OBJETIVO DE PRUEBA",
+                'resumen': "RESUMEN DE PRUEBA",
+            }
+            enviados.append(datos)
+            return datos
+
+        return cuerpo
+
+    def escenario(self, options):
+        azar = random.Random(options['semilla'])
+        folios = list(Proyecto.objects.order_by('folio').values_list('folio', flat=True))
+        if not folios:
+            raise CommandError("No hay proyectos en la base; genere datos primero.")
+        folios = sorted(azar.sample(folios, min(MUESTRA_FOLIOS, len(folios))))
+        calendarios = sorted(set(
+            Proyecto.objects.order_by().values_list('calendario_registro', flat=True).distinct()
+        ))
+
+        escenario = [Peticion('salud', 1, ['/salud/'])]
+
+        token = options['token'] or (settings.API_TOKENS[0] if settings.API_TOKENS else None)
+        if token:
+            api = {'Authorization': f'Bearer {token}'}
+            escenario += [
+                Peticion('api_listado', 4, [f'/api/proyectos/?calendario={c}&limite=100' for c in calendarios], api),
+                Peticion('api_proyecto', 6, [f'/api/proyectos/{folio}/' for folio in folios], api),
+            ]
+
+        if options['usuario']:
+            escenario += [
+                Peticion('admin_listado', 3, [
+                    f'/admin/projects/proyecto/?calendario_registro__exact={c}' for c in calendarios
+                ]),
+                Peticion('admin_busqueda', 2, [f'/admin/projects/proyecto/?q={folio}' for folio in folios]),
+                Peticion('admin_proyecto', 2, [
+                    f'/admin/projects/proyecto/{quote(folio)}/change/' for folio in folios
+                ]),
+                Peticion('admin_tablero', 1, [
+                    f'/admin/reports/totalescalendario/?calendario={c}' for c in calendarios
+                ]),
+            ]
+
+        if options['registro']:
+            calendario = settings.REGISTRO_CALENDARIO
+            if not calendario:
+                raise CommandError("Defina REGISTRO_CALENDARIO (el mismo que usa el servidor).")
+            escenario += [
+                Peticion('registro_catalogo', 1, ['/registro/catalogo/']),
+                Peticion('registro_envio', 4, ['/registro/proyectos/'],
+                         cuerpo=self.envios_registro(azar, calendario)),
+            ]
+
+        if options['solo']:
+            escenario = [peticion for peticion in escenario if peticion.nombre in options['solo']]
+        if not escenario:
+            raise CommandError("El escenario quedó vacío.")
+        return escenario
+
+    def handle(self, *args, **options):
+        escenario = self.escenario(options)
+        credenciales = None
+        if options['usuario']:
+            credenciales = (options['usuario'], options['contrasena'] or '')
+
+        self.stdout.write(
+            f"{options['usuarios']} usuarios durante {options['duracion']:.0f} s contra {options['url']}: "
+            + ', '.join(peticion.nombre for peticion in escenario)
+        )
+        try:
+            resultado = asyncio.run(ejecutar_carga(
+                options['url'], escenario,
+                usuarios=options['usuarios'],
+                duracion=options['duracion'],
+                semilla=options['semilla'],
+                credenciales=credenciales,
+            ))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f"{'PETICIÓN':<16}{'TOTAL':>8}{'ERRORES':>9}{'P50 ms':>9}{'P99 ms':>9}{'REQ/S':>9}")
+        for nombre, total, errores, p50, p99, por_segundo in resultado.filas():
+            linea = f"{nombre:<16}{total:>8}{errores:>9}{p50:>9.1f}{p99:>9.1f}{por_segundo:>9.1f}"
+            self.stdout.write(self.style.SUCCESS(linea) if nombre == 'TOTAL' else linea)
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from projects.enlaces import (
+    CONCURRENCIA, CONCURRENCIA_POR_HOST, INTERVALO_POR_HOST, TIEMPO_LIMITE, verificar_enlaces,
+)
+from projects.models import Proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Verifica concurrentemente las URL de evidencia y de protocolo de los proyectos. "
+        "Las URL revisadas dentro de ENLACES_TTL_HORAS se omiten."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendario', help="Solo los proyectos de este calendario.")
+        parser.add_argument('--folio', action='append', help="Solo este proyecto (se puede repetir).")
+        parser.add_argument('--concurrencia', type=int, default=CONCURRENCIA, help="Solicitudes simultáneas en total.")
+        parser.add_argument('--por-host', type=int, default=CONCURRENCIA_POR_HOST, help="Solicitudes simultáneas por host.")
+        parser.add_argument('--intervalo', type=float, default=INTERVALO_POR_HOST, help="Segundos mínimos entre solicitudes a un mismo host.")
+        parser.add_argument('--tiempo-limite', type=float, default=TIEMPO_LIMITE, help="Segundos máximos por solicitud.")
+        parser.add_argument('--forzar', action='store_true', help="Revisa aunque el resultado siga vigente.")
+
+    def handle(self, *args, **options):
+        proyectos = Proyecto.objects.all()
+        if options['calendario']:
+            proyectos = proyectos.filter(calendario_registro=options['calendario'].upper())
+        if options['folio']:
+            proyectos = proyectos.filter(folio__in=[folio.upper() for folio in options['folio']])
+
+        resultado = verificar_enlaces(
+            proyectos,
+            forzar=options['forzar'],
+            concurrencia=options['concurrencia'],
+            por_host=options['por_host'],
+            intervalo=options['intervalo'],
+            tiempo_limite=options['tiempo_limite'],
+        )
+
+        for estado, total in sorted(resultado.por_estado.items()):
+            self.stdout.write(f"{estado:<8} {total}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado.verificados} URL verificadas, {resultado.en_cache} vigentes sin revisar, "
+            f"en {resultado.segundos:.2f} s — {resultado.por_segundo:.1f} URL/s."
+        ))
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Llena el documento de los proyectos existentes (mismo contenido que
+# projects.busqueda.documento_busqueda).
+LLENAR_DOCUMENTOS = """
+UPDATE projects_proyecto p
+SET documento_busqueda = to_tsvector('simple'::regconfig, concat_ws(' ',
+    p.folio,
+    p.titulo,
+    (SELECT a.nombre_completo FROM people_asesor a WHERE a.codigo_asesor = p.asesor_id),
+    (SELECT e.nombre_completo FROM people_evaluador e WHERE e.codigo_evaluador = p.evaluador_id),
+    (SELECT string_agg(al.codigo_estudiante || ' ' || al.nombre_completo, ' ')
+       FROM projects_participacion pa
+       JOIN people_alumno al ON al.codigo_estudiante = pa.alumno_id
+      WHERE pa.proyecto_id = p.folio)
+));
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0001_initial'),
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proyecto',
+            name='documento_busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['documento_busqueda'], name='proyecto_busqueda_gin'),
+        ),
+        migrations.RunSQL(LLENAR_DOCUMENTOS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_busqueda_trigramas'),
+        ('projects', '0002_proyecto_documento_busqueda'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['calendario_registro', 'dictamen'], name='proyecto_cal_dictamen_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(condition=models.Q(('dictamen', 'PENDIENTE')), fields=['calendario_registro'], name='proyecto_pendientes_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_busqueda_trigramas'),
+        ('projects', '0003_indices_filtros_admin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proyecto',
+            name='fecha_ultima_evaluacion',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='FECHA DE ÚLTIMA EVALUACIÓN'),
+        ),
+        migrations.AddField(
+            model_name='proyecto',
+            name='total_evaluaciones',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='NÚMERO DE REVISIONES'),
+        ),
+        migrations.AddField(
+            model_name='proyecto',
+            name='ultima_revision',
+            field=models.CharField(blank=True, editable=False, max_length=10, null=True, verbose_name='ÚLTIMA REVISIÓN'),
+        ),
+        migrations.AddField(
+            model_name='proyecto',
+            name='ultimo_resolutivo',
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True, verbose_name='ÚLTIMO RESOLUTIVO'),
+        ),
+        migrations.AddIndex(
+            model_name='proyecto',
+            index=models.Index(fields=['ultima_revision', 'ultimo_resolutivo'], name='proyecto_estado_eval_idx'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:10
+
+import SIGAP.fields
+from django.db import migrations
+
+from SIGAP.fields import mayusculas_por_lotes
+
+
+def convertir_existentes(apps, schema_editor):
+    # Las llaves primarias ya se capturaban en mayúsculas
+    mayusculas_por_lotes(apps.get_model('projects', 'Formato1'), ['introduccion', 'justificacion', 'objetivo', 'resumen'])
+    mayusculas_por_lotes(apps.get_model('projects', 'Prorroga'), ['justificacion', 'calendario_presentacion'])
+    mayusculas_por_lotes(apps.get_model('projects', 'Proyecto'), ['titulo', 'variante', 'nivel_competencia', 'dictamen', 'calendario_registro'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_proyecto_estado_evaluacion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='formato1',
+            name='folio',
+            field=SIGAP.fields.MayusculasCharField(max_length=50, primary_key=True, serialize=False, verbose_name='FOLIO PROYECTO'),
+        ),
+        migrations.AlterField(
+            model_name='formato1',
+            name='introduccion',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='INTRODUCCIÓN'),
+        ),
+        migrations.AlterField(
+            model_name='formato1',
+            name='justificacion',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='JUSTIFICACIÓN'),
+        ),
+        migrations.AlterField(
+            model_name='formato1',
+            name='objetivo',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='OBJETIVO'),
+        ),
+        migrations.AlterField(
+            model_name='formato1',
+            name='resumen',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='RESUMEN'),
+        ),
+        migrations.AlterField(
+            model_name='prorroga',
+            name='calendario_presentacion',
+            field=SIGAP.fields.MayusculasCharField(max_length=10, verbose_name='CALENDARIO PARA PRESENTACIÓN'),
+        ),
+        migrations.AlterField(
+            model_name='prorroga',
+            name='justificacion',
+            field=SIGAP.fields.MayusculasTextField(verbose_name='JUSTIFICACIÓN DE PRÓRROGA'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='calendario_registro',
+            field=SIGAP.fields.MayusculasCharField(max_length=10, verbose_name='CALENDARIO'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='dictamen',
+            field=SIGAP.fields.MayusculasCharField(default='PENDIENTE', max_length=50, verbose_name='DICTAMEN FINAL'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='folio',
+            field=SIGAP.fields.MayusculasCharField(max_length=50, primary_key=True, serialize=False, verbose_name='FOLIO DE PROYECTO'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='nivel_competencia',
+            field=SIGAP.fields.MayusculasCharField(blank=True, max_length=30, null=True, verbose_name='MÓDULOS REGISTRADOS'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='titulo',
+            field=SIGAP.fields.MayusculasCharField(max_length=255, verbose_name='TÍTULO DEL PROYECTO'),
+        ),
+        migrations.AlterField(
+            model_name='proyecto',
+            name='variante',
+            field=SIGAP.fields.MayusculasCharField(blank=True, max_length=50, null=True, verbose_name='VARIANTE DE MODALIDAD'),
+        ),
+        migrations.RunPython(convertir_existentes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_campos_mayusculas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proyecto',
+            name='actualizado',
+            field=models.DateTimeField(auto_now=True, verbose_name='ÚLTIMA MODIFICACIÓN'),
+        ),
+    ]
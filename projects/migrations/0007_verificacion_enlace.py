@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_proyecto_actualizado'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VerificacionEnlace',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, unique=True, verbose_name='URL')),
+                ('estado', models.CharField(choices=[('OK', 'ACCESIBLE'), ('PRIVADO', 'REQUIERE PERMISOS'), ('ROTO', 'ROTO'), ('ERROR', 'SIN RESPUESTA')], max_length=10, verbose_name='ESTADO')),
+                ('codigo_http', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='CÓDIGO HTTP')),
+                ('url_final', models.URLField(blank=True, default='', max_length=500, verbose_name='URL FINAL')),
+                ('error', models.TextField(blank=True, default='', verbose_name='ERROR')),
+                ('fecha_verificacion', models.DateTimeField(verbose_name='FECHA DE VERIFICACIÓN')),
+            ],
+            options={
+                'verbose_name': 'Verificación de Enlace',
+                'verbose_name_plural': 'Verificaciones de Enlaces',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_verificacion_enlace'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorFolio',
+            fields=[
+                ('calendario', models.CharField(max_length=10, primary_key=True, serialize=False, verbose_name='CALENDARIO')),
+                ('ultimo', models.PositiveIntegerField(default=0, verbose_name='ÚLTIMO NÚMERO ASIGNADO')),
+            ],
+            options={
+                'verbose_name': 'Contador de folios',
+                'verbose_name_plural': 'Contadores de folios',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+# Español sin acentos: 'educación', 'EDUCACION' y 'educativa' dan el mismo
+# lexema. Usa el diccionario unaccent (extensión creada en people 0002).
+CREAR_CONFIGURACION = """
+CREATE TEXT SEARCH CONFIGURATION sigap_es (COPY = pg_catalog.spanish);
+ALTER TEXT SEARCH CONFIGURATION sigap_es
+    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+"""
+
+BORRAR_CONFIGURACION = "DROP TEXT SEARCH CONFIGURATION IF EXISTS sigap_es;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_busqueda_trigramas'),
+        ('projects', '0008_contador_folio'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREAR_CONFIGURACION, BORRAR_CONFIGURACION),
+        migrations.AddField(
+            model_name='formato1',
+            name='documento_busqueda',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('objetivo', config='sigap_es', weight='A'), '||', django.contrib.postgres.search.SearchVector('resumen', config='sigap_es', weight='B'), django.contrib.postgres.search.SearchConfig('sigap_es')), '||', django.contrib.postgres.search.SearchVector('introduccion', config='sigap_es', weight='C'), django.contrib.postgres.search.SearchConfig('sigap_es')), '||', django.contrib.postgres.search.SearchVector('justificacion', config='sigap_es', weight='D'), django.contrib.postgres.search.SearchConfig('sigap_es')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='formato1',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['documento_busqueda'], name='formato1_busqueda_gin'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:16
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_busqueda_protocolos'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HuellaProtocolo',
+            fields=[
+                ('formato1', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='huella', serialize=False, to='projects.formato1', verbose_name='FORMATO 1')),
+                ('firma', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), size=None, verbose_name='FIRMA MINHASH')),
+                ('version', models.PositiveSmallIntegerField(verbose_name='VERSIÓN')),
+                ('actualizado', models.DateTimeField(auto_now=True, verbose_name='ÚLTIMA ACTUALIZACIÓN')),
+            ],
+            options={
+                'verbose_name': 'Huella de protocolo',
+                'verbose_name_plural': 'Huellas de protocolos',
+            },
+        ),
+        migrations.CreateModel(
+            name='BandaProtocolo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valor', models.BigIntegerField(db_index=True)),
+                ('huella', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bandas', to='projects.huellaprotocolo')),
+            ],
+            options={
+                'verbose_name': 'Banda de protocolo',
+                'verbose_name_plural': 'Bandas de protocolos',
+            },
+        ),
+    ]
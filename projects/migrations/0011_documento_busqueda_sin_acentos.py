@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:20
+
+from django.db import migrations
+
+# Vuelve a llenar el documento de los proyectos, ahora sin acentos (mismo
+# contenido que projects.busqueda.documento_busqueda). La reversa lo deja
+# como en la migración 0002.
+LLENAR_DOCUMENTOS = """
+UPDATE projects_proyecto p
+SET documento_busqueda = to_tsvector('simple'::regconfig, {}(concat_ws(' ',
+    p.folio,
+    p.titulo,
+    (SELECT a.nombre_completo FROM people_asesor a WHERE a.codigo_asesor = p.asesor_id),
+    (SELECT e.nombre_completo FROM people_evaluador e WHERE e.codigo_evaluador = p.evaluador_id),
+    (SELECT string_agg(al.codigo_estudiante || ' ' || al.nombre_completo, ' ')
+       FROM projects_participacion pa
+       JOIN people_alumno al ON al.codigo_estudiante = pa.alumno_id
+      WHERE pa.proyecto_id = p.folio)
+)));
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_busqueda_trigramas'),
+        ('projects', '0010_huella_protocolo'),
+    ]
+
+    operations = [
+        migrations.RunSQL(LLENAR_DOCUMENTOS.format('sigap_unaccent'), LLENAR_DOCUMENTOS.format('')),
+    ]
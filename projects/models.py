@@ -1,4 +1,8 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from SIGAP.fields import MayusculasCharField, MayusculasTextField
 # Importar modelos de la app 'people' para las FK
 from people.models import Alumno, Asesor, Evaluador 
 
@@ -9,29 +13,33 @@ from people.models import Alumno, Asesor, Evaluador
 
 class Formato1(models.Model):
     """Contiene los datos de la documentación inicial del proyecto."""
-    folio = models.CharField(max_length=50, primary_key=True, verbose_name="FOLIO PROYECTO") 
-    introduccion = models.TextField(verbose_name="INTRODUCCIÓN")
-    justificacion = models.TextField(verbose_name="JUSTIFICACIÓN")
-    objetivo = models.TextField(verbose_name="OBJETIVO")
-    resumen = models.TextField(verbose_name="RESUMEN")
+    folio = MayusculasCharField(max_length=50, primary_key=True, verbose_name="FOLIO PROYECTO") 
+    introduccion = MayusculasTextField(verbose_name="INTRODUCCIÓN")
+    justificacion = MayusculasTextField(verbose_name="JUSTIFICACIÓN")
+    objetivo = MayusculasTextField(verbose_name="OBJETIVO")
+    resumen = MayusculasTextField(verbose_name="RESUMEN")
+    # Búsqueda por tema (projects.busqueda.buscar_protocolos). Columna generada:
+    # PostgreSQL la recalcula al insertar o modificar la fila, también con
+    # bulk_create y update(). La configuración 'sigap_es' (español sin acentos)
+    # se crea en la migración 0009.
+    documento_busqueda = models.GeneratedField(
+        expression=(
+            SearchVector('objetivo', weight='A', config='sigap_es')
+            + SearchVector('resumen', weight='B', config='sigap_es')
+            + SearchVector('introduccion', weight='C', config='sigap_es')
+            + SearchVector('justificacion', weight='D', config='sigap_es')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     
     class Meta:
         verbose_name = "Formato Inicial"
         verbose_name_plural = "Formatos Iniciales"
+        indexes = [
+            GinIndex(fields=['documento_busqueda'], name='formato1_busqueda_gin'),
+        ]
     
-    def save(self, *args, **kwargs):
-        if self.folio:
-            self.folio = self.folio.upper()
-        if self.introduccion:
-            self.introduccion = self.introduccion.upper()
-        if self.justificacion:
-            self.justificacion = self.justificacion.upper()
-        if self.objetivo:
-            self.objetivo = self.objetivo.upper()
-        if self.resumen:
-            self.resumen = self.resumen.upper()
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"Formato para Folio: {self.folio}"
 
@@ -47,22 +55,15 @@ class Prorroga(models.Model):
         on_delete=models.CASCADE,
         verbose_name="PROYECTO"
     )
-    justificacion = models.TextField(verbose_name="JUSTIFICACIÓN DE PRÓRROGA")
-    calendario_presentacion = models.CharField(max_length=10, verbose_name="CALENDARIO PARA PRESENTACIÓN")
+    justificacion = MayusculasTextField(verbose_name="JUSTIFICACIÓN DE PRÓRROGA")
+    calendario_presentacion = MayusculasCharField(max_length=10, verbose_name="CALENDARIO PARA PRESENTACIÓN")
 
     class Meta:
         verbose_name = "Prórroga"
         verbose_name_plural = "Prórrogas"
 
-    def save(self, *args, **kwargs):
-        if self.justificacion:
-            self.justificacion = self.justificacion.upper()
-        if self.calendario_presentacion:
-            self.calendario_presentacion = self.calendario_presentacion.upper()
-        super().save(*args, **kwargs)
-
     def __str__(self):
-        return f"Prórroga {self.id_prorroga} para {self.proyecto.folio}"
+        return f"Prórroga {self.id_prorroga} para {self.proyecto_id}"
 
 # ====================================================================
 # 3. Proyecto (Entidad Central)
@@ -77,37 +78,71 @@ class Proyecto(models.Model):
         ('VINCULACION SOCIAL', 'VINCULACION SOCIAL'),
     ]
     
-    folio = models.CharField(max_length=50, primary_key=True, verbose_name="FOLIO DE PROYECTO")
-    titulo = models.CharField(max_length=255, verbose_name="TÍTULO DEL PROYECTO")
+    folio = MayusculasCharField(max_length=50, primary_key=True, verbose_name="FOLIO DE PROYECTO")
+    titulo = MayusculasCharField(max_length=255, verbose_name="TÍTULO DEL PROYECTO")
     asesor = models.ForeignKey(Asesor, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="ASESOR ASIGNADO")
     evaluador = models.ForeignKey(Evaluador, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="EVALUADOR ASIGNADO")
     formato1 = models.OneToOneField(Formato1, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="DATOS FORMATO 1")
     modalidad = models.CharField(max_length=50, choices=MODALIDAD_CHOICES, verbose_name="MODALIDAD")
-    variante = models.CharField(max_length=50, null=True, blank=True, verbose_name="VARIANTE DE MODALIDAD")
-    nivel_competencia = models.CharField(max_length=30, null=True, blank=True, verbose_name="MÓDULOS REGISTRADOS")
-    dictamen = models.CharField(max_length=50, default='PENDIENTE', verbose_name="DICTAMEN FINAL")
-    calendario_registro = models.CharField(max_length=10, verbose_name="CALENDARIO")
+    variante = MayusculasCharField(max_length=50, null=True, blank=True, verbose_name="VARIANTE DE MODALIDAD")
+    nivel_competencia = MayusculasCharField(max_length=30, null=True, blank=True, verbose_name="MÓDULOS REGISTRADOS")
+    dictamen = MayusculasCharField(max_length=50, default='PENDIENTE', verbose_name="DICTAMEN FINAL")
+    calendario_registro = MayusculasCharField(max_length=10, verbose_name="CALENDARIO")
     evidencia_url = models.URLField(max_length=500, null=True, blank=True, verbose_name="URL EVIDENCIA PRINCIPAL")
     protocolo_dictamen_url = models.URLField(max_length=500, null=True, blank=True, verbose_name="URL PROTOCOLO DICTAMINADO")
     participantes = models.ManyToManyField(Alumno, through='Participacion', verbose_name="PARTICIPANTES")
+    # Estado de la última evaluación; lo mantiene evaluation.estado
+    ultima_revision = models.CharField(max_length=10, null=True, blank=True, editable=False, verbose_name="ÚLTIMA REVISIÓN")
+    ultimo_resolutivo = models.CharField(max_length=20, null=True, blank=True, editable=False, verbose_name="ÚLTIMO RESOLUTIVO")
+    fecha_ultima_evaluacion = models.DateTimeField(null=True, blank=True, editable=False, verbose_name="FECHA DE ÚLTIMA EVALUACIÓN")
+    total_evaluaciones = models.PositiveIntegerField(default=0, editable=False, verbose_name="NÚMERO DE REVISIONES")
+    # Folio, título, asesor, evaluador y participantes; lo mantiene projects.signals
+    documento_busqueda = SearchVectorField(null=True, editable=False)
+    # Último cambio del proyecto o de sus datos relacionados (ETag / Last-Modified de la API)
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="ÚLTIMA MODIFICACIÓN")
 
     class Meta:
         verbose_name = "Proyecto Modular"
         verbose_name_plural = "Proyectos Modulares"
-        
+        indexes = [
+            GinIndex(fields=['documento_busqueda'], name='proyecto_busqueda_gin'),
+            # Filtros del changelist (ProyectoAdmin.list_filter)
+            models.Index(fields=['calendario_registro', 'dictamen'], name='proyecto_cal_dictamen_idx'),
+            models.Index(
+                fields=['calendario_registro'],
+                condition=models.Q(dictamen='PENDIENTE'),
+                name='proyecto_pendientes_idx',
+            ),
+            models.Index(fields=['ultima_revision', 'ultimo_resolutivo'], name='proyecto_estado_eval_idx'),
+        ]
+
+    # Los escribe solo evaluation.estado; un save() completo (p. ej. desde el
+    # admin) llevaría los valores con que se cargó la instancia
+    CAMPOS_ESTADO = ('ultima_revision', 'ultimo_resolutivo', 'fecha_ultima_evaluacion', 'total_evaluaciones')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        instancia._folio_cargado = instancia.__dict__.get('folio')
+        return instancia
+
     def save(self, *args, **kwargs):
-        if self.folio:
-            self.folio = self.folio.upper()
-        if self.titulo:
-            self.titulo = self.titulo.upper()
-        if self.variante:
-            self.variante = self.variante.upper()
-        if self.nivel_competencia:
-            self.nivel_competencia = self.nivel_competencia.upper()
-        if self.dictamen:
-            self.dictamen = self.dictamen.upper()
-        if self.calendario_registro:
-            self.calendario_registro = self.calendario_registro.upper()
+        """
+        Al actualizar un proyecto ya guardado omite los CAMPOS_ESTADO, salvo
+        que se pidan en `update_fields`. Si cambió el folio se guarda completo
+        (Django inserta una fila nueva).
+        """
+        if (
+            kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+            and not self._state.adding
+            and self.pk == getattr(self, '_folio_cargado', None)
+        ):
+            kwargs['update_fields'] = [
+                campo.name for campo in self._meta.concrete_fields
+                if not campo.primary_key and campo.name not in self.CAMPOS_ESTADO
+                and campo.attname not in self.get_deferred_fields()
+            ]
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -130,4 +165,90 @@ class Participacion(models.Model):
 
     def __str__(self):
         rol = "REPRESENTANTE" if self.es_representante else "PARTICIPANTE"
-        return f"{self.proyecto.folio} - {self.alumno.codigo_estudiante} ({rol})"
+        return f"{self.proyecto_id} - {self.alumno_id} ({rol})"
+
+# ====================================================================
+# 5. Verificación de enlaces (una fila por URL; la mantiene projects.enlaces)
+# ====================================================================
+
+class VerificacionEnlace(models.Model):
+    """Último resultado de verificar una URL de evidencia o de protocolo."""
+    OK = 'OK'
+    PRIVADO = 'PRIVADO'
+    ROTO = 'ROTO'
+    ERROR = 'ERROR'
+    ESTADO_CHOICES = [
+        (OK, 'ACCESIBLE'),
+        (PRIVADO, 'REQUIERE PERMISOS'),
+        (ROTO, 'ROTO'),
+        (ERROR, 'SIN RESPUESTA'),
+    ]
+
+    url = models.URLField(max_length=500, unique=True, verbose_name="URL")
+    estado = models.CharField(max_length=10, choices=ESTADO_CHOICES, verbose_name="ESTADO")
+    codigo_http = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="CÓDIGO HTTP")
+    url_final = models.URLField(max_length=500, blank=True, default='', verbose_name="URL FINAL")
+    error = models.TextField(blank=True, default='', verbose_name="ERROR")
+    fecha_verificacion = models.DateTimeField(verbose_name="FECHA DE VERIFICACIÓN")
+
+    class Meta:
+        verbose_name = "Verificación de Enlace"
+        verbose_name_plural = "Verificaciones de Enlaces"
+
+    def __str__(self):
+        return f"{self.url} ({self.estado})"
+
+
+# ====================================================================
+# 6. Contador de folios (una fila por calendario; la mantiene projects.folios)
+# ====================================================================
+class ContadorFolio(models.Model):
+    """Último número de folio asignado en un calendario."""
+    calendario = models.CharField(max_length=10, primary_key=True, verbose_name="CALENDARIO")
+    ultimo = models.PositiveIntegerField(default=0, verbose_name="ÚLTIMO NÚMERO ASIGNADO")
+
+    class Meta:
+        verbose_name = "Contador de folios"
+        verbose_name_plural = "Contadores de folios"
+
+    def __str__(self):
+        return f"{self.calendario}: {self.ultimo}"
+
+
+# ====================================================================
+# 7. Huella del Formato 1 (una fila por protocolo; la mantiene projects.similitud)
+# ====================================================================
+class HuellaProtocolo(models.Model):
+    """Firma MinHash del texto de un Formato1."""
+    formato1 = models.OneToOneField(
+        Formato1, on_delete=models.CASCADE, primary_key=True, related_name='huella',
+        verbose_name="FORMATO 1",
+    )
+    firma = ArrayField(models.BigIntegerField(), verbose_name="FIRMA MINHASH")
+    version = models.PositiveSmallIntegerField(verbose_name="VERSIÓN")
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="ÚLTIMA ACTUALIZACIÓN")
+
+    class Meta:
+        verbose_name = "Huella de protocolo"
+        verbose_name_plural = "Huellas de protocolos"
+
+    def __str__(self):
+        return f"Huella de {self.formato1_id}"
+
+
+class BandaProtocolo(models.Model):
+    """
+    Una banda LSH de la firma. Dos protocolos son candidatos a duplicado si
+    comparten algún `valor`; el número de banda va incluido en el valor.
+    Van en filas y no en un arreglo con índice GIN porque el planificador
+    estima bien la igualdad sobre un B-tree y no el traslape de arreglos.
+    """
+    huella = models.ForeignKey(HuellaProtocolo, on_delete=models.CASCADE, related_name='bandas')
+    valor = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        verbose_name = "Banda de protocolo"
+        verbose_name_plural = "Bandas de protocolos"
+
+    def __str__(self):
+        return f"{self.huella_id}: {self.valor}"
@@ -0,0 +1,102 @@
+"""
+Generador mínimo de PDF de texto (sin dependencias ni Django).
+
+Los dictámenes son texto con títulos y párrafos, así que basta con las
+fuentes estándar de PDF (Helvetica) en codificación WinAnsi, que cubre los
+acentos del español. El módulo no importa Django para que los procesos del
+pool de projects.dictamenes lo carguen rápido. La salida es determinista:
+mismos datos, mismos bytes.
+"""
+import os
+import textwrap
+
+ANCHO, ALTO = 595, 842  # A4 en puntos
+MARGEN = 56
+
+# (fuente, tamaño, interlineado, caracteres por línea). El corte de línea es
+# por número de caracteres, calculado para texto en mayúsculas.
+ESTILOS = {
+    'titulo': ('F2', 14, 22, 46),
+    'subtitulo': ('F2', 11, 18, 60),
+    'texto': ('F1', 10, 14, 70),
+}
+
+
+def _escapar(texto):
+    datos = texto.encode('cp1252', errors='replace')
+    return datos.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def _lineas(bloques):
+    """Parte los bloques (estilo, texto) en líneas que caben en la página."""
+    for estilo, texto in bloques:
+        fuente, tamano, interlineado, caracteres = ESTILOS[estilo]
+        if not texto:
+            yield fuente, tamano, interlineado, b''
+            continue
+        for parrafo in str(texto).splitlines() or ['']:
+            for linea in textwrap.wrap(parrafo, caracteres) or ['']:
+                yield fuente, tamano, interlineado, _escapar(linea)
+
+
+def _paginas(bloques):
+    paginas, actual, y = [], [], ALTO - MARGEN
+    for fuente, tamano, interlineado, texto in _lineas(bloques):
+        if y - interlineado < MARGEN:
+            paginas.append(actual)
+            actual, y = [], ALTO - MARGEN
+        y -= interlineado
+        if texto:
+            actual.append(b'BT /%s %d Tf %d %d Td (%s) Tj ET' % (fuente.encode(), tamano, MARGEN, y, texto))
+    paginas.append(actual)
+    return paginas
+
+
+def documento_pdf(bloques):
+    """
+    Regresa los bytes de un PDF. `bloques` es una lista de (estilo, texto)
+    con estilo 'titulo', 'subtitulo' o 'texto'.
+    """
+    paginas = _paginas(bloques)
+    objetos = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # Pages, cuando se conocen los hijos
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+    ]
+    hijos = []
+    for operaciones in paginas:
+        contenido = b'\n'.join(operaciones)
+        objetos.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(contenido), contenido))
+        objetos.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+            b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>'
+            % (ANCHO, ALTO, len(objetos))
+        )
+        hijos.append(b'%d 0 R' % len(objetos))
+    objetos[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(hijos), len(hijos))
+
+    salida = bytearray(b'%PDF-1.4\n')
+    posiciones = []
+    for numero, objeto in enumerate(objetos, start=1):
+        posiciones.append(len(salida))
+        salida += b'%d 0 obj\n%s\nendobj\n' % (numero, objeto)
+    inicio_xref = len(salida)
+    salida += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objetos) + 1)
+    for posicion in posiciones:
+        salida += b'%010d 00000 n \n' % posicion
+    salida += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objetos) + 1, inicio_xref)
+    return bytes(salida)
+
+
+def escribir_pdf(trabajo):
+    """
+    Tarea del pool: recibe (ruta, bloques), escribe el PDF de forma atómica
+    y regresa la ruta. Se ejecuta en otro proceso.
+    """
+    ruta, bloques = trabajo
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(documento_pdf(bloques))
+    os.replace(temporal, ruta)
+    return ruta
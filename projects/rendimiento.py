@@ -0,0 +1,260 @@
+"""
+Medición de rendimiento del admin de proyectos y de las operaciones masivas.
+
+Cada caso se ejecuta varias veces dentro de una transacción que se revierte:
+no deja cambios, los correos van al backend locmem y todas las repeticiones
+ven los mismos datos. Se registran el número de consultas y el tiempo de
+cada caso; el resultado se guarda en JSON para comparar corridas.
+"""
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+import django
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.utils import quote
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from evaluation.models import Evaluaciones
+from people.importacion import importar_padron
+from people.models import Alumno
+from .models import Participacion, Prorroga, Proyecto
+
+REPETICIONES = 5
+PROYECTOS_ACCION = 100
+FILAS_IMPORTACION = 5000
+
+
+@dataclass
+class Caso:
+    """Un caso de la suite: `ejecutar(cliente)` regresa el código HTTP (o None)."""
+    nombre: str
+    ejecutar: object
+
+
+@dataclass
+class MedicionCaso:
+    consultas: int = 0
+    tiempos: list = field(default_factory=list)
+    estado: object = None
+    error: str = ''
+
+    def como_dict(self):
+        return {
+            'consultas': self.consultas,
+            'mediana_ms': round(statistics.median(self.tiempos) * 1000, 2) if self.tiempos else None,
+            'minimo_ms': round(min(self.tiempos) * 1000, 2) if self.tiempos else None,
+            'maximo_ms': round(max(self.tiempos) * 1000, 2) if self.tiempos else None,
+            'estado': self.estado,
+            'error': self.error,
+        }
+
+
+# ====================================================================
+# Casos
+# ====================================================================
+
+def _valor_frecuente(modelo, campo):
+    return (
+        modelo.objects.exclude(**{f'{campo}__isnull': True})
+        .order_by().values(campo).annotate(total=Count('pk')).order_by('-total')
+        .values_list(campo, flat=True).first()
+    )
+
+
+def parametros_filtros(modelo_admin):
+    """
+    Un juego de parámetros de URL por cada filtro de `list_filter`, con el
+    valor más frecuente de los datos (o la primera opción del filtro).
+    """
+    modelo = modelo_admin.model
+    request = RequestFactory().get('/')
+    parametros = []
+    for filtro in modelo_admin.list_filter:
+        if isinstance(filtro, str):
+            campo = modelo._meta.get_field(filtro)
+            valor = _valor_frecuente(modelo, filtro)
+            nombre = f'{filtro}__{campo.target_field.name}__exact' if campo.is_relation else f'{filtro}__exact'
+            parametros.append((filtro, {nombre: valor}))
+        else:
+            opciones = filtro(request, {}, modelo, modelo_admin).lookups(request, modelo_admin)
+            parametros.append((filtro.parameter_name, {filtro.parameter_name: list(opciones)[0][0]}))
+    return parametros
+
+
+def _filas_importacion(total):
+    return [
+        {
+            'codigo_estudiante': f"{990000000 + numero}",
+            'nombre_completo': f"ALUMNO DE PRUEBA {numero}",
+            'correo_electronico': f"prueba{numero}@alumnos.sigap.test",
+        }
+        for numero in range(total)
+    ]
+
+
+def casos_suite():
+    """Casos del changelist (con búsqueda y cada filtro), del formulario y de las acciones."""
+    ejemplo = Proyecto.objects.order_by('-calendario_registro', '-total_evaluaciones', 'folio').first()
+    if not ejemplo:
+        return []
+
+    listado = reverse('admin:projects_proyecto_changelist')
+    cambio = reverse('admin:projects_proyecto_change', args=[quote(ejemplo.folio)])
+    palabra = max(ejemplo.titulo.split(), key=len)
+    seleccion = list(
+        Proyecto.objects.filter(calendario_registro=ejemplo.calendario_registro)
+        .order_by('folio').values_list('folio', flat=True)[:PROYECTOS_ACCION]
+    )
+    filas = _filas_importacion(FILAS_IMPORTACION)
+
+    def obtener(url, datos=None):
+        return lambda cliente: cliente.get(url, datos).status_code
+
+    def accion(nombre):
+        datos = {'action': nombre, '_selected_action': seleccion, 'index': 0}
+        return lambda cliente: cliente.post(listado, datos).status_code
+
+    def importar(cliente):
+        importar_padron('alumnos', iter(filas))
+
+    casos = [
+        Caso('changelist', obtener(listado)),
+        Caso('changelist_busqueda', obtener(listado, {'q': palabra})),
+    ]
+    for nombre, parametros in parametros_filtros(admin.site._registry[Proyecto]):
+        casos.append(Caso(f'changelist_filtro_{nombre}', obtener(listado, parametros)))
+    casos += [
+        Caso('change_view', obtener(cambio)),
+        Caso('accion_notificar_participantes', accion('notificar_participantes')),
+        Caso('accion_notificar_evaluadores', accion('notificar_evaluadores')),
+        Caso('importacion_alumnos', importar),
+    ]
+    return casos
+
+
+# ====================================================================
+# Ejecución
+# ====================================================================
+
+def _medir(caso, cliente, repeticiones):
+    medicion = MedicionCaso()
+    # La primera ejecución calienta cachés y no se cuenta
+    for numero in range(repeticiones + 1):
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as consultas:
+                inicio = time.perf_counter()
+                try:
+                    medicion.estado = caso.ejecutar(cliente)
+                except Exception as e:
+                    medicion.error = f"{type(e).__name__}: {e}"
+                    transaction.set_rollback(True)
+                    return medicion
+                segundos = time.perf_counter() - inicio
+            transaction.set_rollback(True)
+        if numero:
+            medicion.tiempos.append(segundos)
+            medicion.consultas = len(consultas)
+    return medicion
+
+
+def _commit_actual():
+    try:
+        salida = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def volumen_datos():
+    modelos = {
+        'alumnos': Alumno, 'proyectos': Proyecto, 'participaciones': Participacion,
+        'evaluaciones': Evaluaciones, 'prorrogas': Prorroga,
+    }
+    return {nombre: modelo.objects.count() for nombre, modelo in modelos.items()}
+
+
+def ejecutar_suite(repeticiones=REPETICIONES, solo=None, al_medir=None):
+    """
+    Ejecuta la suite y regresa el resultado como diccionario (listo para
+    JSON). `solo` limita los casos por prefijo de nombre; `al_medir(nombre,
+    medicion)` se llama al terminar cada caso.
+    """
+    resultado = {
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _commit_actual(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'repeticiones': repeticiones,
+        'datos': volumen_datos(),
+        'casos': {},
+    }
+    casos = casos_suite()
+    if solo:
+        casos = [caso for caso in casos if caso.nombre.startswith(tuple(solo))]
+
+    correo_local = override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+    with correo_local, transaction.atomic():
+        # Usuario temporal; se revierte junto con todo lo demás
+        usuario = get_user_model().objects.create_superuser('medicion-rendimiento', None, None)
+        cliente = Client()
+        cliente.force_login(usuario)
+        for caso in casos:
+            medicion = _medir(caso, cliente, repeticiones)
+            resultado['casos'][caso.nombre] = medicion.como_dict()
+            if al_medir:
+                al_medir(caso.nombre, medicion)
+        transaction.set_rollback(True)
+    return resultado
+
+
+def _estado_valido(estado):
+    # Los casos que no son peticiones HTTP regresan None
+    return estado is None or 200 <= estado < 400
+
+
+def comparar(anterior, actual, umbral=0.2):
+    """
+    Filas (caso, ms antes, ms ahora, cambio relativo, consultas antes,
+    consultas ahora, regresión, motivo). Es regresión si aumentan las
+    consultas o si la mediana crece más que `umbral`. Si el caso falló, su
+    estado HTTP no es 2xx/3xx o cambió respecto a la corrida anterior, los
+    tiempos no son comparables: la fila es regresión, con ms ahora y cambio
+    en None y el motivo escrito.
+    """
+    filas = []
+    for nombre, ahora in actual['casos'].items():
+        antes = anterior['casos'].get(nombre)
+        if not antes or antes['mediana_ms'] is None:
+            continue
+        if ahora.get('error') or ahora['mediana_ms'] is None:
+            motivo = ahora.get('error') or "sin mediciones"
+        elif not _estado_valido(ahora.get('estado')):
+            motivo = f"estado HTTP {ahora['estado']}"
+        elif ahora.get('estado') != antes.get('estado'):
+            motivo = f"estado {antes.get('estado')} → {ahora.get('estado')}"
+        else:
+            motivo = ''
+        if motivo:
+            filas.append((
+                nombre, antes['mediana_ms'], None, None, antes['consultas'], ahora['consultas'], True, motivo,
+            ))
+            continue
+        cambio = (ahora['mediana_ms'] - antes['mediana_ms']) / antes['mediana_ms'] if antes['mediana_ms'] else 0.0
+        regresion = ahora['consultas'] > antes['consultas'] or cambio > umbral
+        filas.append((
+            nombre, antes['mediana_ms'], ahora['mediana_ms'], cambio,
+            antes['consultas'], ahora['consultas'], regresion, '',
+        ))
+    return filas
@@ -0,0 +1,72 @@
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Now
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from people.models import Alumno, Asesor, Evaluador
+from people.signals import padron_importado
+from .busqueda import documento_busqueda
+from .models import Formato1, Participacion, Proyecto
+from .similitud import actualizar_huellas
+
+# ====================================================================
+# Documento de búsqueda y fecha de modificación de Proyecto
+# ====================================================================
+# Se recalculan con un UPDATE (que no vuelve a disparar post_save) cada vez
+# que cambia el proyecto, sus participantes o el nombre de alguna persona.
+# `actualizado` alimenta el ETag / Last-Modified de la API.
+
+def proyectos_modificados(proyectos):
+    return proyectos.update(documento_busqueda=documento_busqueda(), actualizado=Now())
+
+
+@receiver(post_save, sender=Proyecto)
+def proyecto_guardado(sender, instance, **kwargs):
+    proyectos_modificados(Proyecto.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Participacion)
+@receiver(post_delete, sender=Participacion)
+def participacion_modificada(sender, instance, **kwargs):
+    proyectos_modificados(Proyecto.objects.filter(pk=instance.proyecto_id))
+
+
+@receiver(post_save, sender=Asesor)
+def asesor_guardado(sender, instance, created, **kwargs):
+    if not created:
+        proyectos_modificados(Proyecto.objects.filter(asesor=instance.pk))
+
+
+@receiver(post_save, sender=Evaluador)
+def evaluador_guardado(sender, instance, created, **kwargs):
+    if not created:
+        proyectos_modificados(Proyecto.objects.filter(evaluador=instance.pk))
+
+
+@receiver(post_save, sender=Alumno)
+def alumno_guardado(sender, instance, created, **kwargs):
+    if not created:
+        proyectos_modificados(Proyecto.objects.filter(participacion__alumno=instance.pk))
+
+
+@receiver(padron_importado)
+def padron_importado_recibido(sender, claves, **kwargs):
+    if sender is Alumno:
+        proyectos = Proyecto.objects.filter(participacion__alumno__in=claves)
+    elif sender is Asesor:
+        proyectos = Proyecto.objects.filter(asesor__in=claves)
+    elif sender is Evaluador:
+        proyectos = Proyecto.objects.filter(evaluador__in=claves)
+    else:
+        return
+    proyectos_modificados(proyectos)
+
+
+@receiver(post_save, sender=Formato1)
+def formato1_guardado(sender, instance, **kwargs):
+    # El Formato 1 se liga por la llave foránea o, en registros viejos, por folio
+    Proyecto.objects.filter(Q(formato1=instance.pk) | Q(folio=instance.pk)).update(actualizado=Now())
+    # Huella MinHash para la detección de protocolos casi duplicados; se
+    # calcula al confirmar, fuera de los bloqueos de la transacción
+    transaction.on_commit(lambda: actualizar_huellas([instance]))
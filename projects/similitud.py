@@ -0,0 +1,224 @@
+"""
+Detección de protocolos casi duplicados (MinHash + LSH).
+
+El texto de cada Formato1 (objetivo, resumen, introducción y justificación,
+sin acentos) se parte en tejas de TEJA palabras consecutivas. La firma
+MinHash guarda, para cada una de PERMUTACIONES funciones hash, el mínimo
+sobre las tejas; la fracción de posiciones iguales entre dos firmas estima
+la similitud de Jaccard entre sus conjuntos de tejas.
+
+La firma se divide en BANDAS bandas de FILAS valores y cada banda se
+reduce a un entero (BandaProtocolo). Dos protocolos son candidatos si
+comparten alguna banda, lo que se busca por índice sin comparar contra
+todo el historial: con 32 bandas de 4 filas, un par con
+similitud 0.5 resulta candidato con probabilidad 0.87 y uno con 0.8 casi
+siempre. Solo los candidatos se comparan firma contra firma.
+
+Las huellas se actualizan después de guardar un Formato1 (projects.signals,
+al confirmar la transacción); las cargas masivas y el historial se indexan
+con `indexar_protocolos`. El cálculo de la firma es Python puro (decenas
+de milisegundos en un protocolo largo): no debe hacerse mientras se tiene
+un bloqueo.
+"""
+import hashlib
+import re
+from dataclasses import dataclass
+
+from django.db import transaction
+
+from people.busqueda import normalizar
+from .models import BandaProtocolo, Formato1, HuellaProtocolo, Proyecto
+
+# Cambiar cuando cambie el cálculo de la firma, para que se recalculen todas
+VERSION_FIRMA = 1
+TEJA = 3
+BANDAS = 32
+FILAS = 4
+PERMUTACIONES = BANDAS * FILAS
+# Similitud mínima (estimada) para avisar de un posible duplicado
+UMBRAL = 0.5
+MAXIMO_SIMILARES = 10
+TAMANO_LOTE = 500
+
+CAMPOS = ('objetivo', 'resumen', 'introduccion', 'justificacion')
+
+# Primo de Mersenne 2^61 - 1: las firmas caben en un BIGINT
+_PRIMO = (1 << 61) - 1
+_PALABRA = re.compile(r'\w+')
+
+
+def _entero(texto):
+    return int.from_bytes(hashlib.blake2b(texto.encode(), digest_size=8).digest(), 'big')
+
+
+# Funciones hash h(x) = (a·x + b) mod p, fijas para que las firmas sean comparables
+_COEFICIENTES = [
+    (_entero(f'sigap-a-{i}') % (_PRIMO - 1) + 1, _entero(f'sigap-b-{i}') % _PRIMO)
+    for i in range(PERMUTACIONES)
+]
+
+
+@dataclass
+class Similar:
+    folio: str
+    similitud: float
+    en_proyectos: bool = False
+
+    @property
+    def calendario(self):
+        return self.folio.rsplit('-', 1)[0]
+
+
+# ====================================================================
+# Firma
+# ====================================================================
+
+def tejas(texto):
+    """Conjunto de secuencias de TEJA palabras del texto normalizado."""
+    palabras = _PALABRA.findall(normalizar(texto))
+    if len(palabras) < TEJA:
+        return {' '.join(palabras)} if palabras else set()
+    return {' '.join(palabras[i:i + TEJA]) for i in range(len(palabras) - TEJA + 1)}
+
+
+def firma_minhash(conjunto):
+    """Firma de PERMUTACIONES enteros; None si el conjunto está vacío."""
+    if not conjunto:
+        return None
+    valores = [_entero(teja) % _PRIMO for teja in conjunto]
+    return [min((a * x + b) % _PRIMO for x in valores) for a, b in _COEFICIENTES]
+
+
+def bandas_lsh(firma):
+    """Un entero con signo de 64 bits (BIGINT) por banda; incluye el número de banda."""
+    bandas = []
+    for banda in range(BANDAS):
+        filas = ','.join(str(valor) for valor in firma[banda * FILAS:(banda + 1) * FILAS])
+        digest = hashlib.blake2b(f'{banda}:{filas}'.encode(), digest_size=8).digest()
+        bandas.append(int.from_bytes(digest, 'big', signed=True))
+    return bandas
+
+
+def similitud_estimada(firma_a, firma_b):
+    return sum(a == b for a, b in zip(firma_a, firma_b)) / PERMUTACIONES
+
+
+def texto_protocolo(formato1):
+    return '\n'.join(getattr(formato1, campo) or '' for campo in CAMPOS)
+
+
+# ====================================================================
+# Índice
+# ====================================================================
+
+def firma_protocolo(formato1):
+    """Firma MinHash de un Formato1 (guardado o no); None si no tiene texto."""
+    return firma_minhash(tejas(texto_protocolo(formato1)))
+
+
+def guardar_firmas(firmas):
+    """
+    Guarda las huellas de {folio del Formato1: firma}, ya calculadas: solo
+    escribe filas, así que puede ir dentro de una transacción que tiene
+    bloqueos sin alargarla. Las firmas None borran la huella.
+    Regresa el número de huellas guardadas.
+    """
+    huellas = []
+    bandas = []
+    vacios = []
+    for folio, firma in firmas.items():
+        if firma is None:
+            vacios.append(folio)
+            continue
+        huellas.append(HuellaProtocolo(formato1_id=folio, firma=firma, version=VERSION_FIRMA))
+        bandas.extend(BandaProtocolo(huella_id=folio, valor=valor) for valor in bandas_lsh(firma))
+
+    with transaction.atomic():
+        if vacios:
+            HuellaProtocolo.objects.filter(pk__in=vacios).delete()
+        HuellaProtocolo.objects.bulk_create(
+            huellas,
+            update_conflicts=True,
+            unique_fields=['formato1'],
+            update_fields=['firma', 'version', 'actualizado'],
+        )
+        anteriores = BandaProtocolo.objects.filter(huella__in=[huella.pk for huella in huellas])
+        anteriores._raw_delete(BandaProtocolo.objects.db)
+        BandaProtocolo.objects.bulk_create(bandas)
+    return len(huellas)
+
+
+def actualizar_huellas(formatos):
+    """
+    Calcula y guarda las huellas de los Formato1 dados (instancias con los
+    CAMPOS cargados). Los que no tienen texto se quedan sin huella.
+    Regresa el número de huellas guardadas.
+    """
+    return guardar_firmas({formato1.pk: firma_protocolo(formato1) for formato1 in formatos})
+
+
+def pendientes(todos=False):
+    """Formato1 sin huella o con una huella de otra VERSION_FIRMA."""
+    formatos = Formato1.objects.defer('documento_busqueda')
+    if todos:
+        return formatos
+    return formatos.exclude(huella__version=VERSION_FIRMA)
+
+
+def indexar_pendientes(todos=False, tamano_lote=TAMANO_LOTE, al_avanzar=None):
+    """
+    Indexa por lotes (keyset por folio) los Formato1 pendientes, o todos.
+    `al_avanzar(indexados)` se llama después de cada lote. Regresa el total.
+    """
+    total = 0
+    ultimo = None
+    while True:
+        lote = pendientes(todos).order_by('folio')
+        if ultimo is not None:
+            lote = lote.filter(folio__gt=ultimo)
+        lote = list(lote[:tamano_lote])
+        if not lote:
+            return total
+        total += actualizar_huellas(lote)
+        ultimo = lote[-1].folio
+        if al_avanzar:
+            al_avanzar(total)
+
+
+# ====================================================================
+# Consulta
+# ====================================================================
+
+def protocolos_similares(formato1_id, umbral=UMBRAL, maximo=MAXIMO_SIMILARES):
+    """
+    Formato1 de cualquier calendario cuya similitud estimada con
+    `formato1_id` es al menos `umbral`, del más parecido al menos. Regresa
+    una lista de Similar; vacía si el protocolo no tiene huella.
+    """
+    firma = (
+        HuellaProtocolo.objects.filter(pk=formato1_id, version=VERSION_FIRMA)
+        .values_list('firma', flat=True).first()
+    )
+    if firma is None:
+        return []
+    coincidencias = BandaProtocolo.objects.filter(valor__in=bandas_lsh(firma)).values('huella')
+    candidatos = (
+        HuellaProtocolo.objects.filter(pk__in=coincidencias, version=VERSION_FIRMA)
+        .exclude(pk=formato1_id)
+        .values_list('formato1', 'firma')
+    )
+    similares = [
+        Similar(folio, similitud)
+        for folio, otra in candidatos.iterator()
+        if (similitud := similitud_estimada(firma, otra)) >= umbral
+    ]
+    similares.sort(key=lambda s: (-s.similitud, s.folio))
+    similares = similares[:maximo]
+
+    # Los de calendarios archivados ya no tienen fila en Proyecto
+    activos = set(
+        Proyecto.objects.filter(folio__in=[s.folio for s in similares]).values_list('folio', flat=True)
+    )
+    for similar in similares:
+        similar.en_proyectos = similar.folio in activos
+    return similares
@@ -1,3 +1,372 @@
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from people.models import Asesor, Evaluador
+from .asignacion import planear_asignacion
+from .busqueda import buscar_proyectos
+from .enlaces import verificar_enlaces, verificar_urls
+from .exportacion import csv_en_streaming, en_async
+from .folios import asignar_folio, asignar_folios
+from .models import ContadorFolio, Formato1, Proyecto, VerificacionEnlace
+from .rendimiento import comparar
+from .similitud import protocolos_similares
+
+
+class AsignacionFoliosTests(TransactionTestCase):
+    """projects.folios con varias conexiones a la vez (requiere PostgreSQL)."""
+
+    HILOS = 8
+    RONDAS = 25
+
+    def test_asignacion_concurrente_sin_duplicados_ni_huecos(self):
+        barrera = threading.Barrier(self.HILOS)
+        confirmados = []
+        errores = []
+        candado = threading.Lock()
+
+        def trabajar(hilo):
+            try:
+                barrera.wait()
+                for ronda in range(self.RONDAS):
+                    # Bloques de varios folios, y algunas transacciones que se revierten
+                    cantidad = 3 if ronda % 5 == 0 else 1
+                    revertir = (hilo + ronda) % 7 == 0
+                    with transaction.atomic():
+                        folios = asignar_folios('2030A', cantidad)
+                        transaction.set_rollback(revertir)
+                    if not revertir:
+                        with candado:
+                            confirmados.extend(folios)
+            except Exception as e:
+                errores.append(e)
+            finally:
+                connection.close()
+
+        hilos = [threading.Thread(target=trabajar, args=(numero,)) for numero in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(errores, [])
+        self.assertEqual(len(confirmados), len(set(confirmados)), "Hay folios duplicados")
+        numeros = sorted(int(folio.rsplit('-', 1)[1]) for folio in confirmados)
+        self.assertEqual(numeros, list(range(1, len(numeros) + 1)), "Hay huecos en la numeración")
+        self.assertEqual(ContadorFolio.objects.get(pk='2030A').ultimo, len(numeros))
+
+    def test_continua_despues_de_los_folios_capturados(self):
+        Proyecto.objects.create(folio='2030B-00041', titulo='X', modalidad='REPORTE', calendario_registro='2030B')
+        Proyecto.objects.create(folio='2030B-ESPECIAL', titulo='Y', modalidad='REPORTE', calendario_registro='2030B')
+        self.assertEqual(asignar_folio('2030b'), '2030B-00042')
+        self.assertEqual(asignar_folios('2030B', 2), ['2030B-00043', '2030B-00044'])
+
+
+class _ServidorPrueba(BaseHTTPRequestHandler):
+    """Respuestas fijas por ruta; anota el orden en que llegan las solicitudes."""
+    recibidas = []
+
+    def _responder(self):
+        self.recibidas.append((self.headers['Host'].split(':')[0], self.path))
+        if self.path.startswith('/lento'):
+            time.sleep(0.2)
+        if self.path == '/redirige':
+            self.send_response(302)
+            self.send_header('Location', '/ok')
+        elif self.path == '/solo-get' and self.command == 'HEAD':
+            self.send_response(405)
+        else:
+            codigos = {'/privado': 403, '/no-existe': 404}
+            self.send_response(codigos.get(self.path, 200))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = do_GET = _responder
+
+    def log_message(self, *args):
+        pass
+
+
+class VerificacionEnlacesTests(SimpleTestCase):
+    """projects.enlaces contra un servidor HTTP local."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.servidor = ThreadingHTTPServer(('127.0.0.1', 0), _ServidorPrueba)
+        cls.puerto = cls.servidor.server_address[1]
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _ServidorPrueba.recibidas = []
+
+    def url(self, ruta, host='127.0.0.1'):
+        return f'http://{host}:{self.puerto}{ruta}'
+
+    def test_clasifica_las_respuestas(self):
+        urls = [self.url(ruta) for ruta in ('/ok', '/privado', '/no-existe', '/redirige', '/solo-get')]
+        urls.append('ftp://ejemplo.mx/archivo')
+        filas = {fila['url']: fila for fila in asyncio.run(verificar_urls(urls, intervalo=0))}
+
+        self.assertEqual(filas[self.url('/ok')]['estado'], VerificacionEnlace.OK)
+        self.assertEqual(filas[self.url('/privado')]['estado'], VerificacionEnlace.PRIVADO)
+        self.assertEqual(filas[self.url('/privado')]['codigo_http'], 403)
+        self.assertEqual(filas[self.url('/no-existe')]['estado'], VerificacionEnlace.ROTO)
+        self.assertEqual(filas[self.url('/redirige')]['estado'], VerificacionEnlace.OK)
+        self.assertEqual(filas[self.url('/redirige')]['url_final'], self.url('/ok'))
+        self.assertEqual(filas[self.url('/solo-get')]['codigo_http'], 200)
+        self.assertEqual(filas['ftp://ejemplo.mx/archivo']['estado'], VerificacionEnlace.ROTO)
+
+    def test_un_host_saturado_no_bloquea_a_los_demas(self):
+        # Muchas URL de un host lento y una de otro host, con dos lugares globales
+        urls = [self.url(f'/lento?{i}') for i in range(8)] + [self.url('/ok', host='localhost')]
+        asyncio.run(verificar_urls(urls, concurrencia=2, por_host=1, intervalo=0))
+
+        hosts = [host for host, _ in _ServidorPrueba.recibidas]
+        self.assertEqual(len(hosts), 9)
+        self.assertLess(hosts.index('localhost'), 2)
+
+
+class LimiteVerificacionTests(TestCase):
+    """verificar_enlaces con `maximo` (la acción del admin) no revisa de más."""
+
+    def test_revisa_a_lo_mas_el_maximo(self):
+        Proyecto.objects.bulk_create([
+            Proyecto(folio=f'2026A-{i}', titulo='X', modalidad='REPORTE', calendario_registro='2026A',
+                     evidencia_url=f'https://ejemplo.mx/{i}')
+            for i in range(5)
+        ])
+
+        async def verificar(urls, **opciones):
+            return [{'url': url, 'estado': VerificacionEnlace.OK, 'codigo_http': 200} for url in urls]
+
+        with mock.patch('projects.enlaces.verificar_urls', side_effect=verificar) as verificar_urls_:
+            resultado = verificar_enlaces(Proyecto.objects.all(), maximo=3)
+            self.assertEqual(len(verificar_urls_.call_args.args[0]), 3)
+            self.assertEqual((resultado.verificados, resultado.sin_revisar), (3, 2))
+
+            # Las ya revisadas siguen vigentes: la siguiente corrida toma el resto
+            resultado = verificar_enlaces(Proyecto.objects.all(), maximo=3)
+            self.assertEqual((resultado.verificados, resultado.en_cache, resultado.sin_revisar), (2, 3, 0))
+
+
+class ExportacionAsincronaTests(TestCase):
+    """projects.exportacion.en_async entrega el mismo CSV por bloques."""
+
+    async def test_mismo_csv_por_bloques(self):
+        await Proyecto.objects.abulk_create([
+            Proyecto(folio=f'2026A-{i}', titulo=f'PROYECTO {i}', modalidad='REPORTE', calendario_registro='2026A')
+            for i in range(5)
+        ])
+        esperado = ''.join(await sync_to_async(list)(csv_en_streaming('proyectos', Proyecto.objects.all())))
+
+        bloques = [bloque async for bloque in en_async(csv_en_streaming('proyectos', Proyecto.objects.all()), 2)]
+
+        self.assertEqual(len(bloques), 3)
+        self.assertEqual(''.join(bloques), esperado)
+
+
+class BusquedaProyectosTests(TestCase):
+    """projects.busqueda.buscar_proyectos sobre Proyecto.documento_busqueda."""
+
+    @classmethod
+    def setUpTestData(cls):
+        asesor = Asesor.objects.create(
+            codigo_asesor='A1', nombre_completo='JOSÉ PÉREZ ÑÚÑEZ', correo_electronico='jose@sigap.mx',
+        )
+        Proyecto.objects.create(
+            folio='2026A-1', titulo='HUERTO ESCOLAR', asesor=asesor,
+            modalidad='PROTOTIPO', calendario_registro='2026A',
+        )
+        Proyecto.objects.create(
+            folio='2026A-2', titulo='ROBÓTICA', modalidad='PROTOTIPO', calendario_registro='2026A',
+        )
+
+    def folios(self, termino):
+        return sorted(buscar_proyectos(Proyecto.objects.all(), termino).values_list('folio', flat=True))
+
+    def test_prefijos_con_y_sin_acentos(self):
+        for termino in ('PER JOS', 'per jos', 'PÉR JOSÉ', 'pérez', 'nunez', 'ÑÚÑ'):
+            with self.subTest(termino=termino):
+                self.assertEqual(self.folios(termino), ['2026A-1'])
+        self.assertEqual(self.folios('robotica'), ['2026A-2'])
+        self.assertEqual(self.folios('ROBÓT'), ['2026A-2'])
+
+    def test_todas_las_palabras_deben_coincidir(self):
+        self.assertEqual(self.folios('perez robotica'), [])
+        self.assertEqual(self.folios('huerto per'), ['2026A-1'])
+
+
+@override_settings(API_TOKENS=['token-de-prueba'])
+class ApiProyectosTests(TestCase):
+    """projects.views: paginación por folio y GET condicionales."""
+
+    AUTORIZACION = {'HTTP_AUTHORIZATION': 'Bearer token-de-prueba'}
+
+    @classmethod
+    def setUpTestData(cls):
+        for numero in range(1, 6):
+            Proyecto.objects.create(
+                folio=f'2026A-{numero}', titulo=f'PROYECTO {numero}',
+                modalidad='PROTOTIPO', calendario_registro='2026A',
+            )
+        Proyecto.objects.create(folio='2025B-1', titulo='OTRO', modalidad='REPORTE', calendario_registro='2025B')
+
+    def get(self, url, **encabezados):
+        return self.client.get(url, **self.AUTORIZACION, **encabezados)
+
+    def test_requiere_autenticacion(self):
+        self.assertEqual(self.client.get('/api/proyectos/').status_code, 401)
+
+    def test_recorre_todas_las_paginas_por_folio(self):
+        folios = []
+        url = '/api/proyectos/?calendario=2026a&limite=2'
+        paginas = 0
+        while url:
+            datos = self.get(url).json()
+            folios += [proyecto['folio'] for proyecto in datos['resultados']]
+            url = datos['siguiente']
+            paginas += 1
+
+        self.assertEqual(folios, [f'2026A-{numero}' for numero in range(1, 6)])
+        self.assertEqual(paginas, 3)
+
+    def test_if_none_match_responde_304_hasta_que_cambia(self):
+        primera = self.get('/api/proyectos/?limite=3')
+        etag = primera.headers['ETag']
+
+        self.assertEqual(primera.status_code, 200)
+        self.assertEqual(self.get('/api/proyectos/?limite=3', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.get('/api/proyectos/2026A-1/').status_code, 200)
+
+        proyecto = Proyecto.objects.get(pk='2026A-1')
+        proyecto.titulo = 'CAMBIADO'
+        proyecto.save()
+        cambiada = self.get('/api/proyectos/?limite=3', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cambiada.status_code, 200)
+        self.assertNotEqual(cambiada.headers['ETag'], etag)
+        self.assertEqual(cambiada.json()['resultados'][1]['titulo'], 'CAMBIADO')
+
+
+class PlanAsignacionTests(SimpleTestCase):
+    """projects.asignacion.planear_asignacion (sin base de datos)."""
+
+    def evaluadores(self, *especializaciones):
+        return [
+            Evaluador(codigo_evaluador=f'E{i}', nombre_completo=f'EVALUADOR {i}', especializacion=especializacion)
+            for i, especializacion in enumerate(especializaciones, start=1)
+        ]
+
+    def proyectos(self, modalidad, cantidad):
+        return [Proyecto(folio=f'2026A-{i}', modalidad=modalidad) for i in range(1, cantidad + 1)]
+
+    def test_reparte_la_carga_entre_evaluadores_afines(self):
+        evaluadores = self.evaluadores('PROTOTIPOS', 'PROTOTIPO ELECTRÓNICO', 'PROTOTIPOS')
+        resultado = planear_asignacion(self.proyectos('PROTOTIPO', 9), evaluadores, {'E1': 3})
+
+        self.assertEqual(resultado.nuevos, {'E1': 1, 'E2': 4, 'E3': 4})
+        self.assertEqual(resultado.no_afines, 0)
+        self.assertEqual(len(resultado.asignaciones), 9)
+
+    def test_penalizacion_por_especialidad(self):
+        evaluadores = self.evaluadores('PROTOTIPOS', 'REPORTES')
+        proyectos = self.proyectos('PROTOTIPO', 1)
+
+        # Diferencia menor que la penalización: se queda con el afín
+        resultado = planear_asignacion(proyectos, evaluadores, {'E1': 4}, penalizacion=5)
+        self.assertEqual(resultado.asignaciones[0][1].pk, 'E1')
+        # Exactamente `penalizacion` proyectos menos: gana el no afín
+        resultado = planear_asignacion(proyectos, evaluadores, {'E1': 5}, penalizacion=5)
+        self.assertEqual(resultado.asignaciones[0][1].pk, 'E2')
+        self.assertEqual(resultado.no_afines, 1)
+
+    def test_respeta_el_maximo(self):
+        resultado = planear_asignacion(
+            self.proyectos('REPORTE', 5), self.evaluadores('REPORTES', 'REPORTES'), {}, maximo=2,
+        )
+
+        self.assertEqual(resultado.nuevos, {'E1': 2, 'E2': 2})
+        self.assertEqual(resultado.sin_asignar, 1)
+
+
+class ProtocolosSimilaresTests(TestCase):
+    """projects.similitud: huellas MinHash guardadas al confirmar y consulta por bandas."""
+
+    TEXTO = (
+        "El proyecto propone un huerto escolar con riego por goteo controlado por sensores de humedad "
+        "para que los alumnos de secundaria aprendan biología, química y registro de datos. Durante "
+        "el semestre se medirá el crecimiento de las plantas y el consumo de agua de cada parcela, "
+        "y los resultados se compararán con un huerto regado de forma manual por los mismos alumnos."
+    )
+
+    def crear(self, folio, texto):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Formato1.objects.create(
+                folio=folio, objetivo=texto, resumen='', introduccion='', justificacion='',
+            )
+
+    def test_encuentra_la_copia_y_omite_el_texto_distinto(self):
+        self.crear('2025A-1', self.TEXTO)
+        self.crear('2025B-7', self.TEXTO.replace('secundaria', 'preparatoria').replace('semestre', 'ciclo'))
+        self.crear('2025B-8', (
+            "Aplicación móvil para el préstamo de libros de la biblioteca del plantel, con avisos de "
+            "vencimiento, reservas en línea y un catálogo que se consulta desde cualquier teléfono."
+        ))
+        Proyecto.objects.create(
+            folio='2025B-7', titulo='HUERTO', modalidad='PROTOTIPO', calendario_registro='2025B',
+            formato1_id='2025B-7',
+        )
+
+        similares = protocolos_similares('2025A-1')
+
+        self.assertEqual([similar.folio for similar in similares], ['2025B-7'])
+        self.assertGreater(similares[0].similitud, 0.6)
+        self.assertTrue(similares[0].en_proyectos)
+        self.assertEqual(protocolos_similares('2025B-8'), [])
+
+    def test_protocolo_sin_texto_no_tiene_huella(self):
+        self.crear('2025A-2', '')
+        self.assertEqual(protocolos_similares('2025A-2'), [])
+
+
+class ComparacionRendimientoTests(SimpleTestCase):
+    """projects.rendimiento.comparar: tiempos de respuestas fallidas no cuentan como mejora."""
+
+    @staticmethod
+    def corrida(**casos):
+        return {'casos': {
+            nombre: {'consultas': 5, 'mediana_ms': ms, 'estado': estado, 'error': error}
+            for nombre, (ms, estado, error) in casos.items()
+        }}
+
+    def test_estado_distinto_o_fallido_es_regresion(self):
+        anterior = self.corrida(
+            listado=(100.0, 200, ''), detalle=(100.0, 200, ''), accion=(100.0, 302, ''),
+            importar=(100.0, None, ''), exportar=(100.0, 200, ''),
+        )
+        actual = self.corrida(
+            listado=(90.0, 200, ''), detalle=(5.0, 500, ''), accion=(5.0, 200, ''),
+            importar=(95.0, None, ''), exportar=(None, None, 'OperationalError: x'),
+        )
+
+        filas = {fila[0]: fila for fila in comparar(anterior, actual)}
+
+        self.assertEqual(filas['listado'][6:], (False, ''))
+        self.assertEqual(filas['importar'][6:], (False, ''))
+        self.assertEqual(filas['detalle'][2:4], (None, None))
+        self.assertEqual(filas['detalle'][6:], (True, 'estado HTTP 500'))
+        self.assertEqual(filas['accion'][6:], (True, 'estado 302 → 200'))
+        self.assertEqual(filas['exportar'][6:], (True, 'OperationalError: x'))
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('proyectos/', views.proyectos_api, name='api_proyectos'),
+    path('proyectos/<str:folio>/', views.proyecto_api, name='api_proyecto'),
+]
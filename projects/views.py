@@ -1,3 +1,220 @@
-from django.shortcuts import render
+"""
+API de solo lectura de proyectos (JSON).
 
-# Create your views here.
+Para los sistemas institucionales que antes leían el changelist del admin.
+Cada página se arma en un número fijo de consultas, se pagina por folio
+(keyset, sin OFFSET) y responde 304 si no cambió desde la última lectura.
+"""
+import hashlib
+import hmac
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, urlencode
+from django.views.decorators.http import require_GET
+
+from evaluation.models import Evaluaciones
+from .models import Formato1, Participacion, Proyecto
+
+LIMITE_PREDETERMINADO = 100
+LIMITE_MAXIMO = 500
+# Parámetro de la URL -> campo de Proyecto
+FILTROS = {'calendario': 'calendario_registro', 'modalidad': 'modalidad', 'dictamen': 'dictamen'}
+
+
+# ====================================================================
+# Autenticación: token (Authorization: Bearer ...) o sesión de staff
+# ====================================================================
+
+def _token_valido(request):
+    encabezado = request.headers.get('Authorization', '')
+    if not encabezado.startswith('Bearer '):
+        return False
+    token = encabezado[len('Bearer '):].strip()
+    return any(hmac.compare_digest(token, valido) for valido in settings.API_TOKENS)
+
+
+def api_autenticada(vista):
+    @wraps(vista)
+    def envoltura(request, *args, **kwargs):
+        usuario = request.user
+        if not (_token_valido(request) or (usuario.is_active and usuario.is_staff)):
+            return JsonResponse({'error': "Se requiere autenticación."}, status=401)
+        return vista(request, *args, **kwargs)
+    return envoltura
+
+
+# ====================================================================
+# Carga y serialización
+# ====================================================================
+
+def _cargar_proyectos(folios):
+    """
+    Proyectos con asesor, evaluador, Formato1, participantes y última
+    evaluación en cuatro consultas, sin importar el tamaño de la página.
+    """
+    proyectos = list(
+        Proyecto.objects.filter(folio__in=folios).order_by('folio')
+        .select_related('asesor', 'evaluador')
+        .prefetch_related(Prefetch(
+            'participacion_set',
+            queryset=Participacion.objects.select_related('alumno').order_by(
+                '-es_representante', 'alumno__codigo_estudiante'
+            ),
+        ))
+    )
+    # Una sola consulta: por folio (enlace histórico) o por la llave formato1.
+    # El documento de búsqueda solo sirve para buscar; no se serializa.
+    formatos = Formato1.objects.defer('documento_busqueda').in_bulk(
+        set(folios) | {proyecto.formato1_id for proyecto in proyectos if proyecto.formato1_id}
+    )
+    evaluaciones = {
+        evaluacion.proyecto_id: evaluacion
+        for evaluacion in Evaluaciones.objects.filter(proyecto__in=folios)
+        .order_by('proyecto', '-fecha_evaluacion', '-id_evaluacion')
+        .distinct('proyecto')
+    }
+    return [
+        _proyecto_a_dict(
+            proyecto,
+            formatos.get(proyecto.folio) or formatos.get(proyecto.formato1_id),
+            evaluaciones.get(proyecto.folio),
+        )
+        for proyecto in proyectos
+    ]
+
+
+def _persona(persona, codigo, correo):
+    if persona is None:
+        return None
+    return {
+        'codigo': getattr(persona, codigo),
+        'nombre': persona.nombre_completo,
+        'correo': getattr(persona, correo),
+    }
+
+
+def _proyecto_a_dict(proyecto, formato1, evaluacion):
+    return {
+        'folio': proyecto.folio,
+        'titulo': proyecto.titulo,
+        'modalidad': proyecto.modalidad,
+        'variante': proyecto.variante,
+        'nivel_competencia': proyecto.nivel_competencia,
+        'dictamen': proyecto.dictamen,
+        'calendario_registro': proyecto.calendario_registro,
+        'evidencia_url': proyecto.evidencia_url,
+        'protocolo_dictamen_url': proyecto.protocolo_dictamen_url,
+        'actualizado': proyecto.actualizado,
+        'asesor': _persona(proyecto.asesor, 'codigo_asesor', 'correo_electronico'),
+        'evaluador': _persona(proyecto.evaluador, 'codigo_evaluador', 'correo_evaluador'),
+        'participantes': [
+            {
+                **_persona(participacion.alumno, 'codigo_estudiante', 'correo_electronico'),
+                'es_representante': participacion.es_representante,
+            }
+            for participacion in proyecto.participacion_set.all()
+        ],
+        'formato1': formato1 and {
+            'introduccion': formato1.introduccion,
+            'justificacion': formato1.justificacion,
+            'objetivo': formato1.objetivo,
+            'resumen': formato1.resumen,
+        },
+        'ultima_evaluacion': evaluacion and {
+            'id': evaluacion.id_evaluacion,
+            'fecha': evaluacion.fecha_evaluacion,
+            'tipo_revision': evaluacion.tipo_revision,
+            'resolutivo': evaluacion.resolutivo,
+            'evaluador': evaluacion.evaluador_id,
+            'observaciones': evaluacion.observaciones,
+        },
+        'total_evaluaciones': proyecto.total_evaluaciones,
+    }
+
+
+# ====================================================================
+# Respuestas condicionales (ETag / Last-Modified)
+# ====================================================================
+
+def _respuesta_condicional(request, versiones, construir):
+    """
+    `versiones` es la lista de (folio, actualizado) que determina la
+    respuesta. Si el cliente ya la tiene regresa 304 sin cargar los datos;
+    si no, llama a `construir()` para armar el JSON.
+    """
+    huella = hashlib.sha256(
+        '|'.join(f"{folio}:{actualizado.isoformat()}" for folio, actualizado in versiones).encode()
+    ).hexdigest()
+    etag = f'"{huella[:32]}"'
+    ultima = max((actualizado for _, actualizado in versiones), default=None)
+    ultima = ultima.timestamp() if ultima else None
+
+    respuesta = get_conditional_response(request, etag=etag, last_modified=ultima)
+    if respuesta is None:
+        respuesta = JsonResponse(construir(), json_dumps_params={'ensure_ascii': False})
+    respuesta.headers['ETag'] = etag
+    if ultima:
+        respuesta.headers['Last-Modified'] = http_date(ultima)
+    # El cliente puede guardar la respuesta, pero debe revalidarla cada vez
+    patch_cache_control(respuesta, private=True, no_cache=True)
+    patch_vary_headers(respuesta, ('Authorization', 'Cookie'))
+    return respuesta
+
+
+# ====================================================================
+# Vistas
+# ====================================================================
+
+@require_GET
+@api_autenticada
+def proyectos_api(request):
+    """
+    Lista de proyectos ordenada por folio.
+    Parámetros: calendario, modalidad, dictamen, despues (folio), limite.
+    """
+    try:
+        limite = min(int(request.GET.get('limite', LIMITE_PREDETERMINADO)), LIMITE_MAXIMO)
+    except ValueError:
+        limite = 0
+    if limite < 1:
+        return JsonResponse({'error': f"limite debe ser un entero entre 1 y {LIMITE_MAXIMO}."}, status=400)
+
+    proyectos = Proyecto.objects.order_by('folio')
+    filtros = {}
+    for parametro, campo in FILTROS.items():
+        valor = request.GET.get(parametro, '').strip()
+        if valor:
+            filtros[parametro] = valor
+            proyectos = proyectos.filter(**{campo: valor.upper()})
+    despues = request.GET.get('despues', '').strip()
+    if despues:
+        proyectos = proyectos.filter(folio__gt=despues.upper())
+
+    # Consulta ligera: basta para el ETag y para saber si hay otra página
+    # (la fila extra también entra al ETag, así cambia si aparece o desaparece)
+    versiones = list(proyectos.values_list('folio', 'actualizado')[:limite + 1])
+
+    def construir():
+        folios = [folio for folio, _ in versiones[:limite]]
+        siguiente = None
+        if len(versiones) > limite:
+            siguiente = request.build_absolute_uri(
+                f"{request.path}?{urlencode({**filtros, 'despues': folios[-1], 'limite': limite})}"
+            )
+        return {'resultados': _cargar_proyectos(folios), 'siguiente': siguiente}
+
+    return _respuesta_condicional(request, versiones, construir)
+
+
+@require_GET
+@api_autenticada
+def proyecto_api(request, folio):
+    """Detalle de un proyecto."""
+    versiones = list(Proyecto.objects.filter(folio=folio.upper()).values_list('folio', 'actualizado'))
+    if not versiones:
+        return JsonResponse({'error': "Proyecto no encontrado."}, status=404)
+    return _respuesta_condicional(request, versiones, lambda: _cargar_proyectos([versiones[0][0]])[0])
@@ -1,3 +1,17 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import SolicitudRegistro
+
+
+@admin.register(SolicitudRegistro)
+class SolicitudRegistroAdmin(admin.ModelAdmin):
+    """Envíos del portal de registro; solo se consultan."""
+    list_display = ('fecha', 'codigo_estudiante', 'folio', 'token')
+    search_fields = ('codigo_estudiante', 'folio')
+    readonly_fields = ('token', 'codigo_estudiante', 'folio', 'fecha')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,49 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+from projects.models import Proyecto
+from .registro import catalogo
+
+
+class CodigosField(forms.Field):
+    """Lista de códigos de alumno: lista JSON o texto separado por comas."""
+
+    def to_python(self, value):
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(',')
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError("Debe ser una lista de códigos.")
+        codigos = []
+        for codigo in value:
+            codigo = str(codigo).strip().upper()
+            if codigo and codigo not in codigos:
+                codigos.append(codigo)
+        return codigos
+
+
+class SolicitudForm(forms.Form):
+    """Datos de un envío del portal de registro (JSON)."""
+    token = forms.UUIDField()
+    representante = forms.CharField(max_length=9)
+    correo = forms.EmailField(max_length=100)
+    participantes = CodigosField(required=False)
+    titulo = forms.CharField(max_length=255)
+    modalidad = forms.ChoiceField(choices=Proyecto.MODALIDAD_CHOICES)
+    variante = forms.CharField(max_length=50, required=False)
+    nivel_competencia = forms.CharField(max_length=30, required=False)
+    asesor = forms.CharField(max_length=20)
+    introduccion = forms.CharField()
+    justificacion = forms.CharField()
+    objetivo = forms.CharField()
+    resumen = forms.CharField()
+
+    def clean_representante(self):
+        return self.cleaned_data['representante'].strip().upper()
+
+    def clean_asesor(self):
+        asesor = self.cleaned_data['asesor'].strip().upper()
+        if asesor not in {fila['codigo'] for fila in catalogo()['asesores']}:
+            raise ValidationError("Asesor no encontrado.")
+        return asesor
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0007_verificacion_enlace'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolicitudRegistro',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.UUIDField(unique=True, verbose_name='TOKEN DEL CLIENTE')),
+                ('codigo_estudiante', models.CharField(db_index=True, max_length=20, verbose_name='REPRESENTANTE')),
+                ('fecha', models.DateTimeField(auto_now_add=True, verbose_name='FECHA DE REGISTRO')),
+                ('proyecto', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='projects.proyecto', verbose_name='PROYECTO REGISTRADO')),
+            ],
+            options={
+                'verbose_name': 'Solicitud de registro',
+                'verbose_name_plural': 'Solicitudes de registro',
+                'ordering': ['-fecha'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solicitudregistro',
+            name='folio',
+            field=models.CharField(blank=True, max_length=50, null=True, verbose_name='FOLIO REGISTRADO'),
+        ),
+        migrations.RunSQL(
+            "UPDATE registration_solicitudregistro SET folio = proyecto_id",
+            "UPDATE registration_solicitudregistro SET proyecto_id = folio"
+            " WHERE folio IN (SELECT folio FROM projects_proyecto)",
+        ),
+        migrations.RemoveField(
+            model_name='solicitudregistro',
+            name='proyecto',
+        ),
+    ]
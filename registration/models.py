@@ -1,3 +1,25 @@
 from django.db import models
 
-# Create your models here.
+
+class SolicitudRegistro(models.Model):
+    """
+    Un envío del portal de registro. El `token` lo genera el cliente para
+    cada registro: si el envío se repite (doble clic, reintento por red), la
+    segunda petición recibe el mismo folio en lugar de crear otro proyecto.
+
+    El folio se guarda como texto y no como llave foránea: el proyecto puede
+    pasar al archivo (archive.archivado) o borrarse con DELETE directos y la
+    solicitud se conserva sin quedar apuntando a una fila que ya no existe.
+    """
+    token = models.UUIDField(unique=True, verbose_name="TOKEN DEL CLIENTE")
+    codigo_estudiante = models.CharField(max_length=20, db_index=True, verbose_name="REPRESENTANTE")
+    folio = models.CharField(max_length=50, null=True, blank=True, verbose_name="FOLIO REGISTRADO")
+    fecha = models.DateTimeField(auto_now_add=True, verbose_name="FECHA DE REGISTRO")
+
+    class Meta:
+        verbose_name = "Solicitud de registro"
+        verbose_name_plural = "Solicitudes de registro"
+        ordering = ['-fecha']
+
+    def __str__(self):
+        return f"{self.token} ({self.folio or 'SIN PROYECTO'})"
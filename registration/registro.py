@@ -0,0 +1,220 @@
+"""
+Registro de proyectos por los propios alumnos (portal de registro).
+
+Pensado para el día de cierre, con cientos de envíos simultáneos:
+
+- Idempotencia: cada envío trae un `token` generado por el cliente. Lo
+  primero que hace la transacción es insertar la SolicitudRegistro; un
+  reintento con el mismo token espera a que termine el primero (índice
+  único) y recibe el mismo folio.
+- Pocas consultas: el catálogo (calendario activo, modalidades, asesores)
+  sale de la caché; Formato1, Proyecto y participantes se insertan con
+  bulk_create, sin señales por fila; el documento de búsqueda se arma con
+  un solo UPDATE.
+- Límites, contados en la caché (compartida entre procesos solo si CACHES
+  apunta a un servidor de caché) en ventanas de REGISTRO_VENTANA_SEGUNDOS:
+  REGISTRO_LIMITE envíos por representante, contados solo después de
+  verificar su correo (así nadie agota el cupo de otro alumno con solo
+  saber su código), y REGISTRO_FALLIDOS_LIMITE verificaciones fallidas por
+  dirección IP.
+- Las estadísticas del calendario se recalculan a lo más una vez cada
+  REGISTRO_RECALCULO_SEGUNDOS; `reconstruir_reportes --calendario` pone al
+  día lo que quede pendiente al cerrar el registro.
+"""
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+
+from people.models import Alumno, Asesor
+from projects.folios import asignar_folio
+from projects.models import Formato1, Participacion, Proyecto
+from projects.signals import proyectos_modificados
+from projects.similitud import firma_protocolo, guardar_firmas
+from reports.resumen import programar_recalculo
+from .models import SolicitudRegistro
+
+CLAVE_CATALOGO = 'registro:catalogo'
+
+
+class ErrorRegistro(Exception):
+    """Envío rechazado; `estado` es el código HTTP de la respuesta."""
+
+    def __init__(self, mensaje, estado=400, errores=None, reintentar=None):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.errores = errores or {}
+        self.reintentar = reintentar
+
+
+@dataclass
+class Registro:
+    folio: str
+    calendario: str
+    creado: bool
+
+
+# ====================================================================
+# Catálogo (solo lectura, en caché)
+# ====================================================================
+
+def catalogo():
+    """Calendario activo, modalidades y asesores para el formulario del portal."""
+    datos = cache.get(CLAVE_CATALOGO)
+    if datos is None:
+        datos = {
+            'calendario': settings.REGISTRO_CALENDARIO or None,
+            'modalidades': [modalidad for modalidad, _ in Proyecto.MODALIDAD_CHOICES],
+            'asesores': [
+                {'codigo': codigo, 'nombre': nombre}
+                for codigo, nombre in Asesor.objects.order_by('nombre_completo')
+                .values_list('codigo_asesor', 'nombre_completo')
+            ],
+            'maximo_participantes': settings.REGISTRO_MAXIMO_PARTICIPANTES,
+        }
+        cache.set(CLAVE_CATALOGO, datos, settings.REGISTRO_CATALOGO_SEGUNDOS)
+    return datos
+
+
+# ====================================================================
+# Registro
+# ====================================================================
+
+def _contar(clave):
+    """Suma uno al contador de la ventana actual y regresa el total."""
+    ventana = settings.REGISTRO_VENTANA_SEGUNDOS
+    cache.add(clave, 0, ventana)
+    try:
+        return cache.incr(clave)
+    except ValueError:
+        # La llave expiró entre add() e incr()
+        cache.set(clave, 1, ventana)
+        return 1
+
+
+def _rechazar_identidad(ip, mensaje, estado, errores):
+    """Cuenta la verificación fallida de la IP y lanza el error."""
+    if ip:
+        _contar(f'registro:fallidos:{ip}')
+    raise ErrorRegistro(mensaje, estado=estado, errores=errores)
+
+
+def _registro_previo(token):
+    folio = SolicitudRegistro.objects.filter(token=token).values_list('folio', flat=True).first()
+    if folio:
+        return Registro(folio=folio, calendario=folio.rsplit('-', 1)[0], creado=False)
+    return None
+
+
+def _programar_estadisticas(calendario):
+    # El primer envío de cada ventana recalcula; los demás no esperan
+    if cache.add(f'registro:recalculo:{calendario}', 1, settings.REGISTRO_RECALCULO_SEGUNDOS):
+        programar_recalculo([calendario])
+
+
+def registrar(datos, ip=None):
+    """
+    Registra el proyecto de `datos` (cleaned_data de SolicitudForm) en el
+    calendario activo. Regresa Registro; si el token ya se había usado,
+    regresa el folio de entonces sin crear nada. `ip` es la dirección del
+    cliente, para el límite de verificaciones fallidas. Lanza ErrorRegistro.
+    """
+    calendario = settings.REGISTRO_CALENDARIO
+    if not calendario:
+        raise ErrorRegistro("El registro de proyectos está cerrado.", estado=403)
+
+    previo = _registro_previo(datos['token'])
+    if previo:
+        return previo
+
+    representante = datos['representante']
+    codigos = [representante] + [codigo for codigo in datos['participantes'] if codigo != representante]
+    if len(codigos) > settings.REGISTRO_MAXIMO_PARTICIPANTES:
+        raise ErrorRegistro(
+            f"El máximo es de {settings.REGISTRO_MAXIMO_PARTICIPANTES} participantes.",
+            errores={'participantes': ["Demasiados participantes."]},
+        )
+    if ip and (cache.get(f'registro:fallidos:{ip}') or 0) >= settings.REGISTRO_FALLIDOS_LIMITE:
+        raise ErrorRegistro(
+            "Demasiados intentos fallidos desde esta dirección; intente más tarde.",
+            estado=429, reintentar=settings.REGISTRO_VENTANA_SEGUNDOS,
+        )
+
+    correos = dict(Alumno.objects.filter(pk__in=codigos).values_list('codigo_estudiante', 'correo_electronico'))
+    desconocidos = [codigo for codigo in codigos if codigo not in correos]
+    if desconocidos:
+        _rechazar_identidad(
+            ip, "Hay códigos que no están en el padrón de alumnos.",
+            400, {'participantes': desconocidos},
+        )
+    if (correos[representante] or '').upper() != datos['correo'].upper():
+        _rechazar_identidad(
+            ip, "El correo no corresponde al código del representante.",
+            403, {'correo': ["No coincide con el padrón."]},
+        )
+
+    # Solo cuentan los envíos de un representante ya verificado
+    if _contar(f'registro:envios:{representante}') > settings.REGISTRO_LIMITE:
+        raise ErrorRegistro(
+            "Demasiados registros desde este código; intente más tarde.",
+            estado=429, reintentar=settings.REGISTRO_VENTANA_SEGUNDOS,
+        )
+
+    formato1 = Formato1(
+        introduccion=datos['introduccion'],
+        justificacion=datos['justificacion'],
+        objetivo=datos['objetivo'],
+        resumen=datos['resumen'],
+    )
+    # La huella MinHash se calcula antes de bloquear el contador de folios
+    firma = firma_protocolo(formato1)
+
+    try:
+        with transaction.atomic():
+            # Primero el token: un reintento simultáneo espera aquí al original
+            solicitud = SolicitudRegistro.objects.create(token=datos['token'], codigo_estudiante=representante)
+            # El contador del calendario queda bloqueado hasta el COMMIT: la
+            # revisión de participantes no compite con otro registro
+            folio = asignar_folio(calendario)
+
+            registrados = list(
+                Participacion.objects.filter(alumno__in=codigos, proyecto__calendario_registro=calendario)
+                .values_list('alumno', flat=True)
+            )
+            if registrados:
+                raise ErrorRegistro(
+                    f"Hay alumnos que ya tienen proyecto en el calendario {calendario}.",
+                    estado=409, errores={'participantes': registrados},
+                )
+
+            formato1.folio = folio
+            Formato1.objects.bulk_create([formato1])
+            # bulk_create no dispara post_save: la huella del protocolo va aparte
+            guardar_firmas({folio: firma})
+            Proyecto.objects.bulk_create([Proyecto(
+                folio=folio,
+                titulo=datos['titulo'],
+                asesor_id=datos['asesor'],
+                formato1=formato1,
+                modalidad=datos['modalidad'],
+                variante=datos['variante'] or None,
+                nivel_competencia=datos['nivel_competencia'] or None,
+                calendario_registro=calendario,
+            )])
+            Participacion.objects.bulk_create([
+                Participacion(proyecto_id=folio, alumno_id=codigo, es_representante=codigo == representante)
+                for codigo in codigos
+            ])
+            SolicitudRegistro.objects.filter(pk=solicitud.pk).update(folio=folio)
+            proyectos_modificados(Proyecto.objects.filter(pk=folio))
+            _programar_estadisticas(calendario)
+    except IntegrityError:
+        # El mismo token llegó por otra petición que ya terminó
+        previo = _registro_previo(datos['token'])
+        if previo:
+            return previo
+        if SolicitudRegistro.objects.filter(token=datos['token']).exists():
+            raise ErrorRegistro("Este token ya se usó; genere uno nuevo.", estado=409)
+        raise
+    return Registro(folio=folio, calendario=calendario, creado=True)
@@ -1,3 +1,129 @@
-from django.test import TestCase
+import json
+import threading
+import uuid
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TransactionTestCase, override_settings
+
+from people.models import Alumno, Asesor
+from projects.models import Participacion, Proyecto
+from .models import SolicitudRegistro
+
+URL = '/registro/proyectos/'
+
+
+@override_settings(REGISTRO_CALENDARIO='2026B', REGISTRO_LIMITE=2, REGISTRO_FALLIDOS_LIMITE=2)
+class RegistroProyectosTests(TransactionTestCase):
+    """Portal de registro (registration.registro) contra PostgreSQL real."""
+
+    def setUp(self):
+        cache.clear()
+        Asesor.objects.create(codigo_asesor='A1', nombre_completo='ASESORA UNO', correo_electronico='a1@sigap.mx')
+        Alumno.objects.bulk_create([
+            Alumno(codigo_estudiante=codigo, nombre_completo=f'ALUMNO {codigo}',
+                   correo_electronico=f'{codigo.lower()}@alumnos.udg.mx')
+            for codigo in ('100', '200', '300')
+        ])
+
+    def tearDown(self):
+        cache.clear()
+
+    def datos(self, **cambios):
+        datos = {
+            'token': str(uuid.uuid4()),
+            'representante': '100',
+            'correo': '100@alumnos.udg.mx',
+            'participantes': ['200'],
+            'titulo': 'Huerto escolar',
+            'modalidad': 'PROTOTIPO',
+            'asesor': 'A1',
+            'introduccion': 'Introducción del protocolo',
+            'justificacion': 'Justificación del protocolo',
+            'objetivo': 'Objetivo del protocolo',
+            'resumen': 'Resumen del protocolo',
+        }
+        datos.update(cambios)
+        return datos
+
+    def enviar(self, datos, ip='10.0.0.1', cliente=None):
+        return (cliente or self.client).post(
+            URL, json.dumps(datos), content_type='application/json', REMOTE_ADDR=ip,
+        )
+
+    def test_registra_y_un_token_repetido_recibe_el_mismo_folio(self):
+        datos = self.datos()
+
+        primera = self.enviar(datos)
+        segunda = self.enviar(datos)
+
+        self.assertEqual(primera.status_code, 201)
+        self.assertEqual(segunda.status_code, 200)
+        self.assertEqual(primera.json()['folio'], segunda.json()['folio'])
+        folio = primera.json()['folio']
+        self.assertEqual(Proyecto.objects.get().pk, folio)
+        self.assertEqual(
+            set(Participacion.objects.values_list('alumno', 'es_representante')),
+            {('100', True), ('200', False)},
+        )
+        self.assertEqual(SolicitudRegistro.objects.get().folio, folio)
+
+    def test_envios_simultaneos_con_el_mismo_token(self):
+        datos = self.datos()
+        barrera = threading.Barrier(2)
+        respuestas = []
+
+        def enviar():
+            try:
+                barrera.wait()
+                respuestas.append(self.enviar(datos, cliente=Client()))
+            finally:
+                connection.close()
+
+        hilos = [threading.Thread(target=enviar) for _ in range(2)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(sorted(r.status_code for r in respuestas), [200, 201])
+        self.assertEqual(len({r.json()['folio'] for r in respuestas}), 1)
+        self.assertEqual(Proyecto.objects.count(), 1)
+        self.assertEqual(SolicitudRegistro.objects.count(), 1)
+
+    def test_participante_con_proyecto_en_el_calendario(self):
+        self.assertEqual(self.enviar(self.datos()).status_code, 201)
+
+        respuesta = self.enviar(self.datos(representante='300', correo='300@alumnos.udg.mx', participantes=['200']))
+
+        self.assertEqual(respuesta.status_code, 409)
+        self.assertEqual(respuesta.json()['errores'], {'participantes': ['200']})
+        self.assertEqual(Proyecto.objects.count(), 1)
+        # La transacción se revirtió completa, incluida la solicitud
+        self.assertEqual(SolicitudRegistro.objects.count(), 1)
+
+    def test_correo_equivocado_cuenta_como_fallido_por_ip(self):
+        for _ in range(2):
+            respuesta = self.enviar(self.datos(correo='otro@gmail.com'), ip='10.0.0.9')
+            self.assertEqual(respuesta.status_code, 403)
+            self.assertIn('correo', respuesta.json()['errores'])
+        bloqueada = self.enviar(self.datos(), ip='10.0.0.9')
+
+        self.assertEqual(bloqueada.status_code, 429)
+        self.assertIn('Retry-After', bloqueada.headers)
+        # Otra IP, con el correo correcto, sí registra
+        self.assertEqual(self.enviar(self.datos(), ip='10.0.0.2').status_code, 201)
+
+    def test_limite_por_representante_solo_cuenta_envios_verificados(self):
+        # Muchos intentos ajenos con el código del representante, desde varias IP
+        for i in range(5):
+            self.enviar(self.datos(correo='intruso@gmail.com'), ip=f'10.1.0.{i}')
+
+        self.assertEqual(self.enviar(self.datos(participantes=[])).status_code, 201)
+        # Segundo envío verificado: 409 porque ya tiene proyecto, pero cuenta
+        self.assertEqual(self.enviar(self.datos(participantes=[])).status_code, 409)
+        respuesta = self.enviar(self.datos(participantes=[]))
+
+        self.assertEqual(respuesta.status_code, 429)
+        self.assertEqual(respuesta.headers['Retry-After'], str(settings.REGISTRO_VENTANA_SEGUNDOS))
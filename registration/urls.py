@@ -0,0 +1,8 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('catalogo/', views.catalogo_registro, name='registro_catalogo'),
+    path('proyectos/', views.registrar_proyecto, name='registro_proyecto'),
+]
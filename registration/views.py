@@ -1,3 +1,60 @@
-from django.shortcuts import render
+"""
+Portal de registro de proyectos (JSON). Lo usan los alumnos sin cuenta en el
+admin: el representante se identifica con su código y el correo del padrón,
+y cada envío lleva un token propio (ver registration.registro).
+"""
+import json
 
-# Create your views here.
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .forms import SolicitudForm
+from .registro import ErrorRegistro, catalogo, registrar
+
+
+def _respuesta(datos, estado=200):
+    return JsonResponse(datos, status=estado, json_dumps_params={'ensure_ascii': False})
+
+
+@require_GET
+def catalogo_registro(request):
+    """Calendario activo, modalidades y asesores; los clientes pueden guardarlo unos minutos."""
+    respuesta = _respuesta(catalogo())
+    patch_cache_control(respuesta, public=True, max_age=settings.REGISTRO_CATALOGO_SEGUNDOS)
+    return respuesta
+
+
+# Sin sesión ni cookies: el token del envío es lo que evita los duplicados
+@csrf_exempt
+@require_POST
+def registrar_proyecto(request):
+    """
+    Registra un proyecto. 201 con el folio nuevo; 200 con el mismo folio si
+    el token ya se había usado; 400/403/409/429 con `error` y `errores`.
+    """
+    try:
+        cuerpo = json.loads(request.body)
+    except ValueError:
+        return _respuesta({'error': "El cuerpo debe ser JSON."}, estado=400)
+    if not isinstance(cuerpo, dict):
+        return _respuesta({'error': "El cuerpo debe ser un objeto JSON."}, estado=400)
+
+    form = SolicitudForm(cuerpo)
+    if not form.is_valid():
+        return _respuesta({'error': "Datos incompletos o inválidos.", 'errores': form.errors}, estado=400)
+
+    try:
+        registro = registrar(form.cleaned_data, ip=request.META.get('REMOTE_ADDR'))
+    except ErrorRegistro as e:
+        respuesta = _respuesta({'error': str(e), 'errores': e.errores}, estado=e.estado)
+        if e.reintentar:
+            respuesta.headers['Retry-After'] = str(e.reintentar)
+        return respuesta
+
+    return _respuesta(
+        {'folio': registro.folio, 'calendario': registro.calendario},
+        estado=201 if registro.creado else 200,
+    )
@@ -0,0 +1,51 @@
+from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.template.response import TemplateResponse
+from .models import TotalesCalendario
+from .resumen import tablero_calendario
+
+# Calendarios que se muestran en el comparativo del tablero
+CALENDARIOS_RECIENTES = 10
+
+
+@admin.register(TotalesCalendario)
+class TableroCalendariosAdmin(admin.ModelAdmin):
+    """
+    Tablero de estadísticas por calendario. Se arma solo con las tablas de
+    resumen (ver reports.resumen), sin GROUP BY sobre los proyectos.
+    """
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        calendarios = TotalesCalendario.objects.order_by('-calendario')
+        recientes = list(calendarios[:CALENDARIOS_RECIENTES])
+
+        totales = None
+        seleccion = request.GET.get('calendario', '').strip().upper()
+        if seleccion:
+            totales = calendarios.filter(calendario=seleccion).first()
+        if totales is None and recientes:
+            totales = recientes[0]
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': "Estadísticas por calendario",
+            'calendarios': calendarios.values_list('calendario', flat=True),
+            'recientes': recientes,
+            'totales': totales,
+            'tablero': tablero_calendario(totales) if totales else None,
+            **(extra_context or {}),
+        }
+        return TemplateResponse(request, 'admin/reports/tablero.html', context)
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from reports.resumen import calendarios_existentes, recalcular_calendarios
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye las estadísticas por calendario del tablero de reportes. "
+        "Normalmente se mantienen solas; úselo después de cargas masivas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendario', action='append',
+                            help="Solo este calendario (se puede repetir).")
+
+    def handle(self, *args, **options):
+        if options['calendario']:
+            calendarios = {calendario.upper() for calendario in options['calendario']}
+        else:
+            calendarios = calendarios_existentes()
+
+        inicio = time.perf_counter()
+        for calendario in sorted(calendarios):
+            recalcular_calendarios([calendario])
+            self.stdout.write(f"  {calendario}")
+
+        segundos = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(calendarios)} calendarios reconstruidos en {segundos:.1f} s."
+        ))
@@ -0,0 +1,77 @@
+# Generated by Django 6.0.1 on 2026-10-18 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('people', '0003_campos_mayusculas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TotalesCalendario',
+            fields=[
+                ('calendario', models.CharField(max_length=10, primary_key=True, serialize=False, verbose_name='CALENDARIO')),
+                ('proyectos', models.PositiveIntegerField(default=0, verbose_name='PROYECTOS')),
+                ('pendientes', models.PositiveIntegerField(default=0, verbose_name='DICTAMEN PENDIENTE')),
+                ('evaluaciones', models.PositiveIntegerField(default=0, verbose_name='EVALUACIONES')),
+                ('prorrogas', models.PositiveIntegerField(default=0, verbose_name='PRÓRROGAS')),
+                ('actualizado', models.DateTimeField(auto_now=True, verbose_name='ACTUALIZADO')),
+            ],
+            options={
+                'verbose_name': 'Estadística por calendario',
+                'verbose_name_plural': 'Estadísticas por calendario',
+                'ordering': ['-calendario'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumenCalendario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendario', models.CharField(max_length=10, verbose_name='CALENDARIO')),
+                ('modalidad', models.CharField(max_length=50, verbose_name='MODALIDAD')),
+                ('dictamen', models.CharField(max_length=50, verbose_name='DICTAMEN')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='PROYECTOS')),
+            ],
+            options={
+                'verbose_name': 'Resumen de proyectos',
+                'verbose_name_plural': 'Resúmenes de proyectos',
+                'constraints': [models.UniqueConstraint(fields=('calendario', 'modalidad', 'dictamen'), name='resumen_calendario_unico')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumenProrroga',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendario', models.CharField(max_length=10, verbose_name='CALENDARIO')),
+                ('calendario_presentacion', models.CharField(max_length=10, verbose_name='CALENDARIO PARA PRESENTACIÓN')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='PRÓRROGAS')),
+            ],
+            options={
+                'verbose_name': 'Resumen de prórrogas',
+                'verbose_name_plural': 'Resúmenes de prórrogas',
+                'constraints': [models.UniqueConstraint(fields=('calendario', 'calendario_presentacion'), name='resumen_prorroga_unico')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CargaEvaluador',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendario', models.CharField(max_length=10, verbose_name='CALENDARIO')),
+                ('proyectos', models.PositiveIntegerField(default=0, verbose_name='PROYECTOS ASIGNADOS')),
+                ('pendientes', models.PositiveIntegerField(default=0, verbose_name='DICTAMEN PENDIENTE')),
+                ('evaluaciones', models.PositiveIntegerField(default=0, verbose_name='EVALUACIONES REALIZADAS')),
+                ('evaluador', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='people.evaluador', verbose_name='EVALUADOR')),
+            ],
+            options={
+                'verbose_name': 'Carga de evaluador',
+                'verbose_name_plural': 'Cargas de evaluadores',
+                'constraints': [models.UniqueConstraint(fields=('calendario', 'evaluador'), name='carga_evaluador_unica')],
+            },
+        ),
+    ]
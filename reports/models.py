@@ -0,0 +1,87 @@
+from django.db import models
+
+from people.models import Evaluador
+
+# ====================================================================
+# Tablas de resumen por calendario
+# ====================================================================
+# Las mantiene reports.resumen: cada cambio en Proyecto, Evaluaciones o
+# Prorroga recalcula solo el calendario afectado. Nadie las edita a mano.
+
+class TotalesCalendario(models.Model):
+    """Totales de un calendario; `actualizado` versiona la caché del tablero."""
+    calendario = models.CharField(max_length=10, primary_key=True, verbose_name="CALENDARIO")
+    proyectos = models.PositiveIntegerField(default=0, verbose_name="PROYECTOS")
+    pendientes = models.PositiveIntegerField(default=0, verbose_name="DICTAMEN PENDIENTE")
+    evaluaciones = models.PositiveIntegerField(default=0, verbose_name="EVALUACIONES")
+    prorrogas = models.PositiveIntegerField(default=0, verbose_name="PRÓRROGAS")
+    actualizado = models.DateTimeField(auto_now=True, verbose_name="ACTUALIZADO")
+
+    class Meta:
+        verbose_name = "Estadística por calendario"
+        verbose_name_plural = "Estadísticas por calendario"
+        ordering = ['-calendario']
+
+    def __str__(self):
+        return f"Calendario {self.calendario}"
+
+
+class ResumenCalendario(models.Model):
+    """Número de proyectos por calendario, modalidad y dictamen."""
+    calendario = models.CharField(max_length=10, verbose_name="CALENDARIO")
+    modalidad = models.CharField(max_length=50, verbose_name="MODALIDAD")
+    dictamen = models.CharField(max_length=50, verbose_name="DICTAMEN")
+    total = models.PositiveIntegerField(default=0, verbose_name="PROYECTOS")
+
+    class Meta:
+        verbose_name = "Resumen de proyectos"
+        verbose_name_plural = "Resúmenes de proyectos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['calendario', 'modalidad', 'dictamen'], name='resumen_calendario_unico'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.calendario} - {self.modalidad} - {self.dictamen}: {self.total}"
+
+
+class CargaEvaluador(models.Model):
+    """Proyectos asignados y evaluaciones realizadas por evaluador en un calendario."""
+    calendario = models.CharField(max_length=10, verbose_name="CALENDARIO")
+    # Nulo: proyectos sin evaluador asignado
+    evaluador = models.ForeignKey(
+        Evaluador, on_delete=models.CASCADE, null=True, blank=True, verbose_name="EVALUADOR"
+    )
+    proyectos = models.PositiveIntegerField(default=0, verbose_name="PROYECTOS ASIGNADOS")
+    pendientes = models.PositiveIntegerField(default=0, verbose_name="DICTAMEN PENDIENTE")
+    evaluaciones = models.PositiveIntegerField(default=0, verbose_name="EVALUACIONES REALIZADAS")
+
+    class Meta:
+        verbose_name = "Carga de evaluador"
+        verbose_name_plural = "Cargas de evaluadores"
+        constraints = [
+            models.UniqueConstraint(fields=['calendario', 'evaluador'], name='carga_evaluador_unica'),
+        ]
+
+    def __str__(self):
+        return f"{self.calendario} - {self.evaluador_id or 'SIN EVALUADOR'}"
+
+
+class ResumenProrroga(models.Model):
+    """Prórrogas de los proyectos de un calendario, por calendario de presentación."""
+    calendario = models.CharField(max_length=10, verbose_name="CALENDARIO")
+    calendario_presentacion = models.CharField(max_length=10, verbose_name="CALENDARIO PARA PRESENTACIÓN")
+    total = models.PositiveIntegerField(default=0, verbose_name="PRÓRROGAS")
+
+    class Meta:
+        verbose_name = "Resumen de prórrogas"
+        verbose_name_plural = "Resúmenes de prórrogas"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['calendario', 'calendario_presentacion'], name='resumen_prorroga_unico'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.calendario} → {self.calendario_presentacion}: {self.total}"
@@ -0,0 +1,189 @@
+"""
+Estadísticas precalculadas por calendario.
+
+El tablero del admin lee solo las tablas de reports.models, así que su costo
+no depende de cuánto historial haya. Los cambios en Proyecto, Evaluaciones y
+Prorroga programan el recálculo del calendario afectado al confirmar la
+transacción (ver reports.signals); `reconstruir_reportes` recalcula todo.
+Los calendarios archivados (ver archive.archivado) conservan las
+estadísticas que tenían al archivarse.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from archive.models import CalendarioArchivado
+from evaluation.models import Evaluaciones
+from projects.models import Prorroga, Proyecto
+from .models import CargaEvaluador, ResumenCalendario, ResumenProrroga, TotalesCalendario
+
+CACHE_SEGUNDOS = 60 * 60
+
+
+# ====================================================================
+# Recálculo por calendario
+# ====================================================================
+
+class _RecalculoPendiente:
+    """Calendarios por recalcular al confirmar la transacción de `conexion`."""
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+        self.calendarios = set()
+
+    def __call__(self):
+        if getattr(self.conexion, '_sigap_recalculo', None) is self:
+            self.conexion._sigap_recalculo = None
+        recalcular_calendarios(self.calendarios)
+
+
+def programar_recalculo(calendarios):
+    """
+    Recalcula los calendarios cuando se confirme la transacción en curso.
+
+    Las llamadas de una misma transacción (p. ej. un guardado del admin con
+    inlines, que dispara una señal por fila) se juntan en un solo on_commit,
+    así cada calendario se recalcula una vez por commit.
+    """
+    calendarios = {calendario for calendario in calendarios if calendario}
+    if not calendarios:
+        return
+    conexion = transaction.get_connection()
+    pendiente = getattr(conexion, '_sigap_recalculo', None)
+    # Si la transacción (o el savepoint donde se registró) se revirtió, Django
+    # ya descartó el callback: se empieza un conjunto nuevo.
+    if pendiente is None or all(registrado is not pendiente for _, registrado, _ in conexion.run_on_commit):
+        pendiente = conexion._sigap_recalculo = _RecalculoPendiente(conexion)
+        pendiente.calendarios |= calendarios
+        transaction.on_commit(pendiente)
+    else:
+        pendiente.calendarios |= calendarios
+
+
+def recalcular_calendarios(calendarios):
+    """Recalcula las tablas de resumen de cada calendario, uno por transacción."""
+    calendarios = set(calendarios)
+    archivados = set(
+        CalendarioArchivado.objects.filter(calendario__in=calendarios).values_list('calendario', flat=True)
+    )
+    for calendario in sorted(calendarios - archivados):
+        with transaction.atomic():
+            _recalcular(calendario)
+
+
+def _recalcular(calendario):
+    # El bloqueo de la fila de totales serializa los recálculos del mismo calendario
+    TotalesCalendario.objects.get_or_create(calendario=calendario)
+    totales = TotalesCalendario.objects.select_for_update().get(calendario=calendario)
+    clave_anterior = _clave_cache(totales)
+
+    proyectos = Proyecto.objects.filter(calendario_registro=calendario).order_by()
+    por_dictamen = list(proyectos.values('modalidad', 'dictamen').annotate(total=Count('*')))
+
+    for modelo in (ResumenCalendario, CargaEvaluador, ResumenProrroga):
+        modelo.objects.filter(calendario=calendario).delete()
+    cache.delete(clave_anterior)
+
+    # Calendario sin proyectos: desaparece del tablero
+    if not por_dictamen:
+        totales.delete()
+        return
+
+    asignados = {
+        fila['evaluador']: fila
+        for fila in proyectos.values('evaluador').annotate(
+            proyectos=Count('pk'), pendientes=Count('pk', filter=Q(dictamen='PENDIENTE')),
+        )
+    }
+    evaluaciones = dict(
+        Evaluaciones.objects.filter(proyecto__calendario_registro=calendario)
+        .order_by().values('evaluador').annotate(total=Count('*'))
+        .values_list('evaluador', 'total')
+    )
+    prorrogas = list(
+        Prorroga.objects.filter(proyecto__calendario_registro=calendario)
+        .order_by().values('calendario_presentacion').annotate(total=Count('*'))
+    )
+
+    ResumenCalendario.objects.bulk_create([
+        ResumenCalendario(calendario=calendario, **fila) for fila in por_dictamen
+    ])
+    CargaEvaluador.objects.bulk_create([
+        CargaEvaluador(
+            calendario=calendario,
+            evaluador_id=evaluador,
+            proyectos=asignados.get(evaluador, {}).get('proyectos', 0),
+            pendientes=asignados.get(evaluador, {}).get('pendientes', 0),
+            evaluaciones=evaluaciones.get(evaluador, 0),
+        )
+        for evaluador in asignados.keys() | evaluaciones.keys()
+    ])
+    ResumenProrroga.objects.bulk_create([
+        ResumenProrroga(calendario=calendario, **fila) for fila in prorrogas
+    ])
+
+    totales.proyectos = sum(fila['total'] for fila in por_dictamen)
+    totales.pendientes = sum(fila['pendientes'] for fila in asignados.values())
+    totales.evaluaciones = sum(evaluaciones.values())
+    totales.prorrogas = sum(fila['total'] for fila in prorrogas)
+    totales.save()
+
+
+def calendarios_existentes():
+    """Calendarios con proyectos, más los que siguen en el tablero."""
+    registrados = Proyecto.objects.order_by().values_list('calendario_registro', flat=True).distinct()
+    en_tablero = TotalesCalendario.objects.values_list('calendario', flat=True)
+    return set(registrados) | set(en_tablero)
+
+
+# ====================================================================
+# Lectura para el tablero (con caché por calendario)
+# ====================================================================
+
+def _clave_cache(totales):
+    # `actualizado` cambia en cada recálculo: una clave vieja nunca se vuelve a leer
+    return f"reportes:{totales.calendario}:{totales.actualizado.timestamp() if totales.actualizado else 0}"
+
+
+def tablero_calendario(totales):
+    """Datos del tablero para el calendario de `totales` (TotalesCalendario)."""
+    clave = _clave_cache(totales)
+    datos = cache.get(clave)
+    if datos is None:
+        datos = _armar_tablero(totales.calendario)
+        cache.set(clave, datos, CACHE_SEGUNDOS)
+    return datos
+
+
+def _armar_tablero(calendario):
+    filas = list(
+        ResumenCalendario.objects.filter(calendario=calendario)
+        .order_by('modalidad', 'dictamen')
+        .values_list('modalidad', 'dictamen', 'total')
+    )
+    dictamenes = sorted({dictamen for _, dictamen, _ in filas})
+    por_modalidad = {}
+    for modalidad, dictamen, total in filas:
+        por_modalidad.setdefault(modalidad, {})[dictamen] = total
+
+    return {
+        'dictamenes': dictamenes,
+        'modalidades': [
+            {
+                'modalidad': modalidad,
+                'totales': [conteos.get(dictamen, 0) for dictamen in dictamenes],
+                'total': sum(conteos.values()),
+            }
+            for modalidad, conteos in por_modalidad.items()
+        ],
+        'carga': list(
+            CargaEvaluador.objects.filter(calendario=calendario)
+            .order_by('-proyectos', 'evaluador')
+            .values('evaluador', 'evaluador__nombre_completo', 'proyectos', 'pendientes', 'evaluaciones')
+        ),
+        'prorrogas': list(
+            ResumenProrroga.objects.filter(calendario=calendario)
+            .order_by('calendario_presentacion')
+            .values('calendario_presentacion', 'total')
+        ),
+    }
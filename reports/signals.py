@@ -0,0 +1,45 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from evaluation.models import Evaluaciones
+from people.models import Evaluador
+from projects.models import Prorroga, Proyecto
+from .models import CargaEvaluador
+from .resumen import programar_recalculo
+
+# ====================================================================
+# Recálculo incremental de las estadísticas por calendario
+# ====================================================================
+# Solo se recalcula el calendario del registro que cambió, al confirmar la
+# transacción. Los cambios masivos (bulk_create / update) deben llamar a
+# reports.resumen.programar_recalculo por su cuenta.
+
+def _calendario_de(proyecto_id):
+    return Proyecto.objects.filter(pk=proyecto_id).values_list('calendario_registro', flat=True)
+
+
+@receiver(pre_save, sender=Proyecto)
+def proyecto_por_guardar(sender, instance, **kwargs):
+    # Si el proyecto cambia de calendario, también se recalcula el anterior
+    if not instance._state.adding:
+        instance._calendario_anterior = _calendario_de(instance.pk).first()
+
+
+@receiver(post_save, sender=Proyecto)
+@receiver(post_delete, sender=Proyecto)
+def proyecto_modificado(sender, instance, **kwargs):
+    programar_recalculo({instance.calendario_registro, getattr(instance, '_calendario_anterior', None)})
+
+
+@receiver(post_save, sender=Evaluaciones)
+@receiver(post_delete, sender=Evaluaciones)
+@receiver(post_save, sender=Prorroga)
+@receiver(post_delete, sender=Prorroga)
+def historial_modificado(sender, instance, **kwargs):
+    programar_recalculo(_calendario_de(instance.proyecto_id))
+
+
+@receiver(pre_delete, sender=Evaluador)
+def evaluador_por_borrar(sender, instance, **kwargs):
+    # Sus proyectos pasan a "sin evaluador" con un UPDATE que no dispara señales
+    programar_recalculo(CargaEvaluador.objects.filter(evaluador=instance).values_list('calendario', flat=True))
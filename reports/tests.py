@@ -0,0 +1,42 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from evaluation.models import Evaluaciones
+from projects.models import Prorroga, Proyecto
+from . import resumen
+from .models import TotalesCalendario
+
+
+class RecalculoPorTransaccionTests(TestCase):
+    """reports.resumen.programar_recalculo: un recálculo por calendario y commit."""
+
+    def test_varias_senales_recalculan_una_vez(self):
+        with mock.patch.object(resumen, 'recalcular_calendarios', wraps=resumen.recalcular_calendarios) as recalculo:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                proyecto = Proyecto.objects.create(
+                    folio='2026A-1', titulo='UNO', modalidad='PROTOTIPO', calendario_registro='2026A',
+                )
+                Proyecto.objects.create(folio='2026B-1', titulo='DOS', modalidad='PROTOTIPO', calendario_registro='2026B')
+                for resolutivo in ('PENDIENTE', 'APROBADO'):
+                    Evaluaciones.objects.create(proyecto=proyecto, resolutivo=resolutivo, observaciones='OK')
+                Prorroga.objects.create(proyecto=proyecto, justificacion='ATRASO', calendario_presentacion='2026B')
+
+        self.assertEqual(len(callbacks), 1)
+        recalculo.assert_called_once_with({'2026A', '2026B'})
+        totales = TotalesCalendario.objects.get(pk='2026A')
+        self.assertEqual((totales.proyectos, totales.evaluaciones, totales.prorrogas), (1, 2, 1))
+
+    def test_savepoint_revertido_no_pierde_el_recalculo(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    resumen.programar_recalculo(['2026A'])
+                    raise ValueError
+            except ValueError:
+                pass
+            resumen.programar_recalculo(['2026B'])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(callbacks[0].calendarios, {'2026B'})